@@ -10,6 +10,6 @@ bl_info = {
     "category": "Animation",
 }
 
-from .addon import register, unregister
+from .addon import collect_live_statistics, live_statistics, register, unregister
 
-__all__ = ("register", "unregister")
+__all__ = ("collect_live_statistics", "live_statistics", "register", "unregister")
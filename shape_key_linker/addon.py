@@ -2,77 +2,384 @@
 
 from __future__ import annotations
 
-from array import array
+import fnmatch
+import hashlib
 import textwrap
+import time
+import uuid
 
 import bpy
+import numpy as np
 from bpy.app.handlers import persistent
-from bpy.props import BoolProperty, CollectionProperty, IntProperty, PointerProperty, StringProperty
-from bpy.types import Menu, Object, Operator, PropertyGroup
+from bpy.props import (
+    BoolProperty,
+    CollectionProperty,
+    EnumProperty,
+    IntProperty,
+    PointerProperty,
+    StringProperty,
+)
+from bpy.types import Menu, Object, Operator, PropertyGroup, UIList
+
+from .correspondence import (
+    Binding,
+    apply_binding,
+    nearest_binding,
+    surface_binding,
+)
 
 
-_LIVE_DELAY = 0.1
-_LIVE_DIRTY: set[int] = set()
+# Debounce bounds for Live Update; the delay grows with the measured cost of recent passes.
+_LIVE_MIN_DELAY = 0.05
+_LIVE_MAX_DELAY = 0.5
+# Seconds of link updates per timer tick before the rest is resumed on the next tick.
+_LIVE_BUDGET = 0.008
+_LIVE_RESUME_DELAY = 0.01
+# Target object pointer -> indices of its links waiting for a Live Update.
+_LIVE_DIRTY: dict[int, set[int]] = {}
+# Dirty links of targets in Edit Mode; requeued when the target returns to Object Mode.
+_LIVE_DEFERRED: dict[int, set[int]] = {}
 _LIVE_UPDATING = False
+_MSGBUS_OWNER = object()
+# Set while Join & Link adds many links; the source index is rebuilt once afterwards.
+_LINKS_BATCHED = False
+# Sources evaluated per batch when joining; their buffers return to the pool between batches.
+_JOIN_CHUNK = 32
+# Link identity -> smoothed seconds of its last updates; see _link_identity.
+_LINK_COSTS: dict[tuple[str, str], float] = {}
+# Seconds spent by the current burst of resumed ticks, and the smoothed total of past bursts.
+_LIVE_BURST = 0.0
+_LIVE_LOAD = 0.0
+# Source object or mesh pointer -> (target object pointer, link index) of enabled live links.
+# Runtime only; rebuilt from the saved links on register, load, undo, link edits and
+# when objects are added or removed.
+_SOURCE_INDEX: dict[int, set[tuple[int, int]]] = {}
+# Object pointer -> (name, library path) of every object seen by the last source index
+# rebuild; checked on every lookup, and a miss rebuilds the index.
+_OBJECT_REGISTRY: dict[int, tuple[str, str | None]] = {}
+# Vertex count -> free float32 coordinate buffers, reused by later update passes.
+_BUFFER_POOL: dict[int, list[np.ndarray]] = {}
+_BUFFER_POOL_LIMIT = 256 * 1024 * 1024
+# Link vertex_map -> vertex binding; read from the target's mesh attributes on demand.
+_BINDINGS: dict[str, Binding] = {}
+# (target object pointer, link index) -> (status, detail) of its last update; drawn by SKL_UL_links.
+_LINK_STATUS: dict[tuple[int, int], tuple[str, str]] = {}
+_STATUS_ICONS = {
+    'READY': 'CHECKMARK',
+    'UPDATED': 'CHECKMARK',
+    'MISSING_SOURCE': 'ERROR',
+    'MISSING_SHAPE_KEY': 'ERROR',
+    'VERTEX_COUNT_MISMATCH': 'ERROR',
+    'EVALUATED_TOPOLOGY_MISMATCH': 'MODIFIER',
+    'UPDATE_ERROR': 'CANCEL',
+}
+# Shape key datablock pointer -> (key count, name -> index) when it was indexed; see _key_position.
+_KEY_INDEX: dict[int, tuple[int, dict[str, int]]] = {}
+# Live Update counters and per-link timings; None while collection is off so nothing is measured.
+_STATISTICS: dict | None = None
+# Slowest links listed in the panel's Statistics section.
+_STATISTICS_ROWS = 5
+# Shape key writes performed and skipped because the key already held the source shape.
+_WRITE_COUNTS = {"written": 0, "skipped": 0}
+# Link identity -> coordinates it last wrote, oldest first; Live Update skips writes that match.
+_WRITTEN: dict[tuple[str, str], np.ndarray] = {}
+_WRITTEN_LIMIT = 256 * 1024 * 1024
+_WRITTEN_BYTES = 0
+
+
+def _lookup_registered(pointer):
+    # Objects are resolved by name, never through a kept wrapper: a wrapper of an object
+    # deleted with the Delete operator stays valid-looking and points to freed memory.
+    key = _OBJECT_REGISTRY.get(pointer)
+    obj = bpy.data.objects.get(key) if key is not None else None
+    if obj is not None and obj.as_pointer() == pointer:
+        return obj
+    return None
 
 
 def _object_from_pointer(pointer):
-    for obj in bpy.data.objects:
-        if obj.as_pointer() == pointer:
-            return obj
-    return None
+    obj = _lookup_registered(pointer)
+    if obj is None:
+        # Renames, undo and new objects all show up as misses.
+        _rebuild_source_index()
+        obj = _lookup_registered(pointer)
+    return obj
+
+
+def _link_identity(target, link):
+    """Key runtime per-link data by names, which survive index shifts, undo and reload."""
+    source = link.source
+    return (target.name, source.name if source is not None else link.source_name)
+
+
+def _forget_written():
+    global _WRITTEN_BYTES
+    _WRITTEN.clear()
+    _WRITTEN_BYTES = 0
+
+
+def _prune_link_data(identities):
+    """Drop measured costs and kept coordinates of links that no longer exist."""
+    global _WRITTEN_BYTES
+    for identity in [identity for identity in _LINK_COSTS if identity not in identities]:
+        del _LINK_COSTS[identity]
+    for identity in [identity for identity in _WRITTEN if identity not in identities]:
+        _WRITTEN_BYTES -= _WRITTEN.pop(identity).nbytes
+
+
+def _rebuild_source_index():
+    """Index enabled live links by source and refill the object registry."""
+    _SOURCE_INDEX.clear()
+    _OBJECT_REGISTRY.clear()
+    identities = set()
+    for target in bpy.data.objects:
+        library = target.library
+        _OBJECT_REGISTRY[target.as_pointer()] = (target.name, library.filepath if library else None)
+        if target.type != 'MESH':
+            continue
+        links = target.shape_key_linker_links
+        identities.update(_link_identity(target, link) for link in links)
+        if not getattr(target, "shape_key_linker_live", False):
+            continue
+        target_pointer = target.as_pointer()
+        for index, link in enumerate(links):
+            source = link.source
+            if not link.enabled or source is None or source.type != 'MESH':
+                continue
+            entry = (target_pointer, index)
+            _SOURCE_INDEX.setdefault(source.as_pointer(), set()).add(entry)
+            _SOURCE_INDEX.setdefault(source.data.as_pointer(), set()).add(entry)
+    # Costs are keyed by identity, so they survive index shifts, undo and reload.
+    _prune_link_data(identities)
+
+
+def _objects_changed(depsgraph):
+    """Whether objects were added or removed since the source index was built.
+
+    Duplicated and appended targets carry their links and Live Update flag
+    with them, and deleted targets must leave the index.
+    """
+    if len(bpy.data.objects) != len(_OBJECT_REGISTRY):
+        return True
+    for update in depsgraph.updates:
+        datablock = update.id
+        if isinstance(datablock, bpy.types.Object) and datablock.original.as_pointer() not in _OBJECT_REGISTRY:
+            return True
+    return False
+
+
+def _links_changed(_self=None, _context=None):
+    """Update callback for link edits; also called by operators that add or remove links."""
+    if _LINKS_BATCHED:
+        return
+    _rebuild_source_index()
+
+
+def _parse_vertex_map(text):
+    """Return (source count, target count, attribute prefix) of a link's vertex_map, or None."""
+    try:
+        source_count, target_count, prefix = text.split(":", 2)
+        source_count, target_count = int(source_count), int(target_count)
+    except ValueError:
+        return None
+    if not prefix.startswith(".skl_map_"):
+        return None
+    return source_count, target_count, prefix
+
+
+def _drop_binding(target, link):
+    """Remove a link's saved vertex binding from the target mesh and the runtime cache."""
+    if not link.vertex_map:
+        return
+    _BINDINGS.pop(link.vertex_map, None)
+    parsed = _parse_vertex_map(link.vertex_map)
+    link.vertex_map = ""
+    if parsed is None:
+        return
+    attributes = target.data.attributes
+    for name in [attribute.name for attribute in attributes if attribute.name.startswith(parsed[2])]:
+        attributes.remove(attributes[name])
+
+
+def _mapping_changed(link, _context):
+    """Drop a link's vertex binding so the next update builds it again."""
+    _drop_binding(link.id_data, link)
+    # Without this Refresh Stale would still consider the old result current.
+    link.source_fingerprint = ""
+
+
+def _source_changed(link, context):
+    _mapping_changed(link, context)
+    _links_changed()
+
+
+def _resume_deferred(*_args):
+    """Requeue deferred targets that left Edit Mode; called by msgbus and the depsgraph handler."""
+    for pointer in tuple(_LIVE_DEFERRED):
+        target = _object_from_pointer(pointer)
+        if target is None:
+            del _LIVE_DEFERRED[pointer]
+        elif target.mode == 'OBJECT':
+            _queue_live_links(pointer, _LIVE_DEFERRED.pop(pointer))
+
+
+def _subscribe_mode_changes():
+    # Subscriptions are dropped when a file is loaded, so this runs again from load_post.
+    bpy.msgbus.clear_by_owner(_MSGBUS_OWNER)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.Object, "mode"),
+        owner=_MSGBUS_OWNER,
+        args=(),
+        notify=_resume_deferred,
+    )
+
+
+@persistent
+def _rebuild_after_file_change(*_args):
+    _LIVE_DIRTY.clear()
+    _LIVE_DEFERRED.clear()
+    _BINDINGS.clear()
+    _LINK_STATUS.clear()
+    _KEY_INDEX.clear()
+    # Undo and load can restore older key contents than the ones remembered here.
+    _forget_written()
+    _subscribe_mode_changes()
+    _rebuild_source_index()
+
+
+_FILE_CHANGE_HANDLERS = (
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+)
+
+
+def _live_delay():
+    """Debounce long enough that updating never takes more than about a quarter of the time."""
+    return min(_LIVE_MAX_DELAY, max(_LIVE_MIN_DELAY, _LIVE_LOAD * 4.0))
+
+
+def _queue_live_links(target_pointer, indices):
+    _LIVE_DIRTY.setdefault(target_pointer, set()).update(indices)
+    if not bpy.app.timers.is_registered(_run_live_updates):
+        bpy.app.timers.register(_run_live_updates, first_interval=_live_delay())
 
 
 def _queue_live_target(target):
     if target is None or target.type != 'MESH':
         return
-    _LIVE_DIRTY.add(target.as_pointer())
-    if not bpy.app.timers.is_registered(_run_live_updates):
-        bpy.app.timers.register(_run_live_updates, first_interval=_LIVE_DELAY)
+    indices = [index for index, link in enumerate(target.shape_key_linker_links) if link.enabled]
+    if indices:
+        _queue_live_links(target.as_pointer(), indices)
 
 
 def _live_toggle_changed(target, _context):
+    _rebuild_source_index()
     if target.shape_key_linker_live:
         _queue_live_target(target)
     else:
-        _LIVE_DIRTY.discard(target.as_pointer())
+        _LIVE_DIRTY.pop(target.as_pointer(), None)
+        _LIVE_DEFERRED.pop(target.as_pointer(), None)
+
+
+def _live_order(pending):
+    """Return pending (target, pointer, indices) with the active target first, then visible ones."""
+    active = bpy.context.view_layer.objects.active
+    ordered = []
+    for pointer, indices in pending:
+        target = _object_from_pointer(pointer)
+        if target is None or not getattr(target, "shape_key_linker_live", False):
+            continue
+        rank = 0 if target == active else 1 if target.visible_get() else 2
+        ordered.append((rank, pointer, target, indices))
+    ordered.sort(key=lambda item: item[:2])
+    return [(target, pointer, indices) for _rank, pointer, target, indices in ordered]
 
 
 def _run_live_updates():
-    global _LIVE_UPDATING
+    """Update dirty links within the per-tick time budget; the rest resumes on the next tick."""
+    global _LIVE_UPDATING, _LIVE_BURST, _LIVE_LOAD
     if _LIVE_UPDATING:
-        return _LIVE_DELAY
+        return _live_delay()
+    if _STATISTICS is not None:
+        _STATISTICS["timer_ticks"] += 1
 
-    pending = tuple(_LIVE_DIRTY)
+    pending = tuple(_LIVE_DIRTY.items())
     _LIVE_DIRTY.clear()
-    retry = False
+    resume = False
+    spent = 0.0
+    # Source pointer -> coordinates, shared by the links of this pass and released after the last one.
+    cache = {}
     _LIVE_UPDATING = True
     try:
         depsgraph = bpy.context.evaluated_depsgraph_get()
-        for pointer in pending:
-            target = _object_from_pointer(pointer)
-            if target is None or not getattr(target, "shape_key_linker_live", False):
-                continue
+        order = _live_order(pending)
+        for target, _pointer, indices in order:
+            _expect_sources(cache, target, indices)
+        for target, pointer, indices in order:
             if target.mode != 'OBJECT':
-                _LIVE_DIRTY.add(pointer)
-                retry = True
+                # No polling: a mode change or the next depsgraph update resumes these links.
+                _LIVE_DEFERRED.setdefault(pointer, set()).update(indices)
+                continue
+            links = target.shape_key_linker_links
+            batch = []
+            planned = spent
+            for index in sorted(indices):
+                # Indices can be stale after a link was removed; skip what no longer exists.
+                if index >= len(links) or not links[index].enabled:
+                    continue
+                # At least one link runs per tick; further links must fit the remaining budget.
+                # A link never measured counts as the whole budget, so it runs alone.
+                estimate = _LINK_COSTS.get(_link_identity(target, links[index]), _LIVE_BUDGET)
+                if resume or (planned and planned + estimate > _LIVE_BUDGET):
+                    _LIVE_DIRTY.setdefault(pointer, set()).add(index)
+                    resume = True
+                    continue
+                batch.append(index)
+                planned += estimate or 1e-9
+            if not batch:
                 continue
-            for link in target.shape_key_linker_links:
-                if link.enabled:
-                    _update_link(target, link, depsgraph, create_missing=True)
+            started = time.perf_counter()
+            # Live Update is triggered by source changes that can leave the shape alone.
+            _update_links(target, batch, depsgraph, cache=cache, skip_unchanged=True)
+            cost = time.perf_counter() - started
+            spent += cost
+            # The batch shares one mesh update, so its time is split evenly between its links.
+            for index in batch:
+                identity = _link_identity(target, links[index])
+                previous = _LINK_COSTS.get(identity, cost / len(batch))
+                _LINK_COSTS[identity] = previous * 0.5 + cost / len(batch) * 0.5
     finally:
+        _release_pass(cache)
         _LIVE_UPDATING = False
 
-    return _LIVE_DELAY if retry or _LIVE_DIRTY else None
+    _LIVE_BURST += spent
+    if resume:
+        return _LIVE_RESUME_DELAY
+    _LIVE_LOAD = _LIVE_LOAD * 0.5 + _LIVE_BURST * 0.5
+    _LIVE_BURST = 0.0
+    return _live_delay() if _LIVE_DIRTY else None
 
 
 @persistent
 def _live_depsgraph_update(_scene, depsgraph):
-    if _LIVE_UPDATING:
+    if _STATISTICS is not None:
+        _STATISTICS["depsgraph_updates"] += 1
+    if not _LIVE_UPDATING and depsgraph.id_type_updated('OBJECT') and _objects_changed(depsgraph):
+        _rebuild_source_index()
+    if _LIVE_UPDATING or not _SOURCE_INDEX:
+        if _STATISTICS is not None:
+            _STATISTICS["depsgraph_updates_ignored"] += 1
         return
+    if _LIVE_DEFERRED:
+        # Fallback for mode changes that msgbus does not report, such as scripted ones.
+        _resume_deferred()
 
     changed = set()
     for update in depsgraph.updates:
+        # Relation rebuilds, such as adding an object, list every object without either flag.
+        if not (update.is_updated_geometry or update.is_updated_transform):
+            continue
         datablock = update.id
         if isinstance(datablock, (bpy.types.Object, bpy.types.Mesh)):
             changed.add(datablock.as_pointer())
@@ -84,22 +391,16 @@ def _live_depsgraph_update(_scene, depsgraph):
                 original_data = getattr(datablock.data, "original", None)
                 if original_data is not None:
                     changed.add(original_data.as_pointer())
-    if not changed:
-        return
 
-    for target in bpy.data.objects:
-        if target.type != 'MESH' or not getattr(target, "shape_key_linker_live", False):
-            continue
-        for link in target.shape_key_linker_links:
-            source = link.source
-            if (
-                link.enabled
-                and source is not None
-                and source.type == 'MESH'
-                and (source.as_pointer() in changed or source.data.as_pointer() in changed)
-            ):
-                _queue_live_target(target)
-                break
+    # Only the changed datablocks are looked up; unrelated objects cost nothing.
+    dirty: dict[int, set[int]] = {}
+    for pointer in changed:
+        for target_pointer, index in _SOURCE_INDEX.get(pointer, ()):
+            dirty.setdefault(target_pointer, set()).add(index)
+    if not dirty and _STATISTICS is not None:
+        _STATISTICS["depsgraph_updates_ignored"] += 1
+    for target_pointer, indices in dirty.items():
+        _queue_live_links(target_pointer, indices)
 
 
 def _active_mesh(context):
@@ -132,17 +433,52 @@ def _wrapped_labels(layout, context, text, *, icon='NONE'):
         layout.label(text=line, icon=icon if index == 0 else 'NONE')
 
 
+def _index_keys(key_blocks):
+    entry = (len(key_blocks), {name: index for index, name in enumerate(key_blocks.keys())})
+    _KEY_INDEX[key_blocks.id_data.as_pointer()] = entry
+    return entry
+
+
+def _index_appended_key(key_blocks, key):
+    """Add a key just appended by shape_key_add to an up-to-date index instead of rebuilding it."""
+    pointer = key_blocks.id_data.as_pointer()
+    entry = _KEY_INDEX.get(pointer)
+    if entry is not None and entry[0] == len(key_blocks) - 1:
+        entry[1][key.name] = len(key_blocks) - 1
+        _KEY_INDEX[pointer] = (len(key_blocks), entry[1])
+
+
+def _key_position(key_blocks, name):
+    """Return the index of the key called name, or -1, without scanning the keys in Python.
+
+    The name map is rebuilt when the key count changed, and when a lookup
+    lands on a key with another name or finds a key the map does not know,
+    which is how renames show up. A name that is truly missing is confirmed by
+    Blender's own search, so looking up keys before adding them stays cheap.
+    """
+    entry = _KEY_INDEX.get(key_blocks.id_data.as_pointer())
+    if entry is None or entry[0] != len(key_blocks):
+        entry = _index_keys(key_blocks)
+    position = entry[1].get(name, -1)
+    if position >= 0 and key_blocks[position].name == name:
+        return position
+    position = key_blocks.find(name)
+    if position >= 0:
+        _index_keys(key_blocks)
+    return position
+
+
 def _find_key(target, link, *, update_metadata=True):
     key_blocks = _shape_keys(target)
     if not key_blocks:
         return None
 
-    key = key_blocks.get(link.shape_key_name)
-    if key is not None:
+    position = _key_position(key_blocks, link.shape_key_name) if link.shape_key_name else -1
+    if position >= 0:
         if update_metadata:
-            link.shape_key_index = key_blocks.find(key.name)
+            link.shape_key_index = position
             link.target_key_count = len(key_blocks)
-        return key
+        return key_blocks[position]
 
     # A stable index is only trusted when the number of keys has not changed.
     # This lets us follow a simple rename without ever overwriting a neighboring
@@ -167,24 +503,216 @@ def _new_linked_key(target, source, link):
     _ensure_basis(target)
     requested_name = link.shape_key_name or source.name
     key = target.shape_key_add(name=requested_name, from_mix=False)
+    key_blocks = target.data.shape_keys.key_blocks
+    key_count = len(key_blocks)
+    _index_appended_key(key_blocks, key)
+    # New keys are appended, so no name lookup is needed.
     link.shape_key_name = key.name
-    link.shape_key_index = target.data.shape_keys.key_blocks.find(key.name)
-    link.target_key_count = len(target.data.shape_keys.key_blocks)
+    link.shape_key_index = key_count - 1
+    link.target_key_count = key_count
     return key
 
 
+def _take_buffer(vertex_count):
+    buffers = _BUFFER_POOL.get(vertex_count)
+    if buffers:
+        return buffers.pop()
+    return np.empty(vertex_count * 3, dtype=np.float32)
+
+
+def _give_buffer(coordinates, vertex_count):
+    pooled = sum(buffer.nbytes for buffers in _BUFFER_POOL.values() for buffer in buffers)
+    if pooled + coordinates.nbytes <= _BUFFER_POOL_LIMIT:
+        _BUFFER_POOL.setdefault(vertex_count, []).append(coordinates)
+
+
+def _expect_sources(cache, target, indices):
+    """Count the links of a pass that read each source, so a source is released after its last one.
+
+    Pass caches map a source pointer to [coordinates or None, vertex count, remaining uses].
+    """
+    links = target.shape_key_linker_links
+    for index in indices:
+        source = links[index].source if index < len(links) else None
+        if source is not None:
+            cache.setdefault(source.as_pointer(), [None, 0, 0])[2] += 1
+
+
+def _release_source(cache, pointer, *, used=True):
+    """Return a source's buffer to the pool; with ``used`` only once no expected link needs it."""
+    entry = cache.get(pointer)
+    if entry is None:
+        return
+    if used:
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+    if entry[0] is not None:
+        _give_buffer(entry[0], entry[1])
+        entry[0] = None
+    if entry[2] <= 0:
+        del cache[pointer]
+
+
+def _release_pass(cache):
+    """Return the coordinate buffers of a finished pass to the pool, up to its memory cap."""
+    for coordinates, vertex_count, _uses in cache.values():
+        if coordinates is not None:
+            _give_buffer(coordinates, vertex_count)
+    cache.clear()
+
+
 def _evaluated_coordinates(source, depsgraph):
     evaluated = source.evaluated_get(depsgraph)
     mesh = evaluated.to_mesh(preserve_all_data_layers=False, depsgraph=depsgraph)
     try:
-        coordinates = array('f', [0.0]) * (len(mesh.vertices) * 3)
+        coordinates = _take_buffer(len(mesh.vertices))
         mesh.vertices.foreach_get("co", coordinates)
         return coordinates, len(mesh.vertices)
     finally:
         evaluated.to_mesh_clear()
 
 
-def _copy_coordinates_to_key(target, key, coordinates, source_count):
+def _source_coordinates(source, depsgraph):
+    """Return the source shape, skipping evaluation when it cannot differ from the mesh data."""
+    mesh = source.data
+    if source.mode == 'OBJECT' and not source.modifiers and mesh.shape_keys is None:
+        coordinates = _take_buffer(len(mesh.vertices))
+        mesh.vertices.foreach_get("co", coordinates)
+        return coordinates, len(mesh.vertices)
+    return _evaluated_coordinates(source, depsgraph)
+
+
+def _pass_coordinates(cache, source, depsgraph):
+    """Return the source shape once per update pass; links sharing a source share the buffer."""
+    entry = cache.setdefault(source.as_pointer(), [None, 0, 0])
+    if entry[0] is None:
+        entry[0], entry[1] = _source_coordinates(source, depsgraph)
+    return entry[0], entry[1]
+
+
+def _rest_coordinates(mesh):
+    coordinates = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coordinates)
+    return coordinates
+
+
+def _build_binding(target, link):
+    target_rest = _rest_coordinates(target.data)
+    source_mesh = link.source.data
+    if link.vertex_mapping == 'SURFACE':
+        source_mesh.calc_loop_triangles()
+        triangles = np.empty(len(source_mesh.loop_triangles) * 3, dtype=np.int32)
+        source_mesh.loop_triangles.foreach_get("vertices", triangles)
+        return surface_binding(target_rest, _rest_coordinates(source_mesh), triangles)
+    return nearest_binding(target_rest, _rest_coordinates(source_mesh))
+
+
+def _save_binding(target, link, binding):
+    """Store a binding as hidden point attributes of the target mesh.
+
+    Attribute names share a prefix unique to this binding; ``link.vertex_map``
+    records "source count:target count:prefix".
+    """
+    _drop_binding(target, link)
+    attributes = target.data.attributes
+    prefix = f".skl_map_{uuid.uuid4().hex[:12]}_"
+    columns = binding.indices.reshape(binding.target_count, -1)
+    for corner in range(columns.shape[1]):
+        attribute = attributes.new(f"{prefix}index{corner}", 'INT', 'POINT')
+        attribute.data.foreach_set("value", np.ascontiguousarray(columns[:, corner]))
+    for name, values in (("weight", binding.weights), ("offset", binding.offsets)):
+        if values is not None:
+            attribute = attributes.new(prefix + name, 'FLOAT_VECTOR', 'POINT')
+            attribute.data.foreach_set("vector", values.ravel())
+    link.vertex_map = f"{binding.source_count}:{binding.target_count}:{prefix}"
+
+
+def _load_binding(target, link):
+    """Read the binding saved by _save_binding; returns None when it is missing or invalid."""
+    parsed = _parse_vertex_map(link.vertex_map)
+    if parsed is None:
+        return None
+    source_count, target_count, prefix = parsed
+    attributes = target.data.attributes
+    if target_count != len(target.data.vertices):
+        return None
+    columns = []
+    while (attribute := attributes.get(f"{prefix}index{len(columns)}")) is not None:
+        column = np.empty(target_count, dtype=np.int32)
+        attribute.data.foreach_get("value", column)
+        columns.append(column)
+    if len(columns) not in {1, 3}:
+        return None
+    indices = columns[0] if len(columns) == 1 else np.stack(columns, axis=1)
+    if target_count and (indices.min() < 0 or indices.max() >= source_count):
+        return None
+    vectors = []
+    for name in ("weight", "offset"):
+        attribute = attributes.get(prefix + name)
+        if attribute is None:
+            vectors.append(None)
+            continue
+        values = np.empty((target_count, 3), dtype=np.float32)
+        attribute.data.foreach_get("vector", values.ravel())
+        vectors.append(values)
+    return Binding(source_count, indices, *vectors)
+
+
+def _link_binding(target, link):
+    """Return the link's vertex binding, building it from rest positions when missing or outdated.
+
+    The binding is saved in the target mesh as attributes, so it keeps matching
+    the rest positions it was built from; later reads need no decoding.
+
+    Raises ValueError when the source cannot be bound, such as a surface binding without faces.
+    """
+    binding = _BINDINGS.get(link.vertex_map)
+    if binding is None and link.vertex_map:
+        binding = _load_binding(target, link)
+    if (
+        binding is None
+        or binding.source_count != len(link.source.data.vertices)
+        or binding.target_count != len(target.data.vertices)
+        or (binding.weights is not None) != (link.vertex_mapping == 'SURFACE')
+    ):
+        binding = _build_binding(target, link)
+        _save_binding(target, link, binding)
+    _BINDINGS[link.vertex_map] = binding
+    return binding
+
+
+def _fingerprint(coordinates, vertex_count):
+    """Return a compact digest of source coordinates, stored on the link after each update.
+
+    The whole buffer is hashed: a sample would miss edits such as swapped or
+    mirrored vertices, and Refresh Stale would then skip a stale link.
+    """
+    digest = hashlib.blake2b(memoryview(coordinates).cast('B'), digest_size=16).hexdigest()
+    return f"{vertex_count}:{digest}"
+
+
+def _remember_written(identity, coordinates):
+    """Keep a copy of what a link wrote, evicting the oldest copies past _WRITTEN_LIMIT."""
+    global _WRITTEN_BYTES
+    kept = _WRITTEN.pop(identity, None)
+    if kept is not None and kept.shape == coordinates.shape:
+        np.copyto(kept, coordinates)
+    else:
+        if kept is not None:
+            _WRITTEN_BYTES -= kept.nbytes
+        kept = coordinates.copy()
+        _WRITTEN_BYTES += kept.nbytes
+    _WRITTEN[identity] = kept
+    while _WRITTEN_BYTES > _WRITTEN_LIMIT:
+        _WRITTEN_BYTES -= _WRITTEN.pop(next(iter(_WRITTEN))).nbytes
+
+
+def _copy_coordinates_to_key(target, key, coordinates, source_count, *, previous=None):
+    """Write coordinates to the key unless they equal ``previous``, what this link wrote last.
+
+    Returns whether the key was written. The caller issues one mesh update per target.
+    """
     target_count = len(target.data.vertices)
     key_count = len(key.data)
 
@@ -194,53 +722,287 @@ def _copy_coordinates_to_key(target, key, coordinates, source_count):
             f"shape key {key_count}"
         )
 
+    if previous is not None and np.array_equal(previous, coordinates):
+        _WRITE_COUNTS["skipped"] += 1
+        return False
     key.data.foreach_set("co", coordinates)
-    target.data.update()
-    return source_count
-
-
-def _link_for_source(target, source):
-    for link in target.shape_key_linker_links:
-        if link.source == source:
-            return link
-    return None
+    _WRITE_COUNTS["written"] += 1
+    return True
 
 
-def _update_link(target, link, depsgraph, create_missing=True):
+def _check_source(target, link):
     source = link.source
     if source is None:
-        return False, f"source '{link.source_name or 'Unknown'}' is missing"
+        return f"source '{link.source_name or 'Unknown'}' is missing"
     if source.type != 'MESH':
-        return False, f"source '{source.name}' is not a mesh"
+        return f"source '{source.name}' is not a mesh"
     if source == target:
-        return False, "source and target cannot be the same object"
+        return "source and target cannot be the same object"
+    return None
 
-    try:
-        coordinates, source_count = _evaluated_coordinates(source, depsgraph)
-    except RuntimeError as exc:
-        return False, f"could not evaluate source mesh: {exc}"
 
-    target_count = len(target.data.vertices)
-    if source_count != target_count:
-        return False, f"vertex count mismatch: source {source_count}, target {target_count}"
+def _plan_link(target, link, create_missing):
+    """Validate one link and resolve its key without evaluating the source.
+
+    Returns (problem, key, binding). The key is None when it is missing and will
+    be created once the evaluated source passed its checks. A problem is a
+    (status, message) pair using the codes of _STATUS_ICONS.
+    """
+    problem = _check_source(target, link)
+    if problem is not None:
+        status = 'MISSING_SOURCE' if link.source is None else 'UPDATE_ERROR'
+        return (status, problem), None, None
+
+    binding = None
+    if link.vertex_mapping != 'INDEX':
+        try:
+            binding = _link_binding(target, link)
+        except ValueError as exc:
+            return ('UPDATE_ERROR', str(exc)), None, None
+    elif (
+        link.source.mode == 'OBJECT'
+        and not link.source.modifiers
+        and len(link.source.data.vertices) != len(target.data.vertices)
+    ):
+        # Without modifiers the evaluated source has the mesh's own vertex count.
+        problem = f"vertex count mismatch: source {len(link.source.data.vertices)}, target {len(target.data.vertices)}"
+        return ('VERTEX_COUNT_MISMATCH', problem), None, None
 
     key = _find_key(target, link)
-    if key is None:
-        if not create_missing:
-            return False, f"shape key '{link.shape_key_name}' is missing"
-        key = _new_linked_key(target, source, link)
+    if key is None and not create_missing:
+        return ('MISSING_SHAPE_KEY', f"shape key '{link.shape_key_name}' is missing"), None, None
+    return None, key, binding
 
-    try:
-        count = _copy_coordinates_to_key(target, key, coordinates, source_count)
-    except ValueError as exc:
-        return False, str(exc)
 
-    link.source_name = source.name
+def _check_evaluated(target, link, binding, source_count):
+    """Return a problem when the evaluated source no longer fits the target or the map, else None."""
+    expected = binding.source_count if binding is not None else len(target.data.vertices)
+    if source_count == expected:
+        return None
+    # A modifier that adds or removes vertices is reported apart from a plain topology mismatch.
+    status = 'VERTEX_COUNT_MISMATCH'
+    if source_count != len(link.source.data.vertices):
+        status = 'EVALUATED_TOPOLOGY_MISMATCH'
+    if binding is not None:
+        return status, f"vertex count mismatch: source {source_count}, map built for {expected}"
+    return status, f"vertex count mismatch: source {source_count}, target {expected}"
+
+
+def _write_link(target, link, key, evaluated, binding, *, skip_unchanged=False):
+    """Copy one planned link into its key; returns whether the key was written.
+
+    With ``skip_unchanged`` the write is skipped when it would repeat the
+    coordinates this link wrote last. Explicit updates always write, so they
+    also restore a key that was edited by hand.
+    """
+    coordinates, count = evaluated
+    identity = _link_identity(target, link)
+    # A fresh key or a new mapping clears the fingerprint; then the key must be written.
+    previous = _WRITTEN.get(identity) if skip_unchanged and link.source_fingerprint else None
+    if binding is None:
+        written = _copy_coordinates_to_key(target, key, coordinates, count, previous=previous)
+        if written:
+            _remember_written(identity, coordinates)
+    else:
+        # One gather or sparse product per update; the binding was built once from rest positions.
+        mapped = _take_buffer(binding.target_count)
+        scratch = _take_buffer(binding.target_count) if binding.weights is not None else None
+        try:
+            apply_binding(binding, coordinates, mapped, scratch)
+            written = _copy_coordinates_to_key(target, key, mapped, binding.target_count, previous=previous)
+            if written:
+                _remember_written(identity, mapped)
+        finally:
+            _give_buffer(mapped, binding.target_count)
+            if scratch is not None:
+                _give_buffer(scratch, binding.target_count)
+    link.source_name = link.source.name
     link.source_vertex_count = count
+    # A skipped write means the source is unchanged, and so is its fingerprint.
+    if written or not link.source_fingerprint:
+        link.source_fingerprint = _fingerprint(coordinates, count)
+    key_blocks = target.data.shape_keys.key_blocks
     link.shape_key_name = key.name
-    link.shape_key_index = target.data.shape_keys.key_blocks.find(key.name)
-    link.target_key_count = len(target.data.shape_keys.key_blocks)
-    return True, key.name
+    link.shape_key_index = _key_position(key_blocks, key.name)
+    link.target_key_count = len(key_blocks)
+    return written
+
+
+def _update_links(
+    target,
+    indices,
+    depsgraph,
+    create_missing=True,
+    *,
+    cache=None,
+    skip_unchanged=False,
+    only_stale=False,
+):
+    """Update links of one target with a single mesh update; returns (ok, detail) per link.
+
+    Every link is validated and its key resolved before any source is evaluated.
+    Then each link is evaluated and written in turn, and a source buffer returns
+    to the pool after the last link that reads it, so memory does not grow with
+    the number of links. With ``only_stale`` a link whose source fingerprint is
+    unchanged and whose key exists is left alone and reported as 'READY'. The
+    outcome of each link is kept in _LINK_STATUS for the panel.
+    """
+    own_cache = cache is None
+    if own_cache:
+        cache = {}
+        _expect_sources(cache, target, indices)
+    target_pointer = target.as_pointer()
+    links = target.shape_key_linker_links
+    # Link index -> [evaluate, copy] seconds, only while statistics are collected.
+    timings = {} if _STATISTICS is not None else None
+    plans = [_plan_link(target, links[index], create_missing) for index in indices]
+
+    results = []
+    written = False
+    try:
+        for index, (problem, key, binding) in zip(indices, plans):
+            link = links[index]
+            status = 'UPDATED'
+            if problem is None:
+                source = link.source
+                started = time.perf_counter() if timings is not None else 0.0
+                try:
+                    evaluated = _pass_coordinates(cache, source, depsgraph)
+                except RuntimeError as exc:
+                    problem = ('UPDATE_ERROR', f"could not evaluate source mesh: {exc}")
+                else:
+                    problem = _check_evaluated(target, link, binding, evaluated[1])
+                if timings is not None:
+                    timings[index] = [time.perf_counter() - started, 0.0]
+                if problem is None and only_stale and key is not None and link.source_fingerprint == _fingerprint(*evaluated):
+                    status = 'READY'
+                elif problem is None:
+                    started = time.perf_counter() if timings is not None else 0.0
+                    if key is None:
+                        key = _new_linked_key(target, source, link)
+                        # A fresh key holds the basis shape, so it is always written.
+                        link.source_fingerprint = ""
+                    try:
+                        written |= _write_link(target, link, key, evaluated, binding, skip_unchanged=skip_unchanged)
+                    except ValueError as exc:
+                        problem = ('UPDATE_ERROR', str(exc))
+                    if timings is not None:
+                        timings[index][1] = time.perf_counter() - started
+            if link.source is not None:
+                _release_source(cache, link.source.as_pointer())
+            if problem is not None:
+                _LINK_STATUS[(target_pointer, index)] = problem
+                if _STATISTICS is not None:
+                    _STATISTICS["last_failure"] = f"{target.name}[{index}]: {problem[1]}"
+                results.append((False, problem[1]))
+                continue
+            _LINK_STATUS[(target_pointer, index)] = (status, key.name)
+            results.append((True, key.name))
+    finally:
+        if own_cache:
+            _release_pass(cache)
+
+    update_time = 0.0
+    if written:
+        started = time.perf_counter() if timings is not None else 0.0
+        # One update for the whole batch; skipped batches trigger no depsgraph evaluation.
+        target.data.update()
+        if timings is not None:
+            update_time = time.perf_counter() - started
+        # The target may itself be a source later in this pass; its shape just changed.
+        _release_source(cache, target_pointer, used=False)
+    if timings is not None and _STATISTICS is not None:
+        _record_timings(target, timings, update_time)
+    return results
+
+
+def _record_timings(target, timings, update_time):
+    """Store the last evaluate/copy/update seconds of each link in _STATISTICS."""
+    links = target.shape_key_linker_links
+    # The batch shares one mesh update, so its time is split evenly between its links.
+    update_share = update_time / len(timings) if timings else 0.0
+    for index, (evaluate, copy) in timings.items():
+        link = links[index]
+        entry = _STATISTICS["links"].setdefault(f"{target.name}[{index}]", {"calls": 0, "slowest": 0.0})
+        total = evaluate + copy + update_share
+        entry.update(
+            source=link.source_name,
+            shape_key=link.shape_key_name,
+            evaluate=evaluate,
+            copy=copy,
+            update=update_share,
+            total=total,
+            calls=entry["calls"] + 1,
+            slowest=max(entry["slowest"], total),
+        )
+
+
+def collect_live_statistics(enabled=True):
+    """Start collecting Live Update statistics from zero, or stop and discard them."""
+    global _STATISTICS
+    if enabled:
+        _WRITE_COUNTS.update(written=0, skipped=0)
+    _STATISTICS = {
+        "depsgraph_updates": 0,
+        "depsgraph_updates_ignored": 0,
+        "timer_ticks": 0,
+        "last_failure": "",
+        "links": {},
+    } if enabled else None
+
+
+def live_statistics():
+    """Return a copy of the collected statistics as a dict.
+
+    ``links`` maps "Target[index]" to the last evaluate, copy and update
+    seconds of that link. ``written`` and ``skipped`` count shape key writes
+    and unchanged writes that were skipped; they are the only values kept
+    while collection is off.
+    """
+    if _STATISTICS is None:
+        return {"enabled": False, **_WRITE_COUNTS}
+    statistics = dict(_STATISTICS, enabled=True, **_WRITE_COUNTS)
+    statistics["links"] = {name: dict(entry) for name, entry in _STATISTICS["links"].items()}
+    return statistics
+
+
+def _forget_link(target_pointer, index):
+    """Drop the cached status of a removed link and shift the statuses after it."""
+    moved = {}
+    for (pointer, other), status in tuple(_LINK_STATUS.items()):
+        if pointer != target_pointer or other < index:
+            continue
+        del _LINK_STATUS[(pointer, other)]
+        if other > index:
+            moved[(pointer, other - 1)] = status
+    _LINK_STATUS.update(moved)
+
+
+_VERTEX_MAPPINGS = (
+    (
+        'INDEX',
+        "Vertex Order",
+        "Match vertices by index; source and target must have the same vertex order",
+        'LINENUMBERS_ON',
+        0,
+    ),
+    (
+        'NEAREST',
+        "Nearest Vertex",
+        "Match each target vertex to the nearest source vertex in rest pose, "
+        "for sources that were remeshed or reimported with a different vertex order",
+        'SNAP_VERTEX',
+        1,
+    ),
+    (
+        'SURFACE',
+        "Surface Binding",
+        "Follow the closest point on the source surface in rest pose, "
+        "for sources with a different resolution such as a low-res sculpt proxy",
+        'MOD_MESHDEFORM',
+        2,
+    ),
+)
 
 
 class SKL_PG_link(PropertyGroup):
@@ -248,7 +1010,17 @@ class SKL_PG_link(PropertyGroup):
         name="Source",
         description="Source mesh used to update this shape key",
         type=Object,
+        update=_source_changed,
+    )
+    vertex_mapping: EnumProperty(
+        name="Vertex Mapping",
+        description="How target vertices find their source vertices",
+        items=_VERTEX_MAPPINGS,
+        default='INDEX',
+        update=_mapping_changed,
     )
+    # Counts and attribute prefix of the binding saved in the target mesh; see _save_binding.
+    vertex_map: StringProperty(default="", options={'HIDDEN'})
     source_name: StringProperty(
         name="Last Source Name",
         description="Last known source name, retained when the source is deleted",
@@ -258,12 +1030,15 @@ class SKL_PG_link(PropertyGroup):
         description="Linked shape key name",
     )
     source_vertex_count: IntProperty(default=0, options={'HIDDEN'})
+    # Digest of the source coordinates written by the last update; see _fingerprint.
+    source_fingerprint: StringProperty(default="", options={'HIDDEN'})
     shape_key_index: IntProperty(default=-1, options={'HIDDEN'})
     target_key_count: IntProperty(default=0, options={'HIDDEN'})
     enabled: BoolProperty(
         name="Enabled",
         description="Include this link in Update All and Live Update",
         default=True,
+        update=_links_changed,
     )
 
 
@@ -276,12 +1051,20 @@ class SKL_OT_join_and_link(Operator):
     )
     bl_options = {'REGISTER', 'UNDO'}
 
+    vertex_mapping: EnumProperty(
+        name="Vertex Mapping",
+        description="How target vertices find their source vertices in new links",
+        items=_VERTEX_MAPPINGS,
+        default='INDEX',
+    )
+
     @classmethod
     def poll(cls, context):
         target = _active_mesh(context)
         return target is not None and target.mode == 'OBJECT'
 
     def execute(self, context):
+        global _LINKS_BATCHED
         target = _active_mesh(context)
         sources = [
             obj for obj in context.selected_objects
@@ -296,25 +1079,56 @@ class SKL_OT_join_and_link(Operator):
         updated = 0
         failures = []
 
-        for source in sources:
-            link = _link_for_source(target, source)
-            is_new = link is None
-            if is_new:
-                link = target.shape_key_linker_links.add()
-                link.source = source
-                link.source_name = source.name
-                link.shape_key_name = source.name
-
-            ok, detail = _update_link(target, link, depsgraph, create_missing=True)
-            if ok:
+        links = target.shape_key_linker_links
+        existing = {}
+        for index, link in enumerate(links):
+            if link.source is not None:
+                existing.setdefault(link.source.as_pointer(), index)
+        window_manager = context.window_manager
+        window_manager.progress_begin(0, len(sources))
+        # Link update callbacks would rebuild the source index once per added link.
+        _LINKS_BATCHED = True
+        try:
+            entries = []
+            for source in sources:
+                index = existing.get(source.as_pointer())
+                is_new = index is None
                 if is_new:
-                    created += 1
+                    link = links.add()
+                    link.source = source
+                    link.source_name = source.name
+                    link.shape_key_name = source.name
+                    link.vertex_mapping = self.vertex_mapping
+                    index = len(links) - 1
+                entries.append((source, index, is_new))
+
+            # Batches share the depsgraph and the buffer pool, but only one batch of
+            # source coordinates is held at a time.
+            results = []
+            for start in range(0, len(entries), _JOIN_CHUNK):
+                batch = entries[start:start + _JOIN_CHUNK]
+                results += _update_links(target, [index for _source, index, _new in batch], depsgraph)
+                window_manager.progress_update(start + len(batch))
+
+            rejected = []
+            for (source, index, is_new), (ok, detail) in zip(entries, results):
+                if ok:
+                    if is_new:
+                        created += 1
+                    else:
+                        updated += 1
                 else:
-                    updated += 1
-            else:
-                failures.append(f"{source.name}: {detail}")
-                if is_new:
-                    target.shape_key_linker_links.remove(len(target.shape_key_linker_links) - 1)
+                    failures.append(f"{source.name}: {detail}")
+                    if is_new:
+                        rejected.append(index)
+            for index in sorted(rejected, reverse=True):
+                _drop_binding(target, links[index])
+                links.remove(index)
+                _forget_link(target.as_pointer(), index)
+        finally:
+            _LINKS_BATCHED = False
+            window_manager.progress_end()
+        _links_changed()
 
         if created or updated:
             message = f"Linked {created} new shape(s)"
@@ -348,14 +1162,13 @@ class SKL_OT_update_all(Operator):
 
     def execute(self, context):
         target = _active_mesh(context)
-        depsgraph = context.evaluated_depsgraph_get()
+        links = target.shape_key_linker_links
+        indices = [index for index, link in enumerate(links) if link.enabled]
+        results = _update_links(target, indices, context.evaluated_depsgraph_get())
         updated = 0
         failures = []
 
-        for link in target.shape_key_linker_links:
-            if not link.enabled:
-                continue
-            ok, detail = _update_link(target, link, depsgraph, create_missing=True)
+        for link, (ok, detail) in zip((links[index] for index in indices), results):
             if ok:
                 updated += 1
             else:
@@ -371,6 +1184,49 @@ class SKL_OT_update_all(Operator):
         return {'FINISHED'} if updated else {'CANCELLED'}
 
 
+class SKL_OT_refresh_stale(Operator):
+    bl_idname = "object.shape_key_refresh_stale"
+    bl_label = "Refresh Stale"
+    bl_description = (
+        "Update only the enabled links whose source changed since its last update "
+        "or whose shape key is missing"
+    )
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        target = _active_mesh(context)
+        return (
+            target is not None
+            and target.mode == 'OBJECT'
+            and len(target.shape_key_linker_links) > 0
+        )
+
+    def execute(self, context):
+        target = _active_mesh(context)
+        links = target.shape_key_linker_links
+        indices = [index for index, link in enumerate(links) if link.enabled]
+        # Fingerprints are compared as each source is evaluated, so no source is held for later.
+        results = _update_links(target, indices, context.evaluated_depsgraph_get(), only_stale=True)
+        current = 0
+        updated = 0
+        failures = []
+        for index, (ok, detail) in zip(indices, results):
+            if not ok:
+                failures.append(f"{links[index].source_name or links[index].shape_key_name}: {detail}")
+            elif _LINK_STATUS[(target.as_pointer(), index)][0] == 'READY':
+                current += 1
+            else:
+                updated += 1
+
+        message = f"Refreshed {updated} stale shape(s); {current} already current"
+        if failures:
+            self.report({'WARNING'}, f"{message}; failed {len(failures)} — {failures[0]}")
+        else:
+            self.report({'INFO'}, message)
+        return {'FINISHED'} if updated or current else {'CANCELLED'}
+
+
 class SKL_OT_update_one(Operator):
     bl_idname = "object.shape_key_update_linked_one"
     bl_label = "Update Linked Shape"
@@ -390,13 +1246,7 @@ class SKL_OT_update_one(Operator):
             self.report({'ERROR'}, "Linked shape entry no longer exists")
             return {'CANCELLED'}
 
-        link = target.shape_key_linker_links[self.index]
-        ok, detail = _update_link(
-            target,
-            link,
-            context.evaluated_depsgraph_get(),
-            create_missing=True,
-        )
+        ok, detail = _update_links(target, [self.index], context.evaluated_depsgraph_get())[0]
         if not ok:
             self.report({'ERROR'}, detail)
             return {'CANCELLED'}
@@ -421,33 +1271,63 @@ class SKL_OT_remove_link(Operator):
         target = _active_mesh(context)
         if self.index < 0 or self.index >= len(target.shape_key_linker_links):
             return {'CANCELLED'}
+        _drop_binding(target, target.shape_key_linker_links[self.index])
         target.shape_key_linker_links.remove(self.index)
+        _forget_link(target.as_pointer(), self.index)
+        _links_changed()
         return {'FINISHED'}
 
 
-def _draw_link_row(layout, target, link, index):
-    row = layout.row(align=True)
-    row.use_property_split = False
-    row.use_property_decorate = False
-    row.prop(link, "enabled", text="")
+def _link_label(link):
     source = link.source
-    # Panel drawing must be read-only; Blender can stop drawing the remaining
-    # row when an RNA property is modified from a draw callback.
-    key = _find_key(target, link, update_metadata=False)
-    if source is None or source.type != 'MESH' or key is None:
-        status_icon = 'ERROR'
-    elif len(source.data.vertices) != len(target.data.vertices):
-        status_icon = 'ERROR'
-    else:
-        status_icon = 'LINKED'
-
     source_name = source.name if source else (link.source_name or "Missing Source")
-    key_name = key.name if key else (link.shape_key_name or "Missing Shape Key")
-    row.label(text=f"{source_name}  →  {key_name}", icon=status_icon)
-    op = row.operator("object.shape_key_update_linked_one", text="", icon='FILE_REFRESH')
-    op.index = index
-    op = row.operator("object.shape_key_remove_link", text="", icon='X')
-    op.index = index
+    return f"{source_name}  →  {link.shape_key_name or 'Missing Shape Key'}"
+
+
+class SKL_UL_links(UIList):
+    """Linked shapes of the active object; only visible rows are drawn."""
+
+    bl_idname = "SKL_UL_links"
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.use_property_split = False
+        row.use_property_decorate = False
+        row.prop(item, "enabled", text="")
+        # Drawing reads only the status cached by the last update; it never resolves keys
+        # or evaluates sources, and it must not write RNA properties.
+        status = _LINK_STATUS.get((data.as_pointer(), index))
+        row.label(text=_link_label(item), icon=_STATUS_ICONS[status[0]] if status else 'LINKED')
+        row.prop(item, "vertex_mapping", text="", icon_only=True, emboss=False)
+        op = row.operator("object.shape_key_update_linked_one", text="", icon='FILE_REFRESH', emboss=False)
+        op.index = index
+        op = row.operator("object.shape_key_remove_link", text="", icon='X', emboss=False)
+        op.index = index
+
+    def filter_items(self, context, data, propname):
+        links = getattr(data, propname)
+        flags = []
+        if self.filter_name:
+            pattern = f"*{self.filter_name.lower()}*"
+            flags = [
+                self.bitflag_filter_item if fnmatch.fnmatchcase(_link_label(link).lower(), pattern) else 0
+                for link in links
+            ]
+        order = []
+        if self.use_filter_sort_alpha:
+            order = bpy.types.UI_UL_list.sort_items_helper(
+                [(index, _link_label(link).lower()) for index, link in enumerate(links)],
+                key=lambda item: item[1],
+            )
+        return flags, order
+
+
+# Shown under the link list for the active link's vertex mapping.
+_MAPPING_HINTS = {
+    'INDEX': "Object transforms are ignored; vertex order must match.",
+    'NEAREST': "Object transforms are ignored; vertices match by rest pose position.",
+    'SURFACE': "Object transforms are ignored; vertices follow the source surface.",
+}
 
 
 def _draw_linker_in_shape_keys(self, context):
@@ -466,7 +1346,9 @@ def _draw_linker_in_shape_keys(self, context):
 
     buttons = box.column(align=True)
     buttons.operator("object.shape_key_join_and_link", icon='ADD')
-    buttons.operator("object.shape_key_update_linked", text="Update All", icon='FILE_REFRESH')
+    row = buttons.row(align=True)
+    row.operator("object.shape_key_update_linked", text="Update All", icon='FILE_REFRESH')
+    row.operator("object.shape_key_refresh_stale", icon='TIME')
     live = buttons.row()
     live.enabled = len(target.shape_key_linker_links) > 0
     live.prop(target, "shape_key_linker_live", text="Live Update", icon='LIGHT', toggle=True)
@@ -486,16 +1368,49 @@ def _draw_linker_in_shape_keys(self, context):
         )
         return
 
-    links_box = box.box()
-    for index, link in enumerate(target.shape_key_linker_links):
-        _draw_link_row(links_box, target, link, index)
+    links = target.shape_key_linker_links
+    box.template_list(
+        "SKL_UL_links",
+        "",
+        target,
+        "shape_key_linker_links",
+        target,
+        "shape_key_linker_active_link",
+        rows=min(max(len(links), 3), 8),
+    )
+    status = _LINK_STATUS.get((target.as_pointer(), target.shape_key_linker_active_link))
+    if status is not None and status[0] not in {'READY', 'UPDATED'}:
+        _wrapped_labels(box, context, status[1], icon=_STATUS_ICONS[status[0]])
+
+    header, body = box.panel("SKL_statistics", default_closed=True)
+    header.label(text="Statistics", icon='TIME')
+    if body is not None:
+        _draw_statistics(body, context)
+
+    active = target.shape_key_linker_active_link
+    mapping = links[active].vertex_mapping if 0 <= active < len(links) else 'INDEX'
+    _wrapped_labels(box, context, _MAPPING_HINTS[mapping], icon='INFO')
+
 
-    _wrapped_labels(
-        box,
-        context,
-        "Object transforms are ignored; vertex order must match.",
-        icon='INFO',
+def _draw_statistics(layout, context):
+    layout.prop(context.window_manager, "shape_key_linker_statistics", text="Collect Statistics")
+    if _STATISTICS is None:
+        return
+    column = layout.column(align=True)
+    column.label(
+        text=f"Depsgraph updates: {_STATISTICS['depsgraph_updates']} "
+        f"({_STATISTICS['depsgraph_updates_ignored']} ignored)"
     )
+    column.label(text=f"Timer ticks: {_STATISTICS['timer_ticks']}")
+    column.label(text=f"Key writes: {_WRITE_COUNTS['written']} ({_WRITE_COUNTS['skipped']} skipped unchanged)")
+    slowest = sorted(_STATISTICS["links"].items(), key=lambda item: item[1]["total"], reverse=True)
+    for name, entry in slowest[:_STATISTICS_ROWS]:
+        column.label(
+            text=f"{name} {entry['shape_key']}: eval {entry['evaluate'] * 1000:.1f} ms, "
+            f"copy {entry['copy'] * 1000:.1f} ms, update {entry['update'] * 1000:.1f} ms",
+        )
+    if _STATISTICS["last_failure"]:
+        _wrapped_labels(column, context, _STATISTICS["last_failure"], icon='ERROR')
 
 
 def _draw_shape_key_menu(self: Menu, context):
@@ -507,8 +1422,10 @@ def _draw_shape_key_menu(self: Menu, context):
 
 CLASSES = (
     SKL_PG_link,
+    SKL_UL_links,
     SKL_OT_join_and_link,
     SKL_OT_update_all,
+    SKL_OT_refresh_stale,
     SKL_OT_update_one,
     SKL_OT_remove_link,
 )
@@ -525,20 +1442,57 @@ def register():
         default=False,
         update=_live_toggle_changed,
     )
+    bpy.types.Object.shape_key_linker_active_link = IntProperty(
+        name="Active Link",
+        description="Linked shape selected in the Shape Key Linker list",
+        default=0,
+    )
+    bpy.types.WindowManager.shape_key_linker_statistics = BoolProperty(
+        name="Collect Statistics",
+        description="Count Live Update events and time each link update; off costs nothing",
+        get=lambda _self: _STATISTICS is not None,
+        set=lambda _self, value: collect_live_statistics(value),
+    )
+    for handlers in _FILE_CHANGE_HANDLERS:
+        if _rebuild_after_file_change not in handlers:
+            handlers.append(_rebuild_after_file_change)
+    # Installed even without live links, so duplicated or appended live targets are indexed.
     if _live_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(_live_depsgraph_update)
+    _subscribe_mode_changes()
+    try:
+        _rebuild_source_index()
+    except AttributeError:
+        # bpy.data is restricted while add-ons are enabled at startup; load_post rebuilds it.
+        pass
     bpy.types.DATA_PT_shape_keys.append(_draw_linker_in_shape_keys)
     bpy.types.MESH_MT_shape_key_context_menu.append(_draw_shape_key_menu)
 
 
 def unregister():
+    bpy.msgbus.clear_by_owner(_MSGBUS_OWNER)
     _LIVE_DIRTY.clear()
+    _LIVE_DEFERRED.clear()
+    _LINK_COSTS.clear()
+    _BUFFER_POOL.clear()
+    _BINDINGS.clear()
+    _LINK_STATUS.clear()
+    _KEY_INDEX.clear()
+    _forget_written()
+    _SOURCE_INDEX.clear()
+    _OBJECT_REGISTRY.clear()
     if bpy.app.timers.is_registered(_run_live_updates):
         bpy.app.timers.unregister(_run_live_updates)
     if _live_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(_live_depsgraph_update)
+    for handlers in _FILE_CHANGE_HANDLERS:
+        if _rebuild_after_file_change in handlers:
+            handlers.remove(_rebuild_after_file_change)
     bpy.types.MESH_MT_shape_key_context_menu.remove(_draw_shape_key_menu)
     bpy.types.DATA_PT_shape_keys.remove(_draw_linker_in_shape_keys)
+    collect_live_statistics(False)
+    del bpy.types.WindowManager.shape_key_linker_statistics
+    del bpy.types.Object.shape_key_linker_active_link
     del bpy.types.Object.shape_key_linker_live
     del bpy.types.Object.shape_key_linker_links
 
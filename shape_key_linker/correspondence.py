@@ -0,0 +1,269 @@
+# SPDX-License-Identifier: MIT
+"""Vertex correspondence between meshes whose vertex order or resolution differs.
+
+This module has no Blender dependency. A binding maps every target vertex to
+source vertices and is built once from rest positions; each later update is
+a single vectorized gather, or a sparse weighted sum, over the source
+coordinates.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+# Average number of reference points per grid cell.
+_POINTS_PER_CELL = 2.0
+# Rings searched on the grid before the remaining points are matched by brute force.
+_MAX_RINGS = 4
+_BRUTE_FORCE_CHUNK = 1 << 20
+_SEARCH_CHUNK = 1 << 16
+
+
+@dataclass(frozen=True)
+class Binding:
+    """Target vertex -> source vertex indices and, for blended bindings, their weights.
+
+    With weights, ``indices`` and ``weights`` are the (target, 3) rows of a
+    sparse target x source matrix. ``offsets`` is added after the product so
+    a bound vertex keeps its rest distance from the source surface.
+    """
+
+    source_count: int
+    indices: np.ndarray
+    weights: np.ndarray | None = None
+    offsets: np.ndarray | None = None
+
+    @property
+    def target_count(self) -> int:
+        return int(self.indices.shape[0])
+
+
+def _dot(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Row-wise dot products of two (n, 3) arrays."""
+    return np.einsum("ij,ij->i", first, second)
+
+
+def _ring_offsets(radius: int) -> np.ndarray:
+    """Integer cell offsets whose Chebyshev distance from the origin is exactly ``radius``."""
+    span = np.arange(-radius, radius + 1)
+    offsets = np.stack(np.meshgrid(span, span, span, indexing="ij"), axis=-1).reshape(-1, 3)
+    return offsets[np.abs(offsets).max(axis=1) == radius]
+
+
+def _cell_size(reference: np.ndarray) -> float:
+    extent = reference.max(axis=0) - reference.min(axis=0)
+    spread = extent[extent > 1e-9]
+    if len(spread) == 0:
+        return 1.0
+    # Flat meshes spread their points over two (or one) dimensions only.
+    volume = float(np.prod(spread)) * _POINTS_PER_CELL / len(reference)
+    return max(volume ** (1.0 / len(spread)), float(spread.max()) * 1e-6)
+
+
+def _search_grid(points, reference, grid, size):
+    """Nearest reference index for each point, searching grid rings then falling back to brute force."""
+    order, cell_keys, cell_starts, cell_counts, origin, dims = grid
+    result = np.zeros(len(points), dtype=np.int32)
+    # Clamping keeps the ring guarantee: a cell inside the grid is never farther
+    # from the clamped cell than from the original one.
+    point_cells = np.clip(np.floor((points - origin) / size), 0, dims - 1).astype(np.int64)
+    best = np.full(len(points), np.inf)
+    pending = np.arange(len(points))
+    for radius in range(_MAX_RINGS + 1):
+        offsets = _ring_offsets(radius)
+        # Flat axes (one cell thick) never have neighbours.
+        offsets = offsets[np.all((offsets == 0) | (dims > 1), axis=1)]
+        for offset in offsets:
+            cells = point_cells[pending] + offset
+            inside = np.all((cells >= 0) & (cells < dims), axis=1)
+            lookup = pending[inside]
+            cells = cells[inside]
+            cell = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+            slot = np.minimum(np.searchsorted(cell_keys, cell), len(cell_keys) - 1)
+            found = cell_keys[slot] == cell
+            lookup, slot = lookup[found], slot[found]
+            starts, counts = cell_starts[slot], cell_counts[slot]
+            for step in range(int(counts.max(initial=0))):
+                live = counts > step
+                candidates = order[starts[live] + step]
+                targets = lookup[live]
+                delta = reference[candidates] - points[targets]
+                distance = _dot(delta, delta)
+                closer = distance < best[targets]
+                best[targets[closer]] = distance[closer]
+                result[targets[closer]] = candidates[closer]
+        # Every reference point within radius * size lies in the rings searched so far.
+        pending = pending[best[pending] > (radius * size) ** 2]
+        if len(pending) == 0:
+            return result
+
+    chunk = max(1, _BRUTE_FORCE_CHUNK // len(reference))
+    for start in range(0, len(pending), chunk):
+        rows = pending[start : start + chunk]
+        distance = np.sum((points[rows, None, :] - reference[None, :, :]) ** 2, axis=2)
+        result[rows] = np.argmin(distance, axis=1)
+    return result
+
+
+def nearest_indices(points: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """Return, for each point, the index of the nearest reference point.
+
+    Reference points are bucketed into a uniform grid. Each point searches
+    rings of cells around its own; a match is final once it is closer than the
+    searched radius, so the result is exact. Points still unresolved after a
+    few rings are matched by brute force. Points are searched in chunks so the
+    temporaries stay in cache.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    reference = np.asarray(reference, dtype=np.float64).reshape(-1, 3)
+    if len(reference) == 0:
+        raise ValueError("Reference has no points")
+
+    size = _cell_size(reference)
+    origin = reference.min(axis=0)
+    reference_cells = np.floor((reference - origin) / size).astype(np.int64)
+    dims = reference_cells.max(axis=0) + 1
+    keys = (reference_cells[:, 0] * dims[1] + reference_cells[:, 1]) * dims[2] + reference_cells[:, 2]
+    order = np.argsort(keys, kind="stable")
+    cell_keys, cell_starts, cell_counts = np.unique(keys[order], return_index=True, return_counts=True)
+    grid = (order, cell_keys, cell_starts, cell_counts, origin, dims)
+
+    result = np.zeros(len(points), dtype=np.int32)
+    for start in range(0, len(points), _SEARCH_CHUNK):
+        result[start : start + _SEARCH_CHUNK] = _search_grid(
+            points[start : start + _SEARCH_CHUNK], reference, grid, size
+        )
+    return result
+
+
+def nearest_binding(target_rest: np.ndarray, source_rest: np.ndarray) -> Binding:
+    """Bind each target vertex to the nearest source vertex in rest pose."""
+    source_rest = np.asarray(source_rest).reshape(-1, 3)
+    return Binding(len(source_rest), nearest_indices(target_rest, source_rest))
+
+
+def _closest_on_triangles(points, first, second, third):
+    """Return squared distances and barycentric weights of the closest point on each triangle."""
+    edge1 = second - first
+    edge2 = third - first
+    offset = points - first
+    d00 = _dot(edge1, edge1)
+    d01 = _dot(edge1, edge2)
+    d11 = _dot(edge2, edge2)
+    d20 = _dot(offset, edge1)
+    d21 = _dot(offset, edge2)
+    denominator = d00 * d11 - d01 * d01
+    valid = np.abs(denominator) > 1e-20
+    safe = np.where(valid, denominator, 1.0)
+    v = (d11 * d20 - d01 * d21) / safe
+    w = (d00 * d21 - d01 * d20) / safe
+    weights = np.stack((1.0 - v - w, v, w), axis=1)
+    inside = valid & np.all(weights >= 0.0, axis=1)
+    projected = weights[:, :1] * first + weights[:, 1:2] * second + weights[:, 2:] * third
+    projected -= points
+    distance = np.where(inside, _dot(projected, projected), np.inf)
+
+    # Outside the triangle (or degenerate), the closest point lies on an edge.
+    corners = (first, second, third)
+    for start, end in ((0, 1), (1, 2), (2, 0)):
+        a, b = corners[start], corners[end]
+        edge = b - a
+        length = _dot(edge, edge)
+        t = np.clip(_dot(points - a, edge) / np.where(length > 0.0, length, 1.0), 0.0, 1.0)
+        closest = a + t[:, None] * edge - points
+        edge_distance = _dot(closest, closest)
+        closer = ~inside & (edge_distance < distance)
+        distance[closer] = edge_distance[closer]
+        weights[closer] = 0.0
+        weights[closer, start] = 1.0 - t[closer]
+        weights[closer, end] = t[closer]
+    return distance, weights
+
+
+def _closest_triangles(points, vertices, triangles, fans, nearest_vertex, nearest_centroid):
+    """Pick the closest candidate triangle per point; returns (triangle, weights)."""
+    fan_order, fan_starts = fans
+    starts = fan_starts[nearest_vertex]
+    counts = fan_starts[nearest_vertex + 1] - starts
+    best_triangle = nearest_centroid.astype(np.int64)
+    corners = np.moveaxis(vertices[triangles[best_triangle]], 1, 0)
+    best_distance, best_weights = _closest_on_triangles(points, *corners)
+    for step in range(int(counts.max(initial=0))):
+        live = np.flatnonzero(counts > step)
+        candidates = fan_order[starts[live] + step]
+        corners = np.moveaxis(vertices[triangles[candidates]], 1, 0)
+        distance, weights = _closest_on_triangles(points[live], *corners)
+        closer = distance < best_distance[live]
+        rows = live[closer]
+        best_distance[rows] = distance[closer]
+        best_weights[rows] = weights[closer]
+        best_triangle[rows] = candidates[closer]
+    return best_triangle, best_weights
+
+
+def surface_binding(target_rest: np.ndarray, source_rest: np.ndarray, triangles: np.ndarray) -> Binding:
+    """Bind each target vertex to the closest point on the source triangles in rest pose.
+
+    Candidate triangles are the fan around the nearest source vertex plus the
+    triangle with the nearest centroid. Each target vertex stores the three
+    corner indices and barycentric weights of its closest point, and its rest
+    offset from that point.
+    """
+    points = np.asarray(target_rest, dtype=np.float64).reshape(-1, 3)
+    vertices = np.asarray(source_rest, dtype=np.float64).reshape(-1, 3)
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    if len(triangles) == 0:
+        raise ValueError("Source has no faces to bind to")
+
+    corners = triangles.ravel()
+    fans = (
+        np.argsort(corners, kind="stable") // 3,
+        np.searchsorted(np.sort(corners), np.arange(len(vertices) + 1)),
+    )
+    nearest_vertex = nearest_indices(points, vertices)
+    nearest_centroid = nearest_indices(points, vertices[triangles].mean(axis=1))
+
+    indices = np.empty((len(points), 3), dtype=np.int32)
+    weights = np.empty((len(points), 3), dtype=np.float32)
+    offsets = np.empty((len(points), 3), dtype=np.float32)
+    for start in range(0, len(points), _SEARCH_CHUNK):
+        rows = slice(start, start + _SEARCH_CHUNK)
+        triangle, weight = _closest_triangles(
+            points[rows], vertices, triangles, fans, nearest_vertex[rows], nearest_centroid[rows]
+        )
+        indices[rows] = triangles[triangle]
+        weights[rows] = weight
+        surface = np.einsum("ij,ijk->ik", weight, vertices[triangles[triangle]])
+        offsets[rows] = points[rows] - surface
+    return Binding(len(vertices), indices, weights, offsets)
+
+
+def apply_binding(
+    binding: Binding,
+    source: np.ndarray,
+    out: np.ndarray,
+    scratch: np.ndarray | None = None,
+) -> np.ndarray:
+    """Write bound target coordinates from flat source coordinates into flat ``out``.
+
+    Weighted bindings accumulate one corner column at a time through ``scratch``
+    (same size as ``out``) instead of materializing a (target, 3, 3) gather.
+    """
+    source = source.reshape(-1, 3)
+    target = out.reshape(-1, 3)
+    if binding.weights is None:
+        np.take(source, binding.indices, axis=0, out=target)
+    else:
+        column = np.empty_like(target) if scratch is None else scratch.reshape(-1, 3)
+        np.take(source, binding.indices[:, 0], axis=0, out=target)
+        target *= binding.weights[:, :1]
+        for corner in (1, 2):
+            np.take(source, binding.indices[:, corner], axis=0, out=column)
+            column *= binding.weights[:, corner : corner + 1]
+            target += column
+    if binding.offsets is not None:
+        target += binding.offsets
+    return out
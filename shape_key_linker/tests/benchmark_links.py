@@ -0,0 +1,259 @@
+"""Headless scale benchmark for Shape Key Linker.
+
+Run with Blender in the background; arguments after ``--`` are parsed here:
+
+    blender --background --factory-startup --python-exit-code 1
+        --python shape_key_linker/tests/benchmark_links.py -- --preset quick
+
+Each case builds N targets that all link the same M sources of V vertices.
+A run fails when a timing is slower than the baseline JSON by more than
+``--tolerance`` (relative) and ``--noise-ms`` (absolute), when a throughput
+is lower by more than ``--tolerance``, and when a case or metric has no
+baseline value yet. ``--update-baseline`` records this run's results instead
+of comparing.
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+
+ADDON_PARENT = Path(__file__).resolve().parents[2]
+if str(ADDON_PARENT) not in sys.path:
+    sys.path.insert(0, str(ADDON_PARENT))
+
+addon = importlib.import_module("shape_key_linker")
+implementation = importlib.import_module("shape_key_linker.addon")
+
+DEFAULT_BASELINE = Path(__file__).with_name("benchmark_links_baseline.json")
+DEPSGRAPH_STEPS = 20
+PRESETS = {
+    # (targets, links per target, vertices)
+    "quick": [
+        (2, 10, 1_000),
+        (4, 50, 10_000),
+    ],
+    "full": [
+        (2, 10, 1_000),
+        (4, 50, 10_000),
+        (100, 200, 1_000),
+        (10, 20, 100_000),
+        (2, 4, 1_000_000),
+    ],
+}
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(prog="benchmark_links.py")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--targets", type=int, help="Run a single case with this many targets")
+    parser.add_argument("--links", type=int, default=20, help="Links per target for --targets")
+    parser.add_argument("--vertices", type=int, default=10_000, help="Vertices per mesh for --targets")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--noise-ms", type=float, default=5.0)
+    parser.add_argument("--output", type=Path, help="Also write this run's results to a JSON file")
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    return parser.parse_args(argv)
+
+
+def reset_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    implementation._rebuild_source_index()
+
+
+def point_object(name, coordinates):
+    """Build a mesh of loose vertices; Vertex Order links need no faces."""
+    mesh = bpy.data.meshes.new(name + "Mesh")
+    mesh.vertices.add(len(coordinates))
+    mesh.vertices.foreach_set("co", coordinates.ravel())
+    mesh.update()
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+
+def activate(target, sources=()):
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
+    for source in sources:
+        source.select_set(True)
+    target.select_set(True)
+    bpy.context.view_layer.objects.active = target
+
+
+def move_vertices(obj, offset):
+    coordinates = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    obj.data.vertices.foreach_get("co", coordinates)
+    coordinates[2::3] += offset
+    obj.data.vertices.foreach_set("co", coordinates)
+    obj.data.update()
+
+
+def timed_view_layer_updates(obj):
+    """Mean milliseconds of a depsgraph update caused by editing obj."""
+    samples = []
+    for step in range(DEPSGRAPH_STEPS):
+        move_vertices(obj, 0.001 if step % 2 else -0.001)
+        start = time.perf_counter()
+        bpy.context.view_layer.update()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return sum(samples) / len(samples)
+
+
+def run_case(target_count, link_count, vertex_count):
+    reset_scene()
+    rng = np.random.default_rng(target_count * link_count + vertex_count)
+    rest = rng.random((vertex_count, 3), dtype=np.float32)
+    sources = [point_object(f"Source{number:03}", rest + number * 0.01) for number in range(link_count)]
+    targets = [point_object(f"Target{number:03}", rest) for number in range(target_count)]
+    bystander = point_object("Bystander", rest)
+
+    start = time.perf_counter()
+    for target in targets:
+        activate(target, sources)
+        result = bpy.ops.object.shape_key_join_and_link()
+        assert result == {'FINISHED'}, result
+    join_ms = (time.perf_counter() - start) * 1000.0
+
+    # Every source changes, so no write can be skipped as unchanged.
+    for source in sources:
+        move_vertices(source, 0.5)
+    start = time.perf_counter()
+    for target in targets:
+        activate(target)
+        result = bpy.ops.object.shape_key_update_linked()
+        assert result == {'FINISHED'}, result
+    update_all_ms = (time.perf_counter() - start) * 1000.0
+    link_total = target_count * link_count
+
+    depsgraph_without_live_ms = timed_view_layer_updates(bystander)
+    for target in targets:
+        target.shape_key_linker_live = True
+    # Unmeasured links run one per tick; drain them so every link has a measured cost.
+    while implementation._LIVE_DIRTY:
+        implementation._run_live_updates()
+    depsgraph_with_live_ms = timed_view_layer_updates(bystander)
+
+    # Time the handler itself on source edits; the edit only queues links.
+    handler = implementation._live_depsgraph_update
+    handler_samples = []
+
+    def timed_handler(scene, depsgraph):
+        start = time.perf_counter()
+        handler(scene, depsgraph)
+        handler_samples.append((time.perf_counter() - start) * 1000.0)
+
+    handlers = bpy.app.handlers.depsgraph_update_post
+    handlers.remove(handler)
+    handlers.append(timed_handler)
+    try:
+        for step in range(DEPSGRAPH_STEPS):
+            move_vertices(sources[0], 0.001 if step % 2 else -0.001)
+            bpy.context.view_layer.update()
+            implementation._LIVE_DIRTY.clear()
+    finally:
+        handlers.remove(timed_handler)
+        handlers.append(handler)
+
+    # Live latency runs from the source edit until every linked key is written.
+    # Timers do not fire in background mode, so the ticks are run here without the debounce delay.
+    activate(targets[0])
+    move_vertices(sources[0], 0.25)
+    start = time.perf_counter()
+    bpy.context.view_layer.update()
+    ticks = 0
+    while implementation._LIVE_DIRTY:
+        implementation._run_live_updates()
+        ticks += 1
+    live_latency_ms = (time.perf_counter() - start) * 1000.0
+    expected = sources[0].data.vertices[0].co.z
+    for target in targets:
+        key = target.data.shape_keys.key_blocks[sources[0].name]
+        assert abs(key.data[0].co.z - expected) < 1e-5, target.name
+
+    return {
+        "targets": target_count,
+        "links": link_count,
+        "vertices": vertex_count,
+        "join_ms": round(join_ms, 3),
+        "update_all_ms": round(update_all_ms, 3),
+        "update_all_links_per_second": round(link_total / (update_all_ms / 1000.0), 1),
+        "depsgraph_without_live_ms": round(depsgraph_without_live_ms, 3),
+        "depsgraph_with_live_ms": round(depsgraph_with_live_ms, 3),
+        "handler_mean_ms": round(sum(handler_samples) / len(handler_samples), 3),
+        "handler_max_ms": round(max(handler_samples), 3),
+        "live_latency_ms": round(live_latency_ms, 3),
+        "live_ticks": ticks,
+    }
+
+
+def compare(results, baseline, tolerance, noise_ms):
+    """Return regressions and missing baseline values; an unmeasured case never passes."""
+    problems = []
+    for case_id, metrics in results.items():
+        reference = baseline.get(case_id)
+        if reference is None:
+            problems.append(f"{case_id}: not in the baseline")
+            continue
+        for name, value in metrics.items():
+            if not name.endswith(("_ms", "_per_second")):
+                continue
+            if reference.get(name) is None:
+                problems.append(f"{case_id} {name}: no baseline value")
+                continue
+            if name.endswith("_ms"):
+                limit = reference[name] * (1.0 + tolerance)
+                if value > limit and value - reference[name] > noise_ms:
+                    problems.append(f"{case_id} {name}: {value:.2f} ms > baseline {reference[name]:.2f} ms")
+            # Throughput is worse when lower; the same tolerance applies to its rate.
+            elif value < reference[name] / (1.0 + tolerance):
+                problems.append(f"{case_id} {name}: {value:.1f} < baseline {reference[name]:.1f}")
+    return problems
+
+
+def main():
+    args = parse_arguments()
+    cases = [(args.targets, args.links, args.vertices)] if args.targets else PRESETS[args.preset]
+    addon.register()
+    results = {}
+    try:
+        for target_count, link_count, vertex_count in cases:
+            case_id = f"{target_count}t_{link_count}l_{vertex_count}v"
+            results[case_id] = run_case(target_count, link_count, vertex_count)
+            print(case_id, json.dumps(results[case_id]))
+    finally:
+        addon.unregister()
+
+    if args.output:
+        args.output.write_text(json.dumps({"cases": results}, indent=2) + "\n")
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["cases"]
+    if args.update_baseline:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps({"cases": baseline}, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    problems = compare(results, baseline, args.tolerance, args.noise_ms)
+    assert not problems, (
+        "Benchmark does not match the baseline:\n"
+        + "\n".join(problems)
+        + "\nRecord missing values with --update-baseline."
+    )
+    print("SHAPE_KEY_LINKER_BENCHMARK_OK")
+
+
+main()
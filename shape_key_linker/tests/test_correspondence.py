@@ -0,0 +1,64 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+PACKAGE = Path(__file__).resolve().parents[1]
+
+
+def load(name):
+    spec = importlib.util.spec_from_file_location(f"shape_key_linker_{name}_test", PACKAGE / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+correspondence = load("correspondence")
+rng = np.random.default_rng(7)
+
+# A shuffled copy maps straight back to the original order.
+reference = rng.random((5000, 3)).astype(np.float32)
+order = rng.permutation(len(reference))
+assert np.array_equal(correspondence.nearest_indices(reference[order], reference), order)
+
+# Grid search agrees with brute force on a noisy flat mesh, including points far outside it.
+plane = np.stack(np.meshgrid(np.arange(40), np.arange(30), [0.0], indexing="ij"), axis=-1).reshape(-1, 3)
+points = plane + rng.normal(0.0, 0.3, plane.shape)
+points = np.vstack((points, [(500.0, 2.0, 1.0), (-40.0, -40.0, 9.0)]))
+expected = np.argmin(((points[:, None, :] - plane[None, :, :]) ** 2).sum(axis=2), axis=1)
+actual = correspondence.nearest_indices(points, plane)
+distance = lambda indices: ((points - plane[indices]) ** 2).sum(axis=1)
+assert np.allclose(distance(actual), distance(expected))
+
+# A binding is applied as one gather.
+binding = correspondence.nearest_binding(reference[order], reference)
+assert binding.source_count == 5000 and binding.target_count == 5000
+moved = (reference + 1.0).ravel()
+out = np.empty(len(reference) * 3, dtype=np.float32)
+correspondence.apply_binding(binding, moved, out)
+assert np.array_equal(out.reshape(-1, 3), reference[order] + 1.0)
+
+# Surface binding follows a coarser source through barycentric weights and rest offsets.
+quad = np.array([(0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0)], dtype=np.float32)
+triangles = np.array([(0, 1, 2), (0, 2, 3)])
+fine = np.array([(0, 0, 0), (1, 0, 0), (1, 1, 0.25), (0.5, 1.5, -0.5), (3, 1, 0)], dtype=np.float32)
+surface = correspondence.surface_binding(fine, quad, triangles)
+assert surface.indices.shape == (5, 3) and np.allclose(surface.weights.sum(axis=1), 1.0)
+out = np.empty(fine.size, dtype=np.float32)
+correspondence.apply_binding(surface, quad.ravel(), out)
+assert np.allclose(out.reshape(-1, 3), fine, atol=1e-6)
+lifted = quad.copy()
+lifted[0, 2] = 1.0
+correspondence.apply_binding(surface, lifted.ravel(), out, np.empty_like(out))
+assert np.allclose(out.reshape(-1, 3)[:, 2], [1.0, 0.5, 0.75, -0.25, 0.0], atol=1e-6)
+try:
+    correspondence.surface_binding(fine, quad, np.empty((0, 3)))
+except ValueError:
+    pass
+else:
+    raise AssertionError("bound to a source without faces")
+
+print("SHAPE_KEY_LINKER_CORRESPONDENCE_TEST_OK")
@@ -19,12 +19,19 @@ link = target.shape_key_linker_links[0]
 assert link.source == source
 assert link.shape_key_name == "Happy"
 
+assert link.source_fingerprint
+
 source.data.vertices[2].co.y = 5.0
 bpy.context.view_layer.objects.active = target
 target.select_set(True)
-result = bpy.ops.object.shape_key_update_linked()
+# Fingerprints are saved with the file, so a stale link is found after reload.
+result = bpy.ops.object.shape_key_refresh_stale()
 assert result == {'FINISHED'}
 assert tuple(target.data.shape_keys.key_blocks["Happy"].data[2].co) == (0.0, 5.0, 0.0)
+source.data.vertices[2].co.y = 5.5
+result = bpy.ops.object.shape_key_update_linked()
+assert result == {'FINISHED'}
+assert tuple(target.data.shape_keys.key_blocks["Happy"].data[2].co) == (0.0, 5.5, 0.0)
 
 print("SHAPE_KEY_LINKER_RELOAD_TEST_OK")
 addon.unregister()
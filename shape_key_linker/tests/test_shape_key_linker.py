@@ -4,6 +4,7 @@ from pathlib import Path
 
 import bmesh
 import bpy
+import numpy as np
 
 
 ADDON_PARENT = Path(__file__).resolve().parents[2]
@@ -40,7 +41,9 @@ assert link.source == source
 assert link.shape_key_name == "Smile"
 assert tuple(target.data.shape_keys.key_blocks["Smile"].data[2].co) == (0.0, 2.0, 0.0)
 assert target.shape_key_linker_live is False
+# Without live links the depsgraph handler indexes nothing and returns at once.
 assert implementation._live_depsgraph_update in bpy.app.handlers.depsgraph_update_post
+assert not implementation._SOURCE_INDEX
 
 source.data.vertices[2].co.y = 3.0
 source.name = "SmileRenamed"
@@ -53,18 +56,48 @@ result = bpy.ops.object.shape_key_update_linked()
 assert result == {'FINISHED'}
 assert tuple(target.data.shape_keys.key_blocks["Smile"].data[2].co) == (0.0, 3.0, 0.0)
 assert link.source_name == "SmileRenamed"
+# The list draws the status cached by the last update instead of resolving keys.
+assert implementation._LINK_STATUS[(target.as_pointer(), 0)] == ('UPDATED', "Smile")
+
+# Refresh Stale compares the stored fingerprint and skips unchanged sources.
+fingerprint = link.source_fingerprint
+assert fingerprint.startswith("3:")
+target.data.shape_keys.key_blocks["Smile"].data[2].co.y = 9.0
+result = bpy.ops.object.shape_key_refresh_stale()
+assert result == {'FINISHED'}
+assert target.data.shape_keys.key_blocks["Smile"].data[2].co.y == 9.0
+source.data.vertices[2].co.y = 3.25
+result = bpy.ops.object.shape_key_refresh_stale()
+assert result == {'FINISHED'}
+assert tuple(target.data.shape_keys.key_blocks["Smile"].data[2].co) == (0.0, 3.25, 0.0)
+assert link.source_fingerprint != fingerprint
+# Swapping two vertices keeps every per-axis sum, yet still counts as a change.
+swapped = np.array([0, 0, 0, 0, 3.25, 0, 1, 0, 0], dtype=np.float32)
+original = np.array([0, 0, 0, 1, 0, 0, 0, 3.25, 0], dtype=np.float32)
+assert implementation._fingerprint(swapped, 3) != implementation._fingerprint(original, 3)
 
 # The refresh button on a link row updates only that source/key pair.
 source.data.vertices[2].co.y = 3.5
 result = bpy.ops.object.shape_key_update_linked_one(index=0)
 assert result == {'FINISHED'}
 assert tuple(target.data.shape_keys.key_blocks["Smile"].data[2].co) == (0.0, 3.5, 0.0)
+# An explicit update restores a key edited by hand even though its source is unchanged.
+target.data.shape_keys.key_blocks["Smile"].data[2].co.y = 9.0
+assert bpy.ops.object.shape_key_update_linked_one(index=0) == {'FINISHED'}
+assert target.data.shape_keys.key_blocks["Smile"].data[2].co.y == 3.5
 
 target.data.shape_keys.key_blocks["Smile"].name = "Happy"
 source.data.vertices[2].co.y = 4.0
 result = bpy.ops.object.shape_key_update_linked()
 assert result == {'FINISHED'}
 assert link.shape_key_name == "Happy"
+# The name map follows renames and count changes without a stale hit.
+key_blocks = target.data.shape_keys.key_blocks
+assert implementation._key_position(key_blocks, "Happy") == key_blocks.find("Happy")
+key_blocks["Happy"].name = "Glad"
+assert implementation._key_position(key_blocks, "Happy") == -1
+assert implementation._key_position(key_blocks, "Glad") == key_blocks.find("Glad")
+key_blocks["Glad"].name = "Happy"
 assert tuple(target.data.shape_keys.key_blocks["Happy"].data[2].co) == (0.0, 4.0, 0.0)
 
 # A missing linked key is recreated, while the source link is preserved.
@@ -76,13 +109,117 @@ assert tuple(target.data.shape_keys.key_blocks["Happy"].data[2].co) == (0.0, 4.5
 
 # Live Update is opt-in and refreshes enabled links through the debounced queue.
 target.shape_key_linker_live = True
+assert implementation._live_depsgraph_update in bpy.app.handlers.depsgraph_update_post
+assert implementation._SOURCE_INDEX[source.as_pointer()] == {(target.as_pointer(), 0)}
 implementation._run_live_updates()
+# Changes to objects that are not linked sources never mark a target dirty.
+bystander = mesh_object("Bystander", [(0, 0, 0), (1, 0, 0), (0, 1, 0)])
+bystander.data.vertices[0].co.x = 0.5
+bystander.data.update()
+bpy.context.view_layer.update()
+assert not implementation._LIVE_DIRTY
+# A duplicated live target copies its links and is indexed; deleting it drops it again.
+for obj in bpy.context.selected_objects:
+    obj.select_set(False)
+target.select_set(True)
+bpy.context.view_layer.objects.active = target
+assert bpy.ops.object.duplicate() == {'FINISHED'}
+duplicate = bpy.context.view_layer.objects.active
+assert duplicate != target and duplicate.shape_key_linker_live
+bpy.context.view_layer.update()
+duplicate_entry = (duplicate.as_pointer(), 0)
+assert duplicate_entry in implementation._SOURCE_INDEX[source.as_pointer()]
+duplicate_pointer = duplicate.as_pointer()
+assert implementation._object_from_pointer(duplicate_pointer) == duplicate
+# The Delete operator leaves the Python wrapper looking valid; lookups must not return it.
+assert bpy.ops.object.delete() == {'FINISHED'}
+assert implementation._object_from_pointer(duplicate_pointer) is None
+bpy.context.view_layer.update()
+assert duplicate_entry not in implementation._SOURCE_INDEX[source.as_pointer()]
+bpy.context.view_layer.objects.active = target
+# Dirty pointers resolve through the object registry; a deleted object resolves to None.
+assert implementation._object_from_pointer(target.as_pointer()) == target
+bystander_pointer = bystander.as_pointer()
+bpy.data.objects.remove(bystander)
+assert implementation._object_from_pointer(bystander_pointer) is None
 source.data.vertices[2].co.y = 4.75
 source.data.update()
 bpy.context.view_layer.update()
 assert target.as_pointer() in implementation._LIVE_DIRTY
+assert addon.live_statistics()["enabled"] is False
+bpy.context.window_manager.shape_key_linker_statistics = True
 implementation._run_live_updates()
 assert tuple(target.data.shape_keys.key_blocks["Happy"].data[2].co) == (0.0, 4.75, 0.0)
+statistics = addon.live_statistics()
+assert statistics["enabled"] and statistics["timer_ticks"] == 1
+assert statistics["written"] == 1 and statistics["skipped"] == 0
+timing = statistics["links"]["Target[0]"]
+assert timing["shape_key"] == "Happy" and timing["calls"] == 1 and timing["total"] > 0.0
+addon.collect_live_statistics(False)
+assert not bpy.context.window_manager.shape_key_linker_statistics
+
+# A source shared by several targets is read once per Live Update pass.
+twin = mesh_object("Twin", [(0, 0, 0), (1, 0, 0), (0, 1, 0)])
+twin_link = twin.shape_key_linker_links.add()
+twin_link.source = source
+twin_link.shape_key_name = "Happy"
+twin.shape_key_linker_live = True
+implementation._run_live_updates()
+source_reads = []
+read_source = implementation._source_coordinates
+implementation._source_coordinates = lambda obj, graph: source_reads.append(obj) or read_source(obj, graph)
+source.data.vertices[2].co.y = 4.8
+source.data.update()
+bpy.context.view_layer.update()
+implementation._run_live_updates()
+implementation._source_coordinates = read_source
+assert source_reads == [source]
+# Pass buffers return to the pool and the next pass reuses them instead of allocating.
+pooled = implementation._BUFFER_POOL[3]
+buffers = {id(buffer) for buffer in pooled}
+source.data.vertices[2].co.y = 4.85
+source.data.update()
+bpy.context.view_layer.update()
+implementation._run_live_updates()
+assert {id(buffer) for buffer in pooled} == buffers
+# A source change that leaves its shape alone (here a transform) writes nothing.
+written = implementation._WRITE_COUNTS["written"]
+skipped = implementation._WRITE_COUNTS["skipped"]
+source.location.x = 1.0
+bpy.context.view_layer.update()
+assert target.as_pointer() in implementation._LIVE_DIRTY
+implementation._run_live_updates()
+assert implementation._WRITE_COUNTS["written"] == written
+assert implementation._WRITE_COUNTS["skipped"] == skipped + 2
+assert addon.live_statistics()["skipped"] == skipped + 2
+source.location.x = 0.0
+bpy.context.view_layer.update()
+implementation._run_live_updates()
+# Past the per-tick budget the rest resumes on the next tick, the active target first.
+budget = implementation._LIVE_BUDGET
+implementation._LIVE_BUDGET = 0.0
+source.data.vertices[2].co.y = 4.9
+source.data.update()
+bpy.context.view_layer.update()
+assert bpy.context.view_layer.objects.active == target
+assert implementation._run_live_updates() == implementation._LIVE_RESUME_DELAY
+assert target.data.shape_keys.key_blocks["Happy"].data[2].co.y == source.data.vertices[2].co.y
+assert set(implementation._LIVE_DIRTY) == {twin.as_pointer()}
+assert implementation._run_live_updates() is None
+assert twin.data.shape_keys.key_blocks["Happy"].data[2].co.y == source.data.vertices[2].co.y
+implementation._LIVE_BUDGET = budget
+assert twin.data.shape_keys.key_blocks["Happy"].data[2].co.y == target.data.shape_keys.key_blocks["Happy"].data[2].co.y
+# Measured costs are kept by link identity across rebuilds and dropped with the link.
+twin_identity = ("Twin", source.name)
+assert (target.name, source.name) in implementation._LINK_COSTS
+assert twin_identity in implementation._LINK_COSTS
+twin.shape_key_linker_live = False
+assert twin_identity in implementation._LINK_COSTS
+bpy.data.objects.remove(twin)
+implementation._rebuild_source_index()
+assert twin_identity not in implementation._LINK_COSTS
+assert (target.name, source.name) in implementation._LINK_COSTS
+source.data.vertices[2].co.y = 4.75
 
 # Live Update also follows source changes made in Mesh Edit Mode.
 for obj in bpy.context.selected_objects:
@@ -99,7 +236,29 @@ assert target.as_pointer() in implementation._LIVE_DIRTY
 implementation._run_live_updates()
 assert tuple(target.data.shape_keys.key_blocks["Happy"].data[2].co) == (0.0, 4.875, 0.0)
 bpy.ops.object.mode_set(mode='OBJECT')
+
+# A target in Edit Mode holds its pending links without a polling timer until it leaves.
+for obj in bpy.context.selected_objects:
+    obj.select_set(False)
+target.select_set(True)
+bpy.context.view_layer.objects.active = target
+bpy.ops.object.mode_set(mode='EDIT')
+source.data.vertices[2].co.y = 5.0
+source.data.update()
+bpy.context.view_layer.update()
+assert target.as_pointer() in implementation._LIVE_DIRTY
+assert implementation._run_live_updates() is None
+assert target.as_pointer() in implementation._LIVE_DEFERRED and not implementation._LIVE_DIRTY
+bpy.ops.object.mode_set(mode='OBJECT')
+bpy.context.view_layer.update()
+assert target.as_pointer() in implementation._LIVE_DIRTY and not implementation._LIVE_DEFERRED
+implementation._run_live_updates()
+assert tuple(target.data.shape_keys.key_blocks["Happy"].data[2].co) == (0.0, 5.0, 0.0)
+link.enabled = False
+assert not implementation._SOURCE_INDEX
+link.enabled = True
 target.shape_key_linker_live = False
+assert not implementation._SOURCE_INDEX
 
 # A topology mismatch must not leave either a link or an orphan shape key.
 bad_source = mesh_object(
@@ -121,7 +280,129 @@ assert result == {'CANCELLED'}
 assert len(target.data.shape_keys.key_blocks) == key_count_before
 assert len(target.shape_key_linker_links) == 1
 
+# In a batch, only the rejected source is dropped; the valid one is linked.
+wink = mesh_object("Wink", [(0, 0, 0), (2, 0, 0), (0, 1, 0)])
+wink.select_set(True)
+result = bpy.ops.object.shape_key_join_and_link()
+assert result == {'FINISHED'}
+assert [item.source for item in target.shape_key_linker_links] == [source, wink]
+assert len(target.data.shape_keys.key_blocks) == key_count_before + 1
+assert tuple(target.data.shape_keys.key_blocks["Wink"].data[1].co) == (2.0, 0.0, 0.0)
+assert bpy.ops.object.shape_key_remove_link(index=1) == {'FINISHED'}
+
+# A bulk join rebuilds the source index once, however many links it adds,
+# and adds each new key to the key name index instead of rebuilding it.
+for obj in bpy.context.selected_objects:
+    obj.select_set(False)
+bulk = [mesh_object(f"Bulk{number:02}", [(0, 0, 0), (1, 0, 0), (0, number, 0)]) for number in range(40)]
+for obj in bulk:
+    obj.select_set(True)
+target.select_set(True)
+# New objects are indexed by the next depsgraph update, before the join is counted.
+bpy.context.view_layer.update()
+rebuild_source_index = implementation._rebuild_source_index
+index_keys = implementation._index_keys
+rebuilds = []
+key_indexings = []
+implementation._rebuild_source_index = lambda: (rebuilds.append(1), rebuild_source_index())
+implementation._index_keys = lambda key_blocks: (key_indexings.append(1), index_keys(key_blocks))[1]
+try:
+    result = bpy.ops.object.shape_key_join_and_link()
+finally:
+    implementation._rebuild_source_index = rebuild_source_index
+    implementation._index_keys = index_keys
+assert result == {'FINISHED'}
+assert len(rebuilds) == 1
+assert len(key_indexings) <= 1
+assert {item.source for item in target.shape_key_linker_links[1:]} == set(bulk)
+assert tuple(target.data.shape_keys.key_blocks["Bulk39"].data[2].co) == (0.0, 39.0, 0.0)
+# Update All evaluates, writes and releases one source at a time.
+held = set()
+most_held = []
+read_source = implementation._source_coordinates
+give_buffer = implementation._give_buffer
+
+
+def counted_read(obj, graph):
+    evaluated = read_source(obj, graph)
+    held.add(id(evaluated[0]))
+    most_held.append(len(held))
+    return evaluated
+
+
+implementation._source_coordinates = counted_read
+implementation._give_buffer = lambda coordinates, count: (held.discard(id(coordinates)), give_buffer(coordinates, count))
+try:
+    assert bpy.ops.object.shape_key_update_linked() == {'FINISHED'}
+finally:
+    implementation._source_coordinates = read_source
+    implementation._give_buffer = give_buffer
+assert len(most_held) == 41 and max(most_held) == 1
+for _obj in bulk:
+    assert bpy.ops.object.shape_key_remove_link(index=1) == {'FINISHED'}
+
+# Nearest Vertex mapping links a source whose vertex order differs from the target.
+for obj in bpy.context.selected_objects:
+    obj.select_set(False)
+shuffled = mesh_object("Shuffled", [(0, 1, 0), (0, 0, 0), (1, 0, 0)])
+shuffled.select_set(True)
+target.select_set(True)
+result = bpy.ops.object.shape_key_join_and_link(vertex_mapping='NEAREST')
+assert result == {'FINISHED'}
+mapped_link = target.shape_key_linker_links[1]
+# The map is saved as hidden point attributes of the target mesh.
+assert mapped_link.vertex_map.startswith("3:3:.skl_map_")
+map_prefix = mapped_link.vertex_map.split(":", 2)[2]
+assert [attribute.name for attribute in target.data.attributes if attribute.name.startswith(map_prefix)] == [
+    map_prefix + "index0"
+]
+shuffled.data.vertices[0].co.y = 1.5
+result = bpy.ops.object.shape_key_update_linked_one(index=1)
+assert result == {'FINISHED'}
+assert tuple(target.data.shape_keys.key_blocks["Shuffled"].data[2].co) == (0.0, 1.5, 0.0)
+# A map read back from the attributes matches the one built.
+implementation._BINDINGS.clear()
+result = bpy.ops.object.shape_key_update_linked_one(index=1)
+assert result == {'FINISHED'}
+assert mapped_link.vertex_map.split(":", 2)[2] == map_prefix
+assert tuple(target.data.shape_keys.key_blocks["Shuffled"].data[2].co) == (0.0, 1.5, 0.0)
+# Choosing another mapping drops the saved map.
+mapped_link.vertex_mapping = 'INDEX'
+assert not mapped_link.vertex_map and not mapped_link.source_fingerprint
+assert not any(attribute.name.startswith(map_prefix) for attribute in target.data.attributes)
+assert bpy.ops.object.shape_key_remove_link(index=1) == {'FINISHED'}
+
+# Surface Binding follows a source with a different resolution through barycentric weights.
+for obj in bpy.context.selected_objects:
+    obj.select_set(False)
+proxy_mesh = bpy.data.meshes.new("ProxyMesh")
+proxy_mesh.from_pydata([(0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0)], [], [(0, 1, 2, 3)])
+proxy = bpy.data.objects.new("Proxy", proxy_mesh)
+bpy.context.scene.collection.objects.link(proxy)
+proxy.select_set(True)
+target.select_set(True)
+result = bpy.ops.object.shape_key_join_and_link(vertex_mapping='SURFACE')
+assert result == {'FINISHED'}
+map_prefix = target.shape_key_linker_links[1].vertex_map.split(":", 2)[2]
+assert target.shape_key_linker_links[1].vertex_map.startswith("4:3:")
+assert {map_prefix + name for name in ("index0", "index1", "index2", "weight", "offset")} <= set(
+    target.data.attributes.keys()
+)
+proxy_mesh.vertices[0].co.z = 1.0
+result = bpy.ops.object.shape_key_update_linked_one(index=1)
+assert result == {'FINISHED'}
+bound = target.data.shape_keys.key_blocks["Proxy"].data
+assert abs(bound[0].co.z - 1.0) < 1e-6 and abs(bound[1].co.z - 0.5) < 1e-6
+assert bpy.ops.object.shape_key_remove_link(index=1) == {'FINISHED'}
+assert not any(attribute.name.startswith(map_prefix) for attribute in target.data.attributes)
+# A malformed saved map is ignored, so the link can still be removed.
+broken_link = target.shape_key_linker_links.add()
+broken_link.vertex_map = "legacy"
+assert bpy.ops.object.shape_key_remove_link(index=len(target.shape_key_linker_links) - 1) == {'FINISHED'}
+assert (target.as_pointer(), 1) not in implementation._LINK_STATUS
+
 bpy.ops.wm.save_as_mainfile(filepath=str(Path(__file__).with_name("shape_key_linker_test.blend")))
 print("SHAPE_KEY_LINKER_TEST_OK")
 
 addon.unregister()
+assert not implementation._BUFFER_POOL
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import math
+import os
+import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -10,10 +15,33 @@ import blf
 import bmesh
 import bpy
 import numpy as np
-from bpy.props import BoolProperty, EnumProperty, FloatVectorProperty, IntProperty, PointerProperty, StringProperty
-from bpy.types import Operator, Panel, PropertyGroup
-
-from .pixel_ops import PixelSelection, as_rgba, clamp_translation, rasterize_uv_selection, translate_pixels
+from bpy.props import (
+    BoolProperty,
+    CollectionProperty,
+    EnumProperty,
+    FloatVectorProperty,
+    IntProperty,
+    PointerProperty,
+    StringProperty,
+)
+from bpy.types import Image, Operator, Panel, PropertyGroup
+
+from .image_io import PngLayout, SaveJob, SaveQueue, read_png_layout
+from .pixel_ops import (
+    PixelSelection,
+    as_rgba,
+    bounding_selection,
+    clamp_shared_translation,
+    clamp_translation,
+    downsample_pixels,
+    proxy_factor,
+    rasterize_uv_regions,
+    scale_translation,
+    sizes_nest,
+    translate_pixels,
+)
+from .timings import PhaseTimer, TimingHistory, format_summary
+from .uv_islands import island_regions
 
 
 PREVIEW_MARKER = ".UVPS_Preview"
@@ -27,39 +55,101 @@ class UVPoint:
 
 
 @dataclass
-class PreviewSession:
+class UVTarget:
+    # One mesh in Edit Mode and the selected UV loops the session moves in it.
     obj: Any
     mesh: Any
     uv_layer_name: str
-    image: Any
+    points: list[UVPoint]
+
+
+@dataclass
+class ProxyLayer:
+    # Source pixels averaged over factor x factor blocks, with the selection rasterized at that size.
+    factor: int
     source_pixels: np.ndarray
     width: int
     height: int
+    selection: PixelSelection
+    result_pixels: np.ndarray | None = None
+
+
+@dataclass
+class ImageLayer:
+    image: Any
+    # None until the image is read on the main thread during preparation.
+    source_pixels: np.ndarray | None
+    width: int
+    height: int
     channels: int
-    uv_points: list[UVPoint]
-    pixel_selection: PixelSelection
-    dx: int = 0
-    dy: int = 0
+    selection: PixelSelection
     result_pixels: np.ndarray | None = None
     preview_image: Any = None
+    proxy: ProxyLayer | None = None
+
+
+@dataclass
+class Preparation:
+    # Worker job returning (regions, selections by image size); later the proxy job, if any.
+    future: Future | None
+    padding: int
+    proxy_size: int = 0
+    regions: list[list[Any]] | None = None
+    # The worker records into this timer, never the session's; it is merged on the main thread.
+    timer: PhaseTimer | None = None
+
+
+@dataclass
+class PreviewSession:
+    targets: list[UVTarget]
+    image: Any
+    width: int
+    height: int
+    # The first layer is always the active image; dx/dy are in its pixels.
+    layers: list[ImageLayer]
+    dx: int = 0
+    dy: int = 0
     image_spaces: list[Any] = field(default_factory=list)
     image_nodes: list[Any] = field(default_factory=list)
+    # Only created when timing is enabled; None keeps the hot paths untouched.
+    timer: PhaseTimer | None = None
+    # Fill used by the preview, so Apply writes exactly what was previewed.
+    fill_mode: str = 'TRANSPARENT'
+    fill_color: tuple[float, float, float, float] = (0.0, 0.0, 0.0, 0.0)
+    # Set while images are read and selections rasterized; layers then clamp with UV bounding boxes.
+    preparation: Preparation | None = None
 
 
 @dataclass
 class ApplyBackup:
-    obj: Any
-    mesh: Any
-    uv_layer_name: str
-    image: Any
-    pixels: np.ndarray
-    uv_points: list[UVPoint]
+    targets: list[UVTarget]
+    width: int
+    height: int
+    images: list[tuple[Any, np.ndarray]]
 
 
 _SESSION: PreviewSession | None = None
 _BACKUP: ApplyBackup | None = None
 _DRAW_HANDLE = None
 _KEYMAP_ITEMS: list[tuple[Any, Any]] = []
+_SAVE_QUEUE = SaveQueue()
+_SAVE_POLL_INTERVAL = 0.1
+_SAVE_RESULT = ""
+# Image pointer -> number of pixel writes by this add-on; tells a background save whether it is still current.
+_IMAGE_EDITS: dict[int, int] = {}
+_TIMINGS = TimingHistory()
+_NO_TIMING = nullcontext()
+# Cursor moves are coalesced and applied at most once per tick of this timer.
+_MOVE_TICK = 1.0 / 60.0
+_PREPARE_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+class UVPS_PG_image_item(PropertyGroup):
+    image: PointerProperty(
+        name="Image",
+        description="Image moved together with the active image",
+        type=Image,
+    )
 
 
 class UVPS_PG_settings(PropertyGroup):
@@ -95,6 +185,47 @@ class UVPS_PG_settings(PropertyGroup):
         description="Temporarily show the preview image in material Image Texture nodes",
         default=True,
     )
+    image_set: EnumProperty(
+        name="Images",
+        description="Which images carry their pixels along with the moved UVs",
+        items=(
+            ('ACTIVE', "Active Image", "Move pixels only in the image shown in the UV Editor"),
+            (
+                'MATERIALS',
+                "Material Images",
+                "Also move pixels in every image used by the edited object's materials",
+            ),
+            ('LIST', "Image List", "Also move pixels in the images listed below"),
+        ),
+        default='ACTIVE',
+    )
+    images: CollectionProperty(type=UVPS_PG_image_item)
+    record_timings: BoolProperty(
+        name="Record Timings",
+        description="Measure each phase of a move and every drag step for performance reports",
+        default=False,
+    )
+    proxy_preview: BoolProperty(
+        name="Proxy Preview",
+        description="Preview large images at reduced resolution and translate full resolution only on Apply",
+        default=False,
+    )
+    proxy_size: IntProperty(
+        name="Proxy Size",
+        description="Largest preview dimension when Proxy Preview is enabled",
+        default=2048,
+        min=256,
+        max=8192,
+        subtype='PIXEL',
+    )
+    background_save: BoolProperty(
+        name="Save in Background",
+        description=(
+            "Write PNG files on a background thread so saving large images does not block Blender. "
+            "The image stays marked as modified, so quitting Blender offers to save it again with the regular writer"
+        ),
+        default=False,
+    )
 
 
 class UVPS_PG_runtime(PropertyGroup):
@@ -104,6 +235,11 @@ class UVPS_PG_runtime(PropertyGroup):
     dy: IntProperty(default=0, options={'SKIP_SAVE'})
     axis: StringProperty(default="FREE", options={'SKIP_SAVE'})
     clamped: BoolProperty(default=False, options={'SKIP_SAVE'})
+    preparing: BoolProperty(default=False, options={'SKIP_SAVE'})
+
+
+def _phase(timer: PhaseTimer | None, name: str):
+    return _NO_TIMING if timer is None else timer.phase(name)
 
 
 def _runtime() -> UVPS_PG_runtime | None:
@@ -131,6 +267,7 @@ def _set_status(
     dy: int = 0,
     axis: str = "FREE",
     clamped: bool = False,
+    preparing: bool = False,
 ) -> None:
     runtime = _runtime()
     if runtime is not None:
@@ -140,6 +277,7 @@ def _set_status(
         runtime.dy = int(dy)
         runtime.axis = axis
         runtime.clamped = bool(clamped)
+        runtime.preparing = bool(preparing)
     _redraw_image_editors()
 
 
@@ -152,7 +290,7 @@ def _source_image(context) -> Any:
     return None
 
 
-def _read_image(image) -> tuple[np.ndarray, int, int, int]:
+def _image_layout(image) -> tuple[int, int, int]:
     width, height = int(image.size[0]), int(image.size[1])
     if width <= 0 or height <= 0:
         raise RuntimeError("The active image has no pixel data")
@@ -163,8 +301,12 @@ def _read_image(image) -> tuple[np.ndarray, int, int, int]:
     channels = total_values // pixel_count
     if not 1 <= channels <= 4:
         raise RuntimeError(f"Unsupported image channel count: {channels}")
+    return width, height, channels
 
-    flat = np.empty(total_values, dtype=np.float32)
+
+def _read_image(image) -> tuple[np.ndarray, int, int, int]:
+    width, height, channels = _image_layout(image)
+    flat = np.empty(width * height * channels, dtype=np.float32)
     image.pixels.foreach_get(flat)
     return flat.reshape((height, width, channels)), width, height, channels
 
@@ -175,21 +317,275 @@ def _write_image(image, pixels: np.ndarray) -> None:
         raise RuntimeError("The image dimensions changed during the operation")
     image.pixels.foreach_set(flat)
     image.update()
+    pointer = image.as_pointer()
+    _IMAGE_EDITS[pointer] = _IMAGE_EDITS.get(pointer, 0) + 1
+
+
+def _background_png_layout(image, filepath: str) -> PngLayout | None:
+    """Return the layout of the PNG a background save rewrites, or None to use Blender's own writer."""
+    if image.source != 'FILE' or image.file_format != 'PNG' or image.packed_file is not None:
+        return None
+    # Float buffers are converted to linear, premultiplied values unless they
+    # hold non-color data, so only those can be written back unchanged.
+    if image.is_float and not (
+        image.colorspace_settings.is_data and image.alpha_mode in {'CHANNEL_PACKED', 'NONE'}
+    ):
+        return None
+    # The file keeps its channel count, bit depth and metadata; files the
+    # writer cannot reproduce, such as palette images, use image.save().
+    return read_png_layout(filepath)
+
+
+def _file_channels(pixels: np.ndarray, channels: int) -> np.ndarray | None:
+    """Select the channels stored in the file from Blender's pixels, or None if they do not map."""
+    if pixels.shape[2] == channels:
+        return pixels
+    if pixels.shape[2] != 4:
+        return None
+    # Blender expands gray and RGB files to RGBA buffers with equal or opaque extra channels.
+    return np.ascontiguousarray(pixels[:, :, {1: [0], 2: [0, 3], 3: [0, 1, 2]}[channels]])
+
+
+def _unchanged_since_save(job: SaveJob) -> bool:
+    """Return whether the written file still matches the image.
+
+    The written buffer is the snapshot taken when saving started, so the file is
+    current unless this add-on wrote pixels since then. Nothing is read back or
+    reloaded on the main thread.
+    """
+    return _IMAGE_EDITS.get(job.key, 0) == job.generation
+
+
+def _poll_save_queue():
+    global _SAVE_RESULT
+    for job in _SAVE_QUEUE.collect_finished():
+        if job.error:
+            _SAVE_RESULT = f"Save failed for '{job.name}': {job.error}"
+            print(f"UV Pixel Sync: {_SAVE_RESULT}")
+            continue
+        if _unchanged_since_save(job):
+            _SAVE_RESULT = f"Saved '{job.name}'"
+        else:
+            _SAVE_RESULT = f"Saved '{job.name}'; it changed while saving, save again to keep the changes"
+    _redraw_image_editors()
+    return _SAVE_POLL_INTERVAL if _SAVE_QUEUE.pending() else None
 
 
-def _selected_uv_geometry(context) -> tuple[Any, Any, str, list[UVPoint], list[list[tuple[float, float]]]]:
-    obj = context.edit_object
-    if obj is None or obj.type != 'MESH':
-        raise RuntimeError("Enter Mesh Edit Mode first")
+def _node_tree_images(tree, seen_trees: set[int]):
+    if tree is None or tree.as_pointer() in seen_trees:
+        return
+    seen_trees.add(tree.as_pointer())
+    for node in tree.nodes:
+        if getattr(node, "bl_idname", "") == "ShaderNodeTexImage" and getattr(node, "image", None) is not None:
+            yield node.image
+        elif getattr(node, "bl_idname", "") == "ShaderNodeGroup":
+            yield from _node_tree_images(getattr(node, "node_tree", None), seen_trees)
+
+
+def _material_images(objects) -> list[Any]:
+    images: list[Any] = []
+    seen_trees: set[int] = set()
+    for obj in objects:
+        for slot in obj.material_slots:
+            material = slot.material
+            if material is not None:
+                images.extend(_node_tree_images(material.node_tree, seen_trees))
+    return images
+
+
+def _texture_set(objects, image, settings: UVPS_PG_settings) -> tuple[list[Any], int, int]:
+    """Return the images moved together, active image first, and how many were skipped.
+
+    The counts are images without editable pixel data and images whose size does
+    not nest with the set's, which would snap every move to a huge step.
+    """
+    if settings.image_set == 'MATERIALS':
+        candidates = _material_images(objects)
+    elif settings.image_set == 'LIST':
+        candidates = [item.image for item in settings.images if item.image is not None]
+    else:
+        candidates = []
+
+    images = [image]
+    seen = {image.as_pointer()}
+    skipped = mismatched = 0
+    for candidate in candidates:
+        if candidate.as_pointer() in seen or candidate.name.endswith(PREVIEW_MARKER):
+            continue
+        seen.add(candidate.as_pointer())
+        if candidate.source == 'TILED' or candidate.size[0] <= 0 or candidate.size[1] <= 0:
+            skipped += 1
+            continue
+        size = tuple(candidate.size)
+        if not all(sizes_nest(size, tuple(accepted.size)) for accepted in images):
+            mismatched += 1
+            continue
+        images.append(candidate)
+    return images, skipped, mismatched
+
+
+def _prepare_selections(
+    face_sizes: list[int],
+    loop_vertices: list[int],
+    loop_uvs: list[tuple[float, float]],
+    sizes: list[tuple[int, int]],
+    padding: int,
+    timer: PhaseTimer | None = None,
+) -> tuple[list[list[Any]], dict[tuple[int, int], PixelSelection]]:
+    """Extract island outlines and rasterize them once per distinct resolution; NumPy only."""
+    with _phase(timer, "islands"):
+        regions = island_regions(face_sizes, loop_vertices, loop_uvs)
+    base_width, base_height = sizes[0]
+    selections: dict[tuple[int, int], PixelSelection] = {}
+    for width, height in sizes:
+        if (width, height) in selections:
+            continue
+        # Padding is given in pixels of the active image.
+        scale = max(width / base_width, height / base_height)
+        with _phase(timer, "rasterize"):
+            selections[(width, height)] = rasterize_uv_regions(regions, width, height, math.ceil(padding * scale))
+    return regions, selections
+
+
+def _prepare_executor() -> ThreadPoolExecutor:
+    global _PREPARE_EXECUTOR
+    if _PREPARE_EXECUTOR is None:
+        _PREPARE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="UVPS prepare")
+    return _PREPARE_EXECUTOR
+
+
+def _add_proxies(
+    layers: list[ImageLayer],
+    regions,
+    padding: int,
+    max_size: int,
+    timer: PhaseTimer | None = None,
+) -> None:
+    """Give each layer a downsampled copy and selection for the preview; Apply still uses full resolution."""
+    selections: dict[tuple[int, int, int], PixelSelection] = {}
+    base_width, base_height = layers[0].width, layers[0].height
+    for layer in layers:
+        factor = proxy_factor(layer.width, layer.height, max_size)
+        if factor == 1:
+            # Already small enough: the preview shares the full-resolution pixels and selection.
+            layer.proxy = ProxyLayer(1, layer.source_pixels, layer.width, layer.height, layer.selection)
+            continue
+        width = math.ceil(layer.width / factor)
+        height = math.ceil(layer.height / factor)
+        key = (layer.width, layer.height, factor)
+        if key not in selections:
+            scale = max(layer.width / base_width, layer.height / base_height)
+            with _phase(timer, "rasterize_proxy"):
+                selections[key] = rasterize_uv_regions(regions, width, height, math.ceil(padding * scale / factor))
+        with _phase(timer, "downsample"):
+            pixels = downsample_pixels(layer.source_pixels, factor)
+        layer.proxy = ProxyLayer(factor, pixels, width, height, selections[key])
+
+
+def _needs_proxy(layers: list[ImageLayer], max_size: int) -> bool:
+    return any(proxy_factor(layer.width, layer.height, max_size) > 1 for layer in layers)
+
+
+def _uses_proxy(session: PreviewSession) -> bool:
+    return any(layer.proxy is not None for layer in session.layers)
+
+
+def _clamp_session(session: PreviewSession, dx: int, dy: int) -> tuple[int, int, bool]:
+    return clamp_shared_translation(
+        [(layer.selection, layer.width, layer.height) for layer in session.layers],
+        dx,
+        dy,
+        session.width,
+        session.height,
+    )
+
+
+def _translate_layers(session: PreviewSession, fill_mode: str, fill_color) -> None:
+    fill_color = tuple(fill_color)
+
+    def translate(layer: ImageLayer) -> None:
+        dx, dy = scale_translation(
+            session.dx,
+            session.dy,
+            (session.width, session.height),
+            (layer.width, layer.height),
+        )
+        layer.result_pixels = translate_pixels(
+            layer.source_pixels,
+            layer.selection,
+            dx,
+            dy,
+            fill_mode=fill_mode,
+            fill_color=fill_color,
+        )
 
-    mesh = obj.data
-    bm = bmesh.from_edit_mesh(mesh)
-    bm.faces.ensure_lookup_table()
-    bm.faces.index_update()
-    uv_layer = bm.loops.layers.uv.active
-    if uv_layer is None:
-        raise RuntimeError("The mesh has no active UV map")
+    if len(session.layers) == 1:
+        translate(session.layers[0])
+        return
+    # translate_pixels only touches NumPy arrays, so layers can run in parallel.
+    with ThreadPoolExecutor(max_workers=min(len(session.layers), os.cpu_count() or 1)) as pool:
+        list(pool.map(translate, session.layers))
+
+
+def _translate_proxies(session: PreviewSession) -> None:
+    """Move each proxy by the full-resolution offset rounded to proxy pixels."""
+    for layer in session.layers:
+        proxy = layer.proxy
+        dx, dy = scale_translation(
+            session.dx,
+            session.dy,
+            (session.width, session.height),
+            (layer.width, layer.height),
+        )
+        # Rounding can push an edge-touching selection one proxy pixel out of the image.
+        dx, dy, _ = clamp_translation(
+            proxy.selection,
+            round(dx / proxy.factor),
+            round(dy / proxy.factor),
+            proxy.width,
+            proxy.height,
+        )
+        proxy.result_pixels = translate_pixels(
+            proxy.source_pixels,
+            proxy.selection,
+            dx,
+            dy,
+            fill_mode=session.fill_mode,
+            fill_color=session.fill_color,
+        )
 
+
+def _write_layers(layers: list[ImageLayer]) -> None:
+    """Write every layer's result or none of them."""
+    written: list[ImageLayer] = []
+    try:
+        for layer in layers:
+            _write_image(layer.image, layer.result_pixels)
+            written.append(layer)
+    except Exception:
+        for layer in written:
+            try:
+                _write_image(layer.image, layer.source_pixels)
+            except Exception:
+                traceback.print_exc()
+        raise
+
+
+def _edit_meshes(context) -> list[Any]:
+    """Return every mesh object in Edit Mode with unique data, the active one first."""
+    active = context.edit_object
+    objects = [
+        obj
+        for obj in getattr(context, "objects_in_mode_unique_data", None) or ([active] if active else [])
+        if obj is not None and obj.type == 'MESH'
+    ]
+    if active is not None and active in objects:
+        objects.remove(active)
+        objects.insert(0, active)
+    return objects
+
+
+def _selected_faces(bm, uv_layer) -> list[Any]:
     visible_faces = [face for face in bm.faces if not face.hide and face.loops]
     if visible_faces and hasattr(visible_faces[0], "uv_select"):
         # Blender 5.x stores UV selection on BMesh faces/loops directly.
@@ -197,76 +593,106 @@ def _selected_uv_geometry(context) -> tuple[Any, Any, str, list[UVPoint], list[l
     else:
         # Blender 4.5 exposes it through the BMLoopUV custom-data value.
         uv_selected = [face for face in visible_faces if all(loop[uv_layer].select for loop in face.loops)]
-    selected_faces = uv_selected or [face for face in visible_faces if face.select]
-    if not selected_faces:
-        raise RuntimeError("Select one or more complete UV faces or islands")
+    return uv_selected or [face for face in visible_faces if face.select]
 
-    points: list[UVPoint] = []
-    polygons: list[list[tuple[float, float]]] = []
-    for face in selected_faces:
-        polygon: list[tuple[float, float]] = []
-        for loop_index, loop in enumerate(face.loops):
-            uv = loop[uv_layer].uv
-            coordinates = (float(uv.x), float(uv.y))
-            points.append(UVPoint(face.index, loop_index, coordinates))
-            polygon.append(coordinates)
-        polygons.append(polygon)
-    return obj, mesh, uv_layer.name, points, polygons
-
-
-def _write_uv_points(
-    obj,
-    mesh,
-    uv_layer_name: str,
-    points: list[UVPoint],
-    dx: int,
-    dy: int,
-    width: int,
-    height: int,
-) -> None:
-    if obj is None or obj.name not in bpy.data.objects or obj.mode != 'EDIT':
-        raise RuntimeError("Keep the source mesh in Edit Mode")
 
-    bm = bmesh.from_edit_mesh(mesh)
-    bm.faces.ensure_lookup_table()
-    uv_layer = bm.loops.layers.uv.get(uv_layer_name)
-    if uv_layer is None:
-        raise RuntimeError("The UV map used by this operation no longer exists")
+def _selected_uv_loops(context) -> tuple[list[UVTarget], list[int], list[int], list[tuple[float, float]]]:
+    """Collect the selected UVs of every mesh in Edit Mode in one pass.
+
+    Returns one target per mesh plus per-face loop data for island
+    extraction. Vertex indices are offset per mesh so islands never join
+    across objects.
+    """
+    objects = _edit_meshes(context)
+    if not objects:
+        raise RuntimeError("Enter Mesh Edit Mode first")
+
+    targets: list[UVTarget] = []
+    face_sizes: list[int] = []
+    loop_vertices: list[int] = []
+    loop_uvs: list[tuple[float, float]] = []
+    vertex_offset = 0
+    missing_uv_map = False
+    for obj in objects:
+        mesh = obj.data
+        bm = bmesh.from_edit_mesh(mesh)
+        bm.faces.ensure_lookup_table()
+        bm.faces.index_update()
+        bm.verts.index_update()
+        uv_layer = bm.loops.layers.uv.active
+        if uv_layer is None:
+            missing_uv_map = True
+            continue
+
+        points: list[UVPoint] = []
+        for face in _selected_faces(bm, uv_layer):
+            face_sizes.append(len(face.loops))
+            for loop_index, loop in enumerate(face.loops):
+                uv = loop[uv_layer].uv
+                coordinates = (float(uv.x), float(uv.y))
+                points.append(UVPoint(face.index, loop_index, coordinates))
+                loop_vertices.append(vertex_offset + loop.vert.index)
+                loop_uvs.append(coordinates)
+        vertex_offset += len(bm.verts)
+        if points:
+            targets.append(UVTarget(obj, mesh, uv_layer.name, points))
+
+    if not targets:
+        if missing_uv_map:
+            raise RuntimeError("The mesh has no active UV map")
+        raise RuntimeError("Select one or more complete UV faces or islands")
+    return targets, face_sizes, loop_vertices, loop_uvs
+
 
+def _write_uv_points(targets: list[UVTarget], dx: int, dy: int, width: int, height: int) -> None:
+    """Offset every target's captured UVs, with one mesh update per object."""
     offset_u = int(dx) / int(width)
     offset_v = int(dy) / int(height)
-    for point in points:
-        if point.face_index >= len(bm.faces):
-            raise RuntimeError("Mesh topology changed during the operation")
-        loops = bm.faces[point.face_index].loops
-        if point.loop_index >= len(loops):
-            raise RuntimeError("Mesh topology changed during the operation")
-        loops[point.loop_index][uv_layer].uv = (
-            point.uv[0] + offset_u,
-            point.uv[1] + offset_v,
-        )
-    bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
+    for target in targets:
+        obj = target.obj
+        if obj is None or obj.name not in bpy.data.objects or obj.mode != 'EDIT':
+            raise RuntimeError("Keep the source meshes in Edit Mode")
+
+        bm = bmesh.from_edit_mesh(target.mesh)
+        bm.faces.ensure_lookup_table()
+        uv_layer = bm.loops.layers.uv.get(target.uv_layer_name)
+        if uv_layer is None:
+            raise RuntimeError("The UV map used by this operation no longer exists")
+
+        faces = bm.faces
+        face_count = len(faces)
+        for point in target.points:
+            if point.face_index >= face_count:
+                raise RuntimeError("Mesh topology changed during the operation")
+            loops = faces[point.face_index].loops
+            if point.loop_index >= len(loops):
+                raise RuntimeError("Mesh topology changed during the operation")
+            loops[point.loop_index][uv_layer].uv = (
+                point.uv[0] + offset_u,
+                point.uv[1] + offset_v,
+            )
+        bmesh.update_edit_mesh(target.mesh, loop_triangles=False, destructive=False)
 
 
-def _make_preview_image(session: PreviewSession):
-    name = f"{session.image.name}{PREVIEW_MARKER}"
+def _make_preview_image(layer: ImageLayer, pixels: np.ndarray):
+    name = f"{layer.image.name}{PREVIEW_MARKER}"
     existing = bpy.data.images.get(name)
     if existing is not None:
         bpy.data.images.remove(existing)
 
     preview = bpy.data.images.new(
         name,
-        width=session.width,
-        height=session.height,
+        width=pixels.shape[1],
+        height=pixels.shape[0],
         alpha=True,
-        float_buffer=bool(getattr(session.image, "is_float", False)),
+        float_buffer=bool(getattr(layer.image, "is_float", False)),
     )
     try:
-        preview.colorspace_settings.name = session.image.colorspace_settings.name
-        preview.alpha_mode = session.image.alpha_mode
+        preview.colorspace_settings.name = layer.image.colorspace_settings.name
+        preview.alpha_mode = layer.image.alpha_mode
     except Exception:
         pass
-    preview.pixels.foreach_set(np.ascontiguousarray(as_rgba(session.result_pixels)).reshape(-1))
+    preview.pixels.foreach_set(np.ascontiguousarray(as_rgba(pixels)).reshape(-1))
     preview.update()
     return preview
 
@@ -282,7 +708,16 @@ def _all_node_trees():
             yield tree
 
 
+def _preview_lookup(session: PreviewSession) -> dict[int, Any]:
+    return {
+        layer.image.as_pointer(): layer.preview_image
+        for layer in session.layers
+        if layer.preview_image is not None
+    }
+
+
 def _show_preview(session: PreviewSession, settings: UVPS_PG_settings) -> None:
+    previews = _preview_lookup(session)
     wm = bpy.context.window_manager
     for window in wm.windows:
         if window.screen is None:
@@ -291,43 +726,60 @@ def _show_preview(session: PreviewSession, settings: UVPS_PG_settings) -> None:
             if area.type != 'IMAGE_EDITOR':
                 continue
             space = area.spaces.active
-            if getattr(space, "image", None) == session.image:
+            image = getattr(space, "image", None)
+            if image is not None and image.as_pointer() in previews:
                 session.image_spaces.append(space)
-                space.image = session.preview_image
+                space.image = previews[image.as_pointer()]
 
     if settings.material_preview:
         for tree in _all_node_trees():
             for node in tree.nodes:
-                if getattr(node, "bl_idname", "") == "ShaderNodeTexImage" and getattr(node, "image", None) == session.image:
+                if getattr(node, "bl_idname", "") != "ShaderNodeTexImage":
+                    continue
+                image = getattr(node, "image", None)
+                if image is not None and image.as_pointer() in previews:
                     session.image_nodes.append(node)
-                    node.image = session.preview_image
+                    node.image = previews[image.as_pointer()]
 
 
 def _restore_image_references(session: PreviewSession) -> None:
+    originals = {
+        layer.preview_image.as_pointer(): layer.image
+        for layer in session.layers
+        if layer.preview_image is not None
+    }
     for space in session.image_spaces:
         try:
-            if space and space.image == session.preview_image:
-                space.image = session.image
+            if space and space.image is not None and space.image.as_pointer() in originals:
+                space.image = originals[space.image.as_pointer()]
         except ReferenceError:
             pass
     for node in session.image_nodes:
         try:
-            if node and node.image == session.preview_image:
-                node.image = session.image
+            if node and node.image is not None and node.image.as_pointer() in originals:
+                node.image = originals[node.image.as_pointer()]
         except ReferenceError:
             pass
     session.image_spaces.clear()
     session.image_nodes.clear()
 
 
-def _delete_preview_image(session: PreviewSession) -> None:
-    preview = session.preview_image
-    session.preview_image = None
-    if preview is not None:
-        try:
-            bpy.data.images.remove(preview)
-        except (ReferenceError, RuntimeError):
-            pass
+def _delete_preview_images(session: PreviewSession) -> None:
+    for layer in session.layers:
+        preview = layer.preview_image
+        layer.preview_image = None
+        if preview is not None:
+            try:
+                bpy.data.images.remove(preview)
+            except (ReferenceError, RuntimeError):
+                pass
+
+
+def _session_ready(session: PreviewSession) -> bool:
+    return all(
+        layer.result_pixels is not None or (layer.proxy is not None and layer.proxy.result_pixels is not None)
+        for layer in session.layers
+    )
 
 
 def _cancel_session(message="Preview cancelled") -> None:
@@ -336,24 +788,213 @@ def _cancel_session(message="Preview cancelled") -> None:
     if session is None:
         return
     try:
-        _write_uv_points(
-            session.obj,
-            session.mesh,
-            session.uv_layer_name,
-            session.uv_points,
-            0,
-            0,
-            session.width,
-            session.height,
-        )
+        _write_uv_points(session.targets, 0, 0, session.width, session.height)
     except Exception:
         traceback.print_exc()
     _restore_image_references(session)
-    _delete_preview_image(session)
+    _delete_preview_images(session)
     _SESSION = None
     _set_status("IDLE", message)
 
 
+def _begin_session(context, image) -> tuple[PreviewSession, int, int]:
+    """Capture the selected UVs and start preparing the texture set; return the session and skipped image counts.
+
+    Only cheap main-thread work happens here. Layers clamp with UV bounding
+    boxes until ``_advance_preparation`` has read the pixels and the worker
+    has rasterized the exact selections.
+    """
+    settings = context.scene.uv_pixel_sync_settings
+    timer = PhaseTimer(image.name) if settings.record_timings else None
+    if timer is not None:
+        _TIMINGS.add(timer)
+    with _phase(timer, "uv_geometry"):
+        targets, face_sizes, loop_vertices, loop_uvs = _selected_uv_loops(context)
+    images, skipped, mismatched = _texture_set([target.obj for target in targets], image, settings)
+    layers: list[ImageLayer] = []
+    base_width = base_height = 0
+    for candidate in images:
+        width, height, channels = _image_layout(candidate)
+        if not layers:
+            base_width, base_height = width, height
+        padding = math.ceil(settings.padding * max(width / base_width, height / base_height))
+        bounds = bounding_selection(loop_uvs, width, height, padding)
+        layers.append(ImageLayer(candidate, None, width, height, channels, bounds))
+
+    # The HUD reads the session timer while the worker runs, so the worker gets its own.
+    worker_timer = PhaseTimer() if timer is not None else None
+    future = _prepare_executor().submit(
+        _prepare_selections,
+        face_sizes,
+        loop_vertices,
+        loop_uvs,
+        [(layer.width, layer.height) for layer in layers],
+        settings.padding,
+        worker_timer,
+    )
+    session = PreviewSession(
+        targets=targets,
+        image=image,
+        width=layers[0].width,
+        height=layers[0].height,
+        layers=layers,
+        timer=timer,
+        preparation=Preparation(
+            future=future,
+            padding=settings.padding,
+            proxy_size=settings.proxy_size if settings.proxy_preview else 0,
+            timer=worker_timer,
+        ),
+    )
+    return session, skipped, mismatched
+
+
+def _advance_preparation(session: PreviewSession, *, wait: bool = False) -> bool:
+    """Continue preparing the session; return True once every layer has pixels and an exact selection.
+
+    Pixels are read on the main thread, one image per call unless ``wait`` is
+    set, so the modal stays responsive while the worker rasterizes.
+    """
+    preparation = session.preparation
+    if preparation is None:
+        return True
+    for layer in session.layers:
+        if layer.source_pixels is None:
+            with _phase(session.timer, "read_image"):
+                layer.source_pixels = _read_image(layer.image)[0]
+            if not wait:
+                return False
+
+    future = preparation.future
+    if future is not None:
+        if not wait and not future.done():
+            return False
+        result = future.result()
+        preparation.future = None
+        if preparation.timer is not None:
+            # The worker is idle now, so its phases can be read on the main thread.
+            session.timer.merge(preparation.timer)
+            preparation.timer = PhaseTimer()
+        if preparation.regions is None:
+            preparation.regions, selections = result
+            for layer in session.layers:
+                layer.selection = selections[(layer.width, layer.height)]
+            # Images within the proxy size are previewed at full resolution without proxies.
+            if preparation.proxy_size and _needs_proxy(session.layers, preparation.proxy_size):
+                preparation.future = _prepare_executor().submit(
+                    _add_proxies,
+                    session.layers,
+                    preparation.regions,
+                    preparation.padding,
+                    preparation.proxy_size,
+                    preparation.timer,
+                )
+                return _advance_preparation(session, wait=wait)
+
+    session.preparation = None
+    return True
+
+
+def _abandon_preparation(session: PreviewSession) -> None:
+    preparation = session.preparation
+    session.preparation = None
+    if preparation is not None and preparation.future is not None:
+        preparation.future.cancel()
+
+
+def _move_session(session: PreviewSession, dx: int, dy: int) -> tuple[int, int, bool]:
+    """Snap and clamp a requested move, then write the UVs if the offset changed."""
+    dx, dy, was_clamped = _clamp_session(session, dx, dy)
+    if (dx, dy) != (session.dx, session.dy):
+        _write_uv_points(session.targets, dx, dy, session.width, session.height)
+        session.dx, session.dy = dx, dy
+    return dx, dy, was_clamped
+
+
+def _build_preview(session: PreviewSession, settings: UVPS_PG_settings) -> None:
+    """Translate every layer and show the results in place of the original images."""
+    session.fill_mode = settings.fill_mode
+    session.fill_color = tuple(settings.fill_color)
+    if _uses_proxy(session):
+        _update_proxy_preview(session, settings)
+        return
+    try:
+        with _phase(session.timer, "translate"):
+            _translate_layers(session, session.fill_mode, session.fill_color)
+        with _phase(session.timer, "make_preview"):
+            for layer in session.layers:
+                layer.preview_image = _make_preview_image(layer, layer.result_pixels)
+        with _phase(session.timer, "show_preview"):
+            _show_preview(session, settings)
+    except Exception:
+        _restore_image_references(session)
+        _delete_preview_images(session)
+        raise
+
+
+def _update_proxy_preview(session: PreviewSession, settings: UVPS_PG_settings) -> None:
+    """Show the proxies at the session offset, creating the preview images on first use."""
+    try:
+        with _phase(session.timer, "translate_proxy"):
+            _translate_proxies(session)
+        if session.layers[0].preview_image is None:
+            with _phase(session.timer, "make_preview"):
+                for layer in session.layers:
+                    layer.preview_image = _make_preview_image(layer, layer.proxy.result_pixels)
+            with _phase(session.timer, "show_preview"):
+                _show_preview(session, settings)
+            return
+        with _phase(session.timer, "update_preview"):
+            for layer in session.layers:
+                preview = layer.preview_image
+                preview.pixels.foreach_set(np.ascontiguousarray(as_rgba(layer.proxy.result_pixels)).reshape(-1))
+                preview.update()
+    except Exception:
+        _restore_image_references(session)
+        _delete_preview_images(session)
+        raise
+
+
+def _prepare_step(session: PreviewSession, settings: UVPS_PG_settings, *, wait: bool = False) -> bool:
+    """Advance background preparation; returns True on the call that completes it."""
+    if session.preparation is None or not _advance_preparation(session, wait=wait):
+        return False
+    if _uses_proxy(session):
+        # Proxies are cheap enough to follow the drag.
+        session.fill_mode = settings.fill_mode
+        session.fill_color = tuple(settings.fill_color)
+        _update_proxy_preview(session, settings)
+    return True
+
+
+def _drag_to(session: PreviewSession, settings: UVPS_PG_settings, dx: int, dy: int, axis: str) -> None:
+    """One modal update: move to a requested offset, refresh a shown proxy preview and the status."""
+    start = time.perf_counter() if session.timer is not None else 0.0
+    previous = (session.dx, session.dy)
+    dx, dy, was_clamped = _move_session(session, dx, dy)
+    if (dx, dy) != previous and session.layers[0].preview_image is not None:
+        _update_proxy_preview(session, settings)
+    _set_status(
+        "MOVING",
+        "Move selected UVs",
+        dx=dx,
+        dy=dy,
+        axis=axis,
+        clamped=was_clamped,
+        preparing=session.preparation is not None,
+    )
+    if session.timer is not None:
+        session.timer.add_step(time.perf_counter() - start)
+
+
+def _finish_session(session: PreviewSession, settings: UVPS_PG_settings, axis: str) -> None:
+    """Build the preview of a finished drag and make it the pending session."""
+    global _SESSION
+    _build_preview(session, settings)
+    _SESSION = session
+    _set_status("PREVIEW", "Preview ready", dx=session.dx, dy=session.dy, axis=axis)
+
+
 def _movement_name(dx: int, dy: int, axis: str) -> str:
     if axis == 'X' or (dx and not dy):
         return "HORIZONTAL"
@@ -374,10 +1015,14 @@ def _draw_hud() -> None:
         title = f"PIXEL SYNC · {_movement_name(runtime.dx, runtime.dy, runtime.axis)}"
         detail = f"X {runtime.dx:+d} px    Y {runtime.dy:+d} px"
         note = "Image boundary reached" if runtime.clamped else "Whole-pixel movement"
+        if runtime.preparing:
+            note = f"{note} · preparing pixels"
     elif runtime.state == "PREVIEW":
         title = "PREVIEW · ORIGINAL IMAGE UNCHANGED"
         detail = f"X {runtime.dx:+d} px    Y {runtime.dy:+d} px"
         note = "Use Apply or Cancel in the sidebar"
+        if _SESSION is not None and _uses_proxy(_SESSION):
+            note = "Proxy preview · Apply writes full resolution"
     else:
         title = runtime.message
         detail = ""
@@ -400,6 +1045,14 @@ def _draw_hud() -> None:
         blf.position(font_id, x, y - 42, 0)
         blf.draw(font_id, note)
 
+    settings = getattr(context.scene, "uv_pixel_sync_settings", None)
+    timer = _TIMINGS.latest() if settings is not None and settings.record_timings else None
+    if timer is not None and runtime.state in {"MOVING", "PREVIEW"}:
+        blf.color(font_id, 0.55, 0.8, 0.55, 1.0)
+        for index, line in enumerate(format_summary(timer.summary())[:4]):
+            blf.position(font_id, x, y - 62 - index * 18, 0)
+            blf.draw(font_id, line)
+
 
 class UVPS_OT_move(Operator):
     bl_idname = "uv.uv_pixel_sync_move"
@@ -410,6 +1063,10 @@ class UVPS_OT_move(Operator):
     _session: PreviewSession | None = None
     _start_view = (0.0, 0.0)
     _axis = "FREE"
+    _timer = None
+    # Latest (mouse_region_x, mouse_region_y, shift) not yet applied to the UVs.
+    _pending: tuple[int, int, bool] | None = None
+    _last_cursor: tuple[int, int, bool] = (0, 0, False)
 
     @classmethod
     def poll(cls, context):
@@ -430,113 +1087,96 @@ class UVPS_OT_move(Operator):
             return {'CANCELLED'}
 
         try:
-            obj, mesh, uv_layer_name, uv_points, polygons = _selected_uv_geometry(context)
-            pixels, width, height, channels = _read_image(image)
-            settings = context.scene.uv_pixel_sync_settings
-            selection = rasterize_uv_selection(polygons, width, height, settings.padding)
+            # Pixels and exact selections are prepared while the drag is already running.
+            self._session, skipped, mismatched = _begin_session(context, image)
         except (RuntimeError, ValueError) as error:
             self.report({'ERROR'}, str(error))
             return {'CANCELLED'}
+        if skipped:
+            self.report({'WARNING'}, f"Skipped {skipped} image(s) without editable pixel data")
+        if mismatched:
+            self.report(
+                {'WARNING'},
+                f"Skipped {mismatched} image(s) whose resolution does not divide evenly with '{image.name}'",
+            )
 
-        self._session = PreviewSession(
-            obj=obj,
-            mesh=mesh,
-            uv_layer_name=uv_layer_name,
-            image=image,
-            source_pixels=pixels,
-            width=width,
-            height=height,
-            channels=channels,
-            uv_points=uv_points,
-            pixel_selection=selection,
-        )
         self._start_view = context.region.view2d.region_to_view(event.mouse_region_x, event.mouse_region_y)
         self._axis = "FREE"
+        self._pending = None
+        self._last_cursor = (event.mouse_region_x, event.mouse_region_y, event.shift)
+        self._timer = context.window_manager.event_timer_add(_MOVE_TICK, window=context.window)
         context.window.cursor_modal_set('SCROLL_XY')
         context.window_manager.modal_handler_add(self)
-        _set_status("MOVING", "Move selected UVs", axis=self._axis)
+        _set_status("MOVING", "Move selected UVs", axis=self._axis, preparing=True)
         return {'RUNNING_MODAL'}
 
-    def _update(self, context, event) -> None:
+    def _update(self, context, cursor: tuple[int, int, bool]) -> None:
         session = self._session
         if session is None:
             return
-        current = context.region.view2d.region_to_view(event.mouse_region_x, event.mouse_region_y)
-        factor = 0.1 if event.shift else 1.0
+        mouse_x, mouse_y, shift = cursor
+        current = context.region.view2d.region_to_view(mouse_x, mouse_y)
+        factor = 0.1 if shift else 1.0
         dx = round((current[0] - self._start_view[0]) * session.width * factor)
         dy = round((current[1] - self._start_view[1]) * session.height * factor)
         if self._axis == 'X':
             dy = 0
         elif self._axis == 'Y':
             dx = 0
-        dx, dy, was_clamped = clamp_translation(
-            session.pixel_selection,
-            dx,
-            dy,
-            session.width,
-            session.height,
-        )
-        if (dx, dy) != (session.dx, session.dy):
-            _write_uv_points(
-                session.obj,
-                session.mesh,
-                session.uv_layer_name,
-                session.uv_points,
-                dx,
-                dy,
-                session.width,
-                session.height,
-            )
-            session.dx, session.dy = dx, dy
-        _set_status(
-            "MOVING",
-            "Move selected UVs",
-            dx=dx,
-            dy=dy,
-            axis=self._axis,
-            clamped=was_clamped,
-        )
+        _drag_to(session, context.scene.uv_pixel_sync_settings, dx, dy, self._axis)
+
+    def _prepare(self, context, *, wait: bool = False) -> None:
+        """Advance background preparation and switch to the exact selections once it is done."""
+        session = self._session
+        if session is None or not _prepare_step(session, context.scene.uv_pixel_sync_settings, wait=wait):
+            return
+        # Exact bounds are never tighter than the bounding boxes; re-apply the cursor against them.
+        if self._pending is None:
+            self._pending = self._last_cursor
+
+    def _flush(self, context) -> None:
+        """Apply the latest coalesced cursor position, if any."""
+        cursor = self._pending
+        if cursor is not None:
+            self._pending = None
+            self._last_cursor = cursor
+            self._update(context, cursor)
+
+    def _end_modal(self, context) -> None:
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        self._pending = None
+        context.window.cursor_modal_restore()
 
     def _cancel(self, context):
         if self._session is not None:
             try:
-                _write_uv_points(
-                    self._session.obj,
-                    self._session.mesh,
-                    self._session.uv_layer_name,
-                    self._session.uv_points,
-                    0,
-                    0,
-                    self._session.width,
-                    self._session.height,
-                )
+                _write_uv_points(self._session.targets, 0, 0, self._session.width, self._session.height)
             except Exception:
                 traceback.print_exc()
-        context.window.cursor_modal_restore()
+            _abandon_preparation(self._session)
+            _restore_image_references(self._session)
+            _delete_preview_images(self._session)
+        self._end_modal(context)
         self._session = None
         _set_status("IDLE", "Move cancelled")
         return {'CANCELLED'}
 
     def _finish(self, context):
-        global _SESSION
         session = self._session
+        try:
+            self._prepare(context, wait=True)
+            self._flush(context)
+        except Exception as error:
+            traceback.print_exc()
+            self.report({'ERROR'}, str(error))
+            return self._cancel(context)
         if session is None or (session.dx == 0 and session.dy == 0):
             return self._cancel(context)
         try:
-            settings = context.scene.uv_pixel_sync_settings
-            session.result_pixels = translate_pixels(
-                session.source_pixels,
-                session.pixel_selection,
-                session.dx,
-                session.dy,
-                fill_mode=settings.fill_mode,
-                fill_color=settings.fill_color,
-            )
-            session.preview_image = _make_preview_image(session)
-            _SESSION = session
-            _show_preview(session, settings)
-            _set_status("PREVIEW", "Preview ready", dx=session.dx, dy=session.dy, axis=self._axis)
-            context.window.cursor_modal_restore()
+            _finish_session(session, context.scene.uv_pixel_sync_settings, self._axis)
+            self._end_modal(context)
             self._session = None
             return {'FINISHED'}
         except Exception as error:
@@ -546,20 +1186,33 @@ class UVPS_OT_move(Operator):
 
     def modal(self, context, event):
         if self._session is None:
-            context.window.cursor_modal_restore()
+            self._end_modal(context)
             return {'CANCELLED'}
         if event.type == 'MOUSEMOVE':
+            # Tablets can send hundreds of moves per second; keep only the latest.
+            self._pending = (event.mouse_region_x, event.mouse_region_y, event.shift)
+            return {'RUNNING_MODAL'}
+        if event.type == 'TIMER':
             try:
-                self._update(context, event)
+                self._prepare(context)
+                self._flush(context)
             except Exception as error:
                 self.report({'ERROR'}, str(error))
                 return self._cancel(context)
             return {'RUNNING_MODAL'}
         if event.type in {'X', 'Y'} and event.value == 'PRESS':
             self._axis = event.type if self._axis != event.type else "FREE"
-            self._update(context, event)
+            if self._pending is None:
+                self._pending = self._last_cursor
+            self._flush(context)
             return {'RUNNING_MODAL'}
         if event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER'} and event.value in {'PRESS', 'RELEASE'}:
+            # Commit the exact last cursor position, not the last applied tick.
+            try:
+                self._flush(context)
+            except Exception as error:
+                self.report({'ERROR'}, str(error))
+                return self._cancel(context)
             if event.type != 'LEFTMOUSE' or (self._session.dx, self._session.dy) != (0, 0):
                 return self._finish(context)
         if event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS':
@@ -575,24 +1228,27 @@ class UVPS_OT_apply(Operator):
 
     @classmethod
     def poll(cls, context):
-        return _SESSION is not None and _SESSION.result_pixels is not None
+        return _SESSION is not None and _session_ready(_SESSION)
 
     def execute(self, context):
         global _SESSION, _BACKUP
         session = _SESSION
-        if session is None or session.result_pixels is None:
+        if session is None or not _session_ready(session):
             return {'CANCELLED'}
         try:
-            _write_image(session.image, session.result_pixels)
+            if any(layer.result_pixels is None for layer in session.layers):
+                # Proxy previews defer the full-resolution translation to Apply.
+                with _phase(session.timer, "translate"):
+                    _translate_layers(session, session.fill_mode, session.fill_color)
+            with _phase(session.timer, "write_image"):
+                _write_layers(session.layers)
             _restore_image_references(session)
-            _delete_preview_image(session)
+            _delete_preview_images(session)
             _BACKUP = ApplyBackup(
-                obj=session.obj,
-                mesh=session.mesh,
-                uv_layer_name=session.uv_layer_name,
-                image=session.image,
-                pixels=session.source_pixels,
-                uv_points=session.uv_points,
+                targets=session.targets,
+                width=session.width,
+                height=session.height,
+                images=[(layer.image, layer.source_pixels) for layer in session.layers],
             )
             dx, dy = session.dx, session.dy
             _SESSION = None
@@ -635,18 +1291,9 @@ class UVPS_OT_revert(Operator):
         if backup is None:
             return {'CANCELLED'}
         try:
-            _write_image(backup.image, backup.pixels)
-            height, width = backup.pixels.shape[:2]
-            _write_uv_points(
-                backup.obj,
-                backup.mesh,
-                backup.uv_layer_name,
-                backup.uv_points,
-                0,
-                0,
-                width,
-                height,
-            )
+            for image, pixels in backup.images:
+                _write_image(image, pixels)
+            _write_uv_points(backup.targets, 0, 0, backup.width, backup.height)
             _BACKUP = None
             _set_status("IDLE", "Last apply reverted")
             return {'FINISHED'}
@@ -668,6 +1315,34 @@ class UVPS_OT_save_image(Operator):
         if not image.filepath_raw:
             self.report({'WARNING'}, "The image has no file path; use Image > Save As")
             return {'CANCELLED'}
+
+        settings = context.scene.uv_pixel_sync_settings
+        filepath = bpy.path.abspath(image.filepath_raw, library=image.library)
+        layout = _background_png_layout(image, filepath) if settings.background_save else None
+        pixels = None
+        if layout is not None:
+            try:
+                pixels = _file_channels(_read_image(image)[0], layout.channels)
+            except RuntimeError as error:
+                self.report({'ERROR'}, str(error))
+                return {'CANCELLED'}
+        if pixels is not None:
+            _SAVE_QUEUE.submit(
+                SaveJob(
+                    key=image.as_pointer(),
+                    name=image.name,
+                    filepath=filepath,
+                    pixels=pixels,
+                    bit_depth=layout.bit_depth,
+                    chunks=layout.chunks,
+                    generation=_IMAGE_EDITS.get(image.as_pointer(), 0),
+                )
+            )
+            if not bpy.app.timers.is_registered(_poll_save_queue):
+                bpy.app.timers.register(_poll_save_queue, first_interval=_SAVE_POLL_INTERVAL)
+            self.report({'INFO'}, f"Saving '{image.name}' in the background")
+            return {'FINISHED'}
+
         try:
             image.save()
             self.report({'INFO'}, f"Saved '{image.name}'")
@@ -677,6 +1352,58 @@ class UVPS_OT_save_image(Operator):
             return {'CANCELLED'}
 
 
+class UVPS_OT_image_add(Operator):
+    bl_idname = "uv.uv_pixel_sync_image_add"
+    bl_label = "Add Image"
+    bl_description = "Add an image that is moved together with the active image"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        context.scene.uv_pixel_sync_settings.images.add()
+        return {'FINISHED'}
+
+
+class UVPS_OT_image_remove(Operator):
+    bl_idname = "uv.uv_pixel_sync_image_remove"
+    bl_label = "Remove Image"
+    bl_description = "Remove this image from the moved image list"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: IntProperty(options={'HIDDEN'})
+
+    def execute(self, context):
+        images = context.scene.uv_pixel_sync_settings.images
+        if self.index < 0 or self.index >= len(images):
+            return {'CANCELLED'}
+        images.remove(self.index)
+        return {'FINISHED'}
+
+
+class UVPS_OT_copy_timings(Operator):
+    bl_idname = "uv.uv_pixel_sync_copy_timings"
+    bl_label = "Copy Timings"
+    bl_description = "Copy the recorded timing history as JSON for a bug report"
+
+    @classmethod
+    def poll(cls, context):
+        return len(_TIMINGS) > 0
+
+    def execute(self, context):
+        context.window_manager.clipboard = _TIMINGS.to_json()
+        self.report({'INFO'}, f"Copied timings for {len(_TIMINGS)} move(s)")
+        return {'FINISHED'}
+
+
+class UVPS_OT_clear_timings(Operator):
+    bl_idname = "uv.uv_pixel_sync_clear_timings"
+    bl_label = "Clear Timings"
+    bl_description = "Forget the recorded timing history"
+
+    def execute(self, context):
+        _TIMINGS.clear()
+        return {'FINISHED'}
+
+
 class UVPS_PT_sidebar(Panel):
     bl_label = "UV Pixel Sync"
     bl_idname = "UVPS_PT_sidebar"
@@ -700,6 +1427,8 @@ class UVPS_PT_sidebar(Panel):
         else:
             status.label(text="Ready", icon='UV')
         status.label(text=image.name if image else "No image selected", icon='IMAGE_DATA')
+        if _SESSION is not None and len(_SESSION.layers) > 1:
+            status.label(text=f"+ {len(_SESSION.layers) - 1} more image(s) in the set", icon='TEXTURE')
 
         if _SESSION is None:
             button = layout.row()
@@ -718,10 +1447,43 @@ class UVPS_PT_sidebar(Panel):
         if settings.fill_mode == 'CUSTOM':
             options.prop(settings, "fill_color")
         options.prop(settings, "material_preview")
+        row = options.row(align=True)
+        row.prop(settings, "proxy_preview")
+        sub = row.row(align=True)
+        sub.active = settings.proxy_preview
+        sub.prop(settings, "proxy_size", text="")
+
+        texture_set = layout.box()
+        texture_set.prop(settings, "image_set")
+        if settings.image_set == 'LIST':
+            for index, item in enumerate(settings.images):
+                row = texture_set.row(align=True)
+                row.prop(item, "image", text="")
+                op = row.operator("uv.uv_pixel_sync_image_remove", text="", icon='X')
+                op.index = index
+            texture_set.operator("uv.uv_pixel_sync_image_add", icon='ADD')
 
         row = layout.row(align=True)
         row.operator("uv.uv_pixel_sync_save_image", icon='FILE_TICK')
         row.operator("uv.uv_pixel_sync_revert", text="Revert Last", icon='LOOP_BACK')
+        layout.prop(settings, "background_save")
+
+        timing = layout.box()
+        timing.prop(settings, "record_timings")
+        timer = _TIMINGS.latest()
+        if settings.record_timings and timer is not None:
+            summary = timer.summary()
+            timing.label(text=f"Last move: {summary['label']}", icon='TIME')
+            column = timing.column(align=True)
+            for line in format_summary(summary):
+                column.label(text=line)
+            row = timing.row(align=True)
+            row.operator("uv.uv_pixel_sync_copy_timings", icon='COPYDOWN')
+            row.operator("uv.uv_pixel_sync_clear_timings", text="", icon='TRASH')
+        for job in _SAVE_QUEUE.active():
+            layout.progress(factor=job.progress, type='BAR', text=f"Saving {job.name}")
+        if _SAVE_RESULT:
+            layout.label(text=_SAVE_RESULT, icon='ERROR' if _SAVE_RESULT.startswith("Save failed") else 'CHECKMARK')
 
         help_box = layout.box()
         help_box.label(text="Move: Mouse")
@@ -737,6 +1499,7 @@ def _draw_uv_menu(self, context):
 
 
 CLASSES = (
+    UVPS_PG_image_item,
     UVPS_PG_settings,
     UVPS_PG_runtime,
     UVPS_OT_move,
@@ -744,6 +1507,10 @@ CLASSES = (
     UVPS_OT_cancel,
     UVPS_OT_revert,
     UVPS_OT_save_image,
+    UVPS_OT_image_add,
+    UVPS_OT_image_remove,
+    UVPS_OT_copy_timings,
+    UVPS_OT_clear_timings,
     UVPS_PT_sidebar,
 )
 
@@ -768,9 +1535,20 @@ def register():
 
 
 def unregister():
-    global _DRAW_HANDLE, _BACKUP
+    global _DRAW_HANDLE, _BACKUP, _SAVE_RESULT, _PREPARE_EXECUTOR
     if _SESSION is not None:
         _cancel_session()
+    if _PREPARE_EXECUTOR is not None:
+        _PREPARE_EXECUTOR.shutdown(wait=True, cancel_futures=True)
+        _PREPARE_EXECUTOR = None
+    if bpy.app.timers.is_registered(_poll_save_queue):
+        bpy.app.timers.unregister(_poll_save_queue)
+    # Let queued writes finish so no file is left half-written.
+    _SAVE_QUEUE.shutdown(wait=True)
+    _SAVE_QUEUE.collect_finished()
+    _SAVE_RESULT = ""
+    _IMAGE_EDITS.clear()
+    _TIMINGS.clear()
 
     for keymap, item in _KEYMAP_ITEMS:
         try:
@@ -0,0 +1,231 @@
+# SPDX-License-Identifier: MIT
+"""Image file output used by UV Pixel Sync.
+
+This module has no Blender dependency. The add-on snapshots pixels on the main
+thread and hands them to ``SaveQueue``, which encodes and writes files on a
+background worker so saving large textures does not block the UI.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import struct
+import tempfile
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+_PNG_CHANNELS = {color_type: channels for channels, color_type in _PNG_COLOR_TYPES.items()}
+_ROWS_PER_CHUNK = 64
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    checksum = zlib.crc32(data, zlib.crc32(kind)) & 0xFFFFFFFF
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", checksum)
+
+
+@dataclass(frozen=True)
+class PngLayout:
+    # Channel count and bit depth of an existing PNG, with its ancillary chunks in file order.
+    channels: int
+    bit_depth: int
+    chunks: tuple[tuple[bytes, bytes], ...] = ()
+
+
+def read_png_layout(filepath: str) -> PngLayout | None:
+    """Return the layout of a PNG this module can rewrite exactly, or None.
+
+    Only chunk headers are read; image data is skipped. Palette, low bit depth
+    and interlaced files return None so the caller can use another writer.
+    """
+    try:
+        with open(filepath, "rb") as file:
+            if file.read(8) != _PNG_SIGNATURE:
+                return None
+            chunks = []
+            header = None
+            while True:
+                prefix = file.read(8)
+                if len(prefix) < 8:
+                    return None
+                length, kind = struct.unpack(">I4s", prefix)
+                if kind == b"IEND":
+                    break
+                if kind == b"IHDR":
+                    header = file.read(length)
+                elif kind[0:1].islower():
+                    chunks.append((kind, file.read(length)))
+                else:
+                    file.seek(length, os.SEEK_CUR)
+                file.seek(4, os.SEEK_CUR)
+    except OSError:
+        return None
+    if header is None or len(header) != 13:
+        return None
+    _width, _height, bit_depth, color_type, _compression, _filter, interlace = struct.unpack(">IIBBBBB", header)
+    if color_type not in _PNG_CHANNELS or bit_depth not in (8, 16) or interlace:
+        return None
+    return PngLayout(_PNG_CHANNELS[color_type], bit_depth, tuple(chunks))
+
+
+def encode_png(
+    pixels: np.ndarray,
+    bit_depth: int = 8,
+    *,
+    chunks: tuple[tuple[bytes, bytes], ...] = (),
+    progress: Callable[[float], None] | None = None,
+) -> bytes:
+    """Encode bottom-up float pixels in the 0-1 range as an 8- or 16-bit PNG.
+
+    ``chunks`` are ancillary (kind, data) pairs written before the image data.
+    """
+    source = np.asarray(pixels)
+    if source.ndim != 3 or source.shape[2] not in _PNG_COLOR_TYPES:
+        raise ValueError("Pixels must have shape (height, width, 1-4 channels)")
+    if bit_depth not in (8, 16):
+        raise ValueError("PNG bit depth must be 8 or 16")
+
+    height, width, channels = source.shape
+    if height <= 0 or width <= 0:
+        raise ValueError("Image dimensions must be positive")
+    maximum = 255 if bit_depth == 8 else 65535
+    dtype = np.dtype(np.uint8) if bit_depth == 8 else np.dtype(">u2")
+
+    header = struct.pack(">IIBBBBB", width, height, bit_depth, _PNG_COLOR_TYPES[channels], 0, 0, 0)
+    compressor = zlib.compressobj(6)
+    compressed: list[bytes] = []
+    # Blender stores the bottom row first; PNG starts with the top row.
+    flipped = source[::-1]
+    for start in range(0, height, _ROWS_PER_CHUNK):
+        stop = min(height, start + _ROWS_PER_CHUNK)
+        rows = flipped[start:stop]
+        values = np.rint(np.clip(rows, 0.0, 1.0) * maximum).astype(dtype)
+        scanlines = np.zeros((len(values), 1 + values[0].nbytes), dtype=np.uint8)
+        scanlines[:, 1:] = values.reshape(len(values), -1).view(np.uint8)
+        compressed.append(compressor.compress(scanlines.tobytes()))
+        if progress is not None:
+            progress(stop / height)
+    compressed.append(compressor.flush())
+
+    return b"".join(
+        (
+            _PNG_SIGNATURE,
+            _png_chunk(b"IHDR", header),
+            *(_png_chunk(kind, data) for kind, data in chunks),
+            _png_chunk(b"IDAT", b"".join(compressed)),
+            _png_chunk(b"IEND", b""),
+        )
+    )
+
+
+def write_png(
+    filepath: str,
+    pixels: np.ndarray,
+    bit_depth: int = 8,
+    *,
+    chunks: tuple[tuple[bytes, bytes], ...] = (),
+    progress: Callable[[float], None] | None = None,
+) -> None:
+    """Encode and replace ``filepath`` atomically so a failed save never truncates it."""
+    data = encode_png(pixels, bit_depth, chunks=chunks, progress=progress)
+    directory = os.path.dirname(os.path.abspath(filepath))
+    try:
+        mode = os.stat(filepath).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    handle, temporary = tempfile.mkstemp(prefix=".uvps_", suffix=".png", dir=directory)
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+        # mkstemp creates private files; keep the permissions of the file being replaced.
+        os.chmod(temporary, mode)
+        os.replace(temporary, filepath)
+    except BaseException:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        raise
+
+
+@dataclass
+class SaveJob:
+    # Opaque key the caller uses to find its image again, e.g. a pointer.
+    key: int
+    name: str
+    filepath: str
+    pixels: np.ndarray
+    bit_depth: int = 8
+    # Ancillary chunks of the file being replaced, such as text and color metadata.
+    chunks: tuple[tuple[bytes, bytes], ...] = ()
+    # Caller's edit counter when the pixels were captured.
+    generation: int = 0
+    progress: float = 0.0
+    done: bool = False
+    error: str | None = None
+
+
+class SaveQueue:
+    """Write queued snapshots one at a time on a single daemon worker thread."""
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[SaveJob | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._jobs: list[SaveJob] = []
+        self._thread: threading.Thread | None = None
+
+    def submit(self, job: SaveJob) -> None:
+        with self._lock:
+            self._jobs.append(job)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="UVPS image save", daemon=True)
+                self._thread.start()
+        self._queue.put(job)
+
+    def active(self) -> list[SaveJob]:
+        with self._lock:
+            return [job for job in self._jobs if not job.done]
+
+    def pending(self) -> bool:
+        """Return whether any job is still running or waiting to be collected."""
+        with self._lock:
+            return bool(self._jobs)
+
+    def collect_finished(self) -> list[SaveJob]:
+        with self._lock:
+            finished = [job for job in self._jobs if job.done]
+            self._jobs = [job for job in self._jobs if not job.done]
+        return finished
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(None)
+        if wait:
+            thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            def report(value: float, job: SaveJob = job) -> None:
+                job.progress = value
+
+            try:
+                write_png(job.filepath, job.pixels, job.bit_depth, chunks=job.chunks, progress=report)
+            except Exception as error:
+                job.error = str(error) or type(error).__name__
+            finally:
+                job.progress = 1.0
+                job.done = True
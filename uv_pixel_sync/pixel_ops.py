@@ -7,6 +7,7 @@ be tested independently from Blender UI state.
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Iterable, Sequence
 
@@ -36,33 +37,70 @@ class PixelSelection:
         return self.bottom + self.height - 1
 
 
-def _fill_polygon(mask: np.ndarray, points: np.ndarray, left: int, bottom: int) -> None:
-    """Fill a polygon by intersecting each pixel-center scanline."""
-    if len(points) < 3:
+def _fill_regions(mask: np.ndarray, regions: list[list[np.ndarray]], left: int, bottom: int) -> None:
+    """Fill pixel centers inside any region, using the even-odd rule within each region.
+
+    All ring edges are intersected with the pixel-center scanlines in one
+    vectorized pass, so the cost and memory follow the number of edge/row
+    crossings rather than the number of faces or the bounding-box area.
+    """
+    starts: list[np.ndarray] = []
+    ends: list[np.ndarray] = []
+    owners: list[np.ndarray] = []
+    origin = np.array((left, bottom), dtype=np.float64)
+    for region_index, rings in enumerate(regions):
+        for ring in rings:
+            local = ring - origin
+            starts.append(local)
+            ends.append(np.roll(local, -1, axis=0))
+            owners.append(np.full(len(local), region_index, dtype=np.int64))
+    if not starts:
         return
 
-    local = points - np.array((left, bottom), dtype=np.float64)
-    first_row = max(0, int(np.ceil(np.min(local[:, 1]) - 0.5)))
-    last_row = min(mask.shape[0] - 1, int(np.floor(np.max(local[:, 1]) - 0.5)))
-
-    for row in range(first_row, last_row + 1):
-        y = row + 0.5
-        hits: list[float] = []
-        for index, start in enumerate(local):
-            end = local[(index + 1) % len(local)]
-            y1, y2 = start[1], end[1]
-            if y1 == y2:
-                continue
-            if (y1 <= y < y2) or (y2 <= y < y1):
-                ratio = (y - y1) / (y2 - y1)
-                hits.append(float(start[0] + ratio * (end[0] - start[0])))
-
-        hits.sort()
-        for index in range(0, len(hits) - 1, 2):
-            first_col = max(0, int(np.ceil(hits[index] - 0.5)))
-            last_col = min(mask.shape[1] - 1, int(np.floor(hits[index + 1] - 0.5)))
-            if first_col <= last_col:
-                mask[row, first_col : last_col + 1] = True
+    start = np.concatenate(starts)
+    end = np.concatenate(ends)
+    owner = np.concatenate(owners)
+    sloped = start[:, 1] != end[:, 1]
+    start, end, owner = start[sloped], end[sloped], owner[sloped]
+
+    # Row r is crossed when low <= r + 0.5 < high.
+    low = np.minimum(start[:, 1], end[:, 1])
+    high = np.maximum(start[:, 1], end[:, 1])
+    first_row = np.maximum(np.ceil(low - 0.5), 0).astype(np.int64)
+    last_row = np.minimum(np.ceil(high - 0.5) - 1, mask.shape[0] - 1).astype(np.int64)
+    counts = np.maximum(last_row - first_row + 1, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return
+
+    edge = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.cumsum(counts) - counts
+    rows = first_row[edge] + (np.arange(total) - offsets[edge])
+    y = rows + 0.5
+    ratio = (y - start[edge, 1]) / (end[edge, 1] - start[edge, 1])
+    hits = start[edge, 0] + ratio * (end[edge, 0] - start[edge, 0])
+    regions_hit = owner[edge]
+
+    order = np.lexsort((hits, rows, regions_hit))
+    rows, hits, regions_hit = rows[order], hits[order], regions_hit[order]
+    group_start = np.ones(total, dtype=bool)
+    group_start[1:] = (rows[1:] != rows[:-1]) | (regions_hit[1:] != regions_hit[:-1])
+    group_first = np.maximum.accumulate(np.where(group_start, np.arange(total), 0))
+    rank = np.arange(total) - group_first
+    opening = np.flatnonzero((rank % 2 == 0)[:-1] & ~group_start[1:])
+
+    span_rows = rows[opening]
+    first_col = np.maximum(np.ceil(hits[opening] - 0.5), 0).astype(np.int64)
+    last_col = np.minimum(np.floor(hits[opening + 1] - 0.5), mask.shape[1] - 1).astype(np.int64)
+    valid = first_col <= last_col
+    if not np.any(valid):
+        return
+
+    # Spans are written straight into the mask; no temporary scales with the bounding box.
+    for row, first, last in zip(
+        span_rows[valid].tolist(), first_col[valid].tolist(), last_col[valid].tolist()
+    ):
+        mask[row, first : last + 1] = True
 
 
 def _expand_mask(mask: np.ndarray, amount: int) -> np.ndarray:
@@ -82,49 +120,99 @@ def _expand_mask(mask: np.ndarray, amount: int) -> np.ndarray:
     return expanded
 
 
-def rasterize_uv_selection(
-    polygons: Iterable[Sequence[Sequence[float]]],
+def _pixel_bounds(uvs: np.ndarray, width: int, height: int, pad: int) -> tuple[int, int, int, int]:
+    """Return (left, bottom, right_exclusive, top_exclusive) of the pixels UVs can cover."""
+    tolerance = 1e-7
+    if float(np.min(uvs)) < -tolerance or float(np.max(uvs)) > 1.0 + tolerance:
+        raise ValueError("Selected UVs must stay inside the 0-1 image tile")
+
+    points = np.clip(uvs, 0.0, 1.0) * np.array((width, height), dtype=np.float64)
+    left = max(0, int(np.floor(np.min(points[:, 0]))) - pad)
+    bottom = max(0, int(np.floor(np.min(points[:, 1]))) - pad)
+    right_exclusive = min(width, int(np.ceil(np.max(points[:, 0]))) + pad)
+    top_exclusive = min(height, int(np.ceil(np.max(points[:, 1]))) + pad)
+    if right_exclusive <= left or top_exclusive <= bottom:
+        raise ValueError("The selected UV area contains no pixels")
+    return left, bottom, right_exclusive, top_exclusive
+
+
+def bounding_selection(
+    uvs: Sequence[Sequence[float]],
     image_width: int,
     image_height: int,
     padding: int = 0,
 ) -> PixelSelection:
-    """Convert 0-1 UV polygons to a compact pixel-center mask."""
+    """Return a selection covering the UV bounding box; it always contains the exact mask.
+
+    The mask is a read-only broadcast view, so this is cheap even for huge
+    images. It is only meant for clamping until the exact mask is ready.
+    """
+    width = int(image_width)
+    height = int(image_height)
+    if width <= 0 or height <= 0:
+        raise ValueError("Image dimensions must be positive")
+    points = np.asarray(uvs, dtype=np.float64).reshape(-1, 2)
+    if not len(points):
+        raise ValueError("No valid UV polygons")
+    left, bottom, right_exclusive, top_exclusive = _pixel_bounds(points, width, height, max(0, int(padding)))
+    mask = np.broadcast_to(np.True_, (top_exclusive - bottom, right_exclusive - left))
+    return PixelSelection(mask=mask, left=left, bottom=bottom)
+
+
+def rasterize_uv_regions(
+    regions: Iterable[Sequence[Sequence[Sequence[float]]]],
+    image_width: int,
+    image_height: int,
+    padding: int = 0,
+) -> PixelSelection:
+    """Convert 0-1 UV regions to a compact pixel-center mask.
+
+    Each region is a list of closed rings, such as an island's outer boundary
+    and its holes, and is filled with the even-odd rule. Separate regions are
+    combined as a union.
+    """
     width = int(image_width)
     height = int(image_height)
     if width <= 0 or height <= 0:
         raise ValueError("Image dimensions must be positive")
 
-    valid = [np.asarray(polygon, dtype=np.float64) for polygon in polygons]
-    valid = [polygon for polygon in valid if polygon.ndim == 2 and polygon.shape[0] >= 3 and polygon.shape[1] == 2]
+    valid: list[list[np.ndarray]] = []
+    for region in regions:
+        rings = [np.asarray(ring, dtype=np.float64) for ring in region]
+        rings = [ring for ring in rings if ring.ndim == 2 and ring.shape[0] >= 3 and ring.shape[1] == 2]
+        if rings:
+            valid.append(rings)
     if not valid:
         raise ValueError("No valid UV polygons")
 
-    all_uvs = np.concatenate(valid, axis=0)
-    tolerance = 1e-7
-    if float(np.min(all_uvs)) < -tolerance or float(np.max(all_uvs)) > 1.0 + tolerance:
-        raise ValueError("Selected UVs must stay inside the 0-1 image tile")
-
-    scale = np.array((width, height), dtype=np.float64)
-    pixel_polygons = [np.clip(polygon, 0.0, 1.0) * scale for polygon in valid]
-    all_points = np.concatenate(pixel_polygons, axis=0)
+    all_uvs = np.concatenate([ring for rings in valid for ring in rings], axis=0)
     pad = max(0, int(padding))
-
-    left = max(0, int(np.floor(np.min(all_points[:, 0]))) - pad)
-    bottom = max(0, int(np.floor(np.min(all_points[:, 1]))) - pad)
-    right_exclusive = min(width, int(np.ceil(np.max(all_points[:, 0]))) + pad)
-    top_exclusive = min(height, int(np.ceil(np.max(all_points[:, 1]))) + pad)
-    if right_exclusive <= left or top_exclusive <= bottom:
-        raise ValueError("The selected UV area contains no pixels")
+    left, bottom, right_exclusive, top_exclusive = _pixel_bounds(all_uvs, width, height, pad)
+    scale = np.array((width, height), dtype=np.float64)
+    pixel_regions = [[np.clip(ring, 0.0, 1.0) * scale for ring in rings] for rings in valid]
 
     mask = np.zeros((top_exclusive - bottom, right_exclusive - left), dtype=bool)
-    for polygon in pixel_polygons:
-        _fill_polygon(mask, polygon, left, bottom)
+    _fill_regions(mask, pixel_regions, left, bottom)
     if not np.any(mask):
         raise ValueError("The selected UV area is smaller than one pixel")
 
     if pad:
         mask = _expand_mask(mask, pad)
-    return PixelSelection(mask=mask, left=left, bottom=bottom)
+    # Trim to the covered pixels so clamping allows the full possible move.
+    rows = np.flatnonzero(mask.any(axis=1))
+    columns = np.flatnonzero(mask.any(axis=0))
+    mask = mask[rows[0] : rows[-1] + 1, columns[0] : columns[-1] + 1]
+    return PixelSelection(mask=mask, left=left + int(columns[0]), bottom=bottom + int(rows[0]))
+
+
+def rasterize_uv_selection(
+    polygons: Iterable[Sequence[Sequence[float]]],
+    image_width: int,
+    image_height: int,
+    padding: int = 0,
+) -> PixelSelection:
+    """Convert 0-1 UV polygons to a compact pixel-center mask."""
+    return rasterize_uv_regions(([polygon] for polygon in polygons), image_width, image_height, padding)
 
 
 def clamp_translation(
@@ -144,6 +232,81 @@ def clamp_translation(
     return result_x, result_y, (result_x != int(dx) or result_y != int(dy))
 
 
+def sizes_nest(first: Sequence[int], second: Sequence[int]) -> bool:
+    """Return whether, on each axis, one image size is a whole multiple of the other.
+
+    Sizes that do not nest (2048 and 1000, 2048 and 2047) share no useful pixel
+    grid: the only common step is a large fraction of the image or all of it.
+    """
+    for a, b in zip(first, second):
+        a, b = int(a), int(b)
+        if a <= 0 or b <= 0 or (a % b and b % a):
+            return False
+    return True
+
+
+def shared_pixel_step(sizes: Iterable[Sequence[int]], image_width: int, image_height: int) -> tuple[int, int]:
+    """Return the smallest move, in pixels of the given image, that is whole in every size.
+
+    Callers keep to sizes that nest (see ``sizes_nest``); for those the step is
+    the ratio to the smallest image.
+    """
+    grid_x = int(image_width)
+    grid_y = int(image_height)
+    for width, height in sizes:
+        grid_x = math.gcd(grid_x, int(width))
+        grid_y = math.gcd(grid_y, int(height))
+    if grid_x <= 0 or grid_y <= 0:
+        raise ValueError("Image dimensions must be positive")
+    return int(image_width) // grid_x, int(image_height) // grid_y
+
+
+def clamp_shared_translation(
+    layers: Sequence[tuple[PixelSelection, int, int]],
+    dx: int,
+    dy: int,
+    image_width: int,
+    image_height: int,
+) -> tuple[int, int, bool]:
+    """Snap a move to the pixel grid shared by several images and keep every selection inside.
+
+    ``dx``/``dy`` and the result are in pixels of the ``image_width`` x
+    ``image_height`` image. Each layer is a selection with the size of the
+    image it was rasterized for.
+    """
+    width = int(image_width)
+    height = int(image_height)
+    step_x, step_y = shared_pixel_step(((w, h) for _, w, h in layers), width, height)
+    units_x = width // step_x
+    units_y = height // step_y
+    wanted_x = int(round(int(dx) / step_x))
+    wanted_y = int(round(int(dy) / step_y))
+
+    low_x, high_x = -units_x, units_x
+    low_y, high_y = -units_y, units_y
+    for selection, layer_width, layer_height in layers:
+        min_dx, max_dx = -selection.left, int(layer_width) - 1 - selection.right
+        min_dy, max_dy = -selection.bottom, int(layer_height) - 1 - selection.top
+        # One grid unit is layer_width / units_x pixels in this layer.
+        low_x = max(low_x, -((-min_dx * units_x) // int(layer_width)))
+        high_x = min(high_x, (max_dx * units_x) // int(layer_width))
+        low_y = max(low_y, -((-min_dy * units_y) // int(layer_height)))
+        high_y = min(high_y, (max_dy * units_y) // int(layer_height))
+
+    result_x = min(max(wanted_x, low_x), high_x)
+    result_y = min(max(wanted_y, low_y), high_y)
+    clamped = result_x != wanted_x or result_y != wanted_y
+    return result_x * step_x, result_y * step_y, clamped
+
+
+def scale_translation(dx: int, dy: int, from_size: Sequence[int], to_size: Sequence[int]) -> tuple[int, int]:
+    """Convert a shared-grid move from one image resolution to another."""
+    return (
+        int(dx) * int(to_size[0]) // int(from_size[0]),
+        int(dy) * int(to_size[1]) // int(from_size[1]),
+    )
+
+
 def _fill_value(mode: str, color: Sequence[float], channels: int) -> np.ndarray:
     rgba = np.asarray(tuple(color), dtype=np.float32)
     if rgba.shape != (4,):
@@ -198,6 +361,47 @@ def translate_pixels(
     return result
 
 
+def proxy_factor(width: int, height: int, max_size: int) -> int:
+    """Return the smallest whole downsampling factor that fits the image within ``max_size``."""
+    if int(width) <= 0 or int(height) <= 0 or int(max_size) <= 0:
+        raise ValueError("Image dimensions must be positive")
+    return max(1, math.ceil(max(int(width), int(height)) / int(max_size)))
+
+
+def downsample_pixels(source: np.ndarray, factor: int) -> np.ndarray:
+    """Average ``factor`` x ``factor`` pixel blocks; partial edge blocks average what they cover."""
+    pixels = np.asarray(source, dtype=np.float32)
+    if pixels.ndim != 3 or not 1 <= pixels.shape[2] <= 4:
+        raise ValueError("Source must have shape (height, width, 1-4 channels)")
+    factor = int(factor)
+    if factor < 1:
+        raise ValueError("Downsampling factor must be at least 1")
+    if factor == 1:
+        return pixels
+
+    height, width, channels = pixels.shape
+    full_width = width - width % factor
+    column_counts = np.full(math.ceil(width / factor), factor, dtype=np.float32)
+    column_counts[-1] = width - (len(column_counts) - 1) * factor
+    result = np.empty((math.ceil(height / factor), len(column_counts), channels), dtype=np.float32)
+    # Sum a few block rows at a time so huge images never need a full-size temporary.
+    step = factor * 64
+    for start in range(0, height, step):
+        rows = pixels[start : min(height, start + step)]
+        full_height = len(rows) - len(rows) % factor
+        row_sums = rows[:full_height].reshape(full_height // factor, factor, width, channels).sum(axis=1)
+        if full_height < len(rows):
+            row_sums = np.concatenate((row_sums, rows[full_height:].sum(axis=0, keepdims=True)))
+        sums = row_sums[:, :full_width].reshape(len(row_sums), full_width // factor, factor, channels).sum(axis=2)
+        if full_width < width:
+            sums = np.concatenate((sums, row_sums[:, full_width:].sum(axis=1, keepdims=True)), axis=1)
+        row_counts = np.full(len(row_sums), factor, dtype=np.float32)
+        row_counts[-1] = len(rows) - (len(row_sums) - 1) * factor
+        first = start // factor
+        result[first : first + len(row_sums)] = sums / row_counts[:, None, None] / column_counts[None, :, None]
+    return result
+
+
 def as_rgba(source: np.ndarray) -> np.ndarray:
     """Return a four-channel view/copy suitable for a Blender preview image."""
     pixels = np.asarray(source, dtype=np.float32)
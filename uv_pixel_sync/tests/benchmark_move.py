@@ -0,0 +1,231 @@
+"""Headless benchmark for the UV Pixel Sync move pipeline.
+
+Run with Blender in the background; arguments after ``--`` are parsed here:
+
+    blender --background --factory-startup --python-exit-code 1
+        --python uv_pixel_sync/tests/benchmark_move.py -- --preset quick
+
+A run fails when a timing is slower than the baseline JSON by more than
+``--tolerance`` (relative) and ``--noise-ms`` (absolute), and when a case or
+metric has no baseline value yet. ``--update-baseline`` records this run's
+results instead of comparing.
+"""
+
+import argparse
+import importlib
+import json
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+
+ADDON_PARENT = Path(__file__).resolve().parents[2]
+if str(ADDON_PARENT) not in sys.path:
+    sys.path.insert(0, str(ADDON_PARENT))
+
+addon = importlib.import_module("uv_pixel_sync")
+addon_module = importlib.import_module("uv_pixel_sync.addon")
+image_io = importlib.import_module("uv_pixel_sync.image_io")
+
+DEFAULT_BASELINE = Path(__file__).with_name("benchmark_move_baseline.json")
+DRAG_STEPS = 60
+PRESETS = {
+    # (faces, image size, channels)
+    "quick": [
+        (1_000, 1024, 4),
+        (10_000, 2048, 4),
+    ],
+    "full": [
+        (1_000, 1024, 4),
+        (10_000, 2048, 4),
+        (100_000, 4096, 4),
+        (1_000_000, 4096, 4),
+        (10_000, 4096, 3),
+        (10_000, 4096, 1),
+        (10_000, 8192, 4),
+        (10_000, 16384, 1),
+        (10_000, 16384, 4),
+    ],
+}
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(prog="benchmark_move.py")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--faces", type=int, help="Run a single case with this many faces")
+    parser.add_argument("--size", type=int, default=2048, help="Image size for --faces")
+    parser.add_argument("--channels", type=int, default=4, choices=(1, 2, 3, 4), help="Channels for --faces")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--noise-ms", type=float, default=5.0)
+    parser.add_argument("--output", type=Path, help="Also write this run's results to a JSON file")
+    argv = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    return parser.parse_args(argv)
+
+
+def reset_scene():
+    if bpy.context.object is not None and bpy.context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+    for image in list(bpy.data.images):
+        bpy.data.images.remove(image)
+
+
+def grid_object(face_count):
+    """Build a square grid of quads whose UVs cover the middle of the 0-1 tile."""
+    side = max(1, int(math.sqrt(face_count)))
+    xs, ys = np.meshgrid(np.arange(side + 1, dtype=np.float32), np.arange(side + 1, dtype=np.float32))
+    coordinates = np.zeros(((side + 1) ** 2, 3), dtype=np.float32)
+    coordinates[:, 0] = xs.ravel()
+    coordinates[:, 1] = ys.ravel()
+    rows, columns = np.meshgrid(np.arange(side), np.arange(side), indexing="ij")
+    first = (rows * (side + 1) + columns).ravel()
+    quads = np.stack((first, first + 1, first + side + 2, first + side + 1), axis=1)
+
+    mesh = bpy.data.meshes.new("UVPS_BenchMesh")
+    mesh.vertices.add(len(coordinates))
+    mesh.vertices.foreach_set("co", coordinates.ravel())
+    mesh.loops.add(quads.size)
+    mesh.loops.foreach_set("vertex_index", quads.ravel().astype(np.int32))
+    mesh.polygons.add(len(quads))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, quads.size, 4, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    loop_vertices = quads.ravel()
+    uvs = 0.25 + coordinates[loop_vertices, :2] / side * 0.25
+    uv_layer.uv.foreach_set("vector", uvs.astype(np.float32).ravel())
+
+    obj = bpy.data.objects.new("UVPS_BenchObject", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+    return obj, len(quads)
+
+
+def bench_image(size, channels, directory):
+    rng = np.random.default_rng(size + channels)
+    if channels == 4:
+        image = bpy.data.images.new("UVPS_Bench", width=size, height=size, alpha=True, float_buffer=True)
+        pixels = rng.random((size, size, 4), dtype=np.float32)
+        image.pixels.foreach_set(pixels.ravel())
+        return image
+    # Generated images always have four channels; load a file for fewer.
+    path = Path(directory) / f"bench_{size}_{channels}.png"
+    image_io.write_png(str(path), rng.random((size, size, channels), dtype=np.float32), 16)
+    image = bpy.data.images.load(str(path))
+    image.colorspace_settings.name = 'Non-Color'
+    return image
+
+
+def run_case(faces, size, channels, directory):
+    reset_scene()
+    obj, actual_faces = grid_object(faces)
+    image = bench_image(size, channels, directory)
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.mesh.select_all(action='SELECT')
+    settings = bpy.context.scene.uv_pixel_sync_settings
+    settings.image_set = 'ACTIVE'
+
+    # Invoke starts the session, and the modal timer completes its preparation.
+    start = time.perf_counter()
+    session, _, _ = addon_module._begin_session(bpy.context, image)
+    addon_module._prepare_step(session, settings, wait=True)
+    invoke_ms = (time.perf_counter() - start) * 1000.0
+
+    # The modal operator's _update and _finish call these for each cursor tick and on confirm,
+    # so status updates and proxy preview refreshes are part of the timings.
+    steps = []
+    for step in range(1, DRAG_STEPS + 1):
+        start = time.perf_counter()
+        addon_module._drag_to(session, settings, step, step // 2, "FREE")
+        steps.append((time.perf_counter() - start) * 1000.0)
+
+    start = time.perf_counter()
+    addon_module._finish_session(session, settings, "FREE")
+    finish_ms = (time.perf_counter() - start) * 1000.0
+
+    start = time.perf_counter()
+    result = bpy.ops.uv.uv_pixel_sync_apply()
+    apply_ms = (time.perf_counter() - start) * 1000.0
+    assert result == {'FINISHED'}, result
+    addon_module._BACKUP = None
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    return {
+        "faces": actual_faces,
+        "size": size,
+        "channels": session.layers[0].channels,
+        "invoke_ms": round(invoke_ms, 3),
+        "drag_step_mean_ms": round(sum(steps) / len(steps), 3),
+        "drag_step_max_ms": round(max(steps), 3),
+        "finish_ms": round(finish_ms, 3),
+        "apply_ms": round(apply_ms, 3),
+    }
+
+
+def compare(results, baseline, tolerance, noise_ms):
+    """Return regressions and missing baseline values; an unmeasured case never passes."""
+    problems = []
+    for case_id, metrics in results.items():
+        reference = baseline.get(case_id)
+        if reference is None:
+            problems.append(f"{case_id}: not in the baseline")
+            continue
+        for name, value in metrics.items():
+            if not name.endswith("_ms"):
+                continue
+            if reference.get(name) is None:
+                problems.append(f"{case_id} {name}: no baseline value")
+                continue
+            limit = reference[name] * (1.0 + tolerance)
+            if value > limit and value - reference[name] > noise_ms:
+                problems.append(f"{case_id} {name}: {value:.2f} ms > baseline {reference[name]:.2f} ms")
+    return problems
+
+
+def main():
+    args = parse_arguments()
+    cases = [(args.faces, args.size, args.channels)] if args.faces else PRESETS[args.preset]
+    addon.register()
+    results = {}
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for faces, size, channels in cases:
+                case_id = f"{faces}f_{size}px_{channels}ch"
+                results[case_id] = run_case(faces, size, channels, directory)
+                print(case_id, json.dumps(results[case_id]))
+    finally:
+        addon.unregister()
+
+    if args.output:
+        args.output.write_text(json.dumps({"cases": results}, indent=2) + "\n")
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())["cases"]
+    if args.update_baseline:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps({"cases": baseline}, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    problems = compare(results, baseline, args.tolerance, args.noise_ms)
+    assert not problems, (
+        "Benchmark does not match the baseline:\n"
+        + "\n".join(problems)
+        + "\nRecord missing values with --update-baseline."
+    )
+    print("UV_PIXEL_SYNC_BENCHMARK_OK")
+
+
+main()
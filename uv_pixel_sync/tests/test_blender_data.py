@@ -10,7 +10,9 @@ ADDON_PARENT = Path(__file__).resolve().parents[2]
 if str(ADDON_PARENT) not in sys.path:
     sys.path.insert(0, str(ADDON_PARENT))
 
+addon = importlib.import_module("uv_pixel_sync")
 addon_module = importlib.import_module("uv_pixel_sync.addon")
+addon.register()
 
 image = bpy.data.images.new("UVPS_Test", width=4, height=4, alpha=True, float_buffer=True)
 pixels = np.arange(4 * 4 * 4, dtype=np.float32).reshape((4, 4, 4)) / 64.0
@@ -31,21 +33,76 @@ for loop, uv in zip(mesh.loops, ((0.25, 0.25), (0.50, 0.25), (0.50, 0.50), (0.25
 
 obj = bpy.data.objects.new("UVPS_TestObject", mesh)
 bpy.context.scene.collection.objects.link(obj)
+# Only this object enters Edit Mode; the startup cube stays out of the session.
+for other in bpy.context.selected_objects:
+    other.select_set(False)
 bpy.context.view_layer.objects.active = obj
 obj.select_set(True)
 bpy.ops.object.mode_set(mode='EDIT')
 bpy.ops.mesh.select_all(action='SELECT')
 
-found_obj, found_mesh, layer_name, points, polygons = addon_module._selected_uv_geometry(bpy.context)
-assert found_obj == obj and found_mesh == mesh and layer_name == "UVMap"
-assert len(points) == 4 and len(polygons) == 1
+targets, face_sizes, loop_vertices, loop_uvs = addon_module._selected_uv_loops(bpy.context)
+assert len(targets) == 1 and targets[0].obj == obj and targets[0].mesh == mesh
+assert targets[0].uv_layer_name == "UVMap"
+assert len(targets[0].points) == 4 and face_sizes == [4] and len(loop_uvs) == 4
 
-addon_module._write_uv_points(obj, mesh, layer_name, points, 1, -1, 4, 4)
+# A texture set is read once per image and rasterized once per resolution on the worker.
+half = bpy.data.images.new("UVPS_TestHalf", width=2, height=2, alpha=True, float_buffer=True)
+material = bpy.data.materials.new("UVPS_TestMaterial")
+material.use_nodes = True
+# A 3px image shares no pixel grid with 4px and is left out instead of snapping to 4px steps.
+odd = bpy.data.images.new("UVPS_TestOdd", width=3, height=3, alpha=True, float_buffer=True)
+for texture in (image, half, odd):
+    node = material.node_tree.nodes.new("ShaderNodeTexImage")
+    node.image = texture
+mesh.materials.append(material)
+settings = bpy.context.scene.uv_pixel_sync_settings
+settings.image_set = 'MATERIALS'
+images, skipped, mismatched = addon_module._texture_set([obj], image, settings)
+assert images == [image, half] and (skipped, mismatched) == (0, 1)
+session, skipped, mismatched = addon_module._begin_session(bpy.context, image)
+layers = session.layers
+assert [(layer.width, layer.height) for layer in layers] == [(4, 4), (2, 2)]
+# Until preparation finishes, clamping uses the UV bounding box.
+assert layers[0].source_pixels is None and (layers[0].selection.left, layers[0].selection.right) == (1, 1)
+addon_module._advance_preparation(session, wait=True)
+assert session.preparation is None and all(layer.source_pixels is not None for layer in layers)
+regions = addon_module.island_regions(face_sizes, loop_vertices, loop_uvs)
+session.dx = 2
+addon_module._translate_layers(session, 'KEEP', (0.0, 0.0, 0.0, 0.0))
+assert np.allclose(layers[1].result_pixels[0, 1], layers[1].source_pixels[0, 0])
+
+# Proxy previews move downsampled copies; full resolution is translated on Apply.
+addon_module._add_proxies(layers, regions, 0, 2)
+assert [(layer.proxy.width, layer.proxy.height) for layer in layers] == [(2, 2), (2, 2)]
+# A layer already within the proxy size shares its full-resolution pixels instead of a copy.
+assert layers[1].proxy.source_pixels is layers[1].source_pixels
+assert addon_module._needs_proxy(layers, 2) and not addon_module._needs_proxy(layers, 4)
+addon_module._translate_proxies(session)
+assert layers[0].proxy.result_pixels.shape == (2, 2, 4)
+settings.image_set = 'ACTIVE'
+
+# Every mesh in Edit Mode joins one session; islands never merge across objects.
+bpy.ops.object.mode_set(mode='OBJECT')
+other_mesh = mesh.copy()
+other = bpy.data.objects.new("UVPS_TestOther", other_mesh)
+bpy.context.scene.collection.objects.link(other)
+other.select_set(True)
+bpy.ops.object.mode_set(mode='EDIT')
+bpy.ops.mesh.select_all(action='SELECT')
+targets, face_sizes, loop_vertices, loop_uvs = addon_module._selected_uv_loops(bpy.context)
+assert [target.obj for target in targets] == [obj, other]
+assert face_sizes == [4, 4] and min(loop_vertices[4:]) >= 4
+assert len(addon_module.island_regions(face_sizes, loop_vertices, loop_uvs)) == 2
+
+addon_module._write_uv_points(targets, 1, -1, 4, 4)
 bpy.ops.object.mode_set(mode='OBJECT')
-result_layer = mesh.uv_layers[layer_name]
-actual = [tuple(result_layer.uv[loop.index].vector) for loop in mesh.loops]
 expected = [(0.50, 0.00), (0.75, 0.00), (0.75, 0.25), (0.50, 0.25)]
-for value, target in zip(actual, expected):
-    assert np.allclose(value, target), f"Expected {target}, got {value}; all UVs: {actual}"
+for result_mesh in (mesh, other_mesh):
+    result_layer = result_mesh.uv_layers["UVMap"]
+    actual = [tuple(result_layer.uv[loop.index].vector) for loop in result_mesh.loops]
+    for value, target in zip(actual, expected):
+        assert np.allclose(value, target), f"Expected {target}, got {value}; all UVs: {actual}"
 
 print("UV_PIXEL_SYNC_BLENDER_DATA_TEST_OK")
+addon.unregister()
@@ -0,0 +1,85 @@
+import importlib.util
+import struct
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "image_io.py"
+spec = importlib.util.spec_from_file_location("uv_pixel_sync_image_io_test", MODULE_PATH)
+image_io = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = image_io
+spec.loader.exec_module(image_io)
+
+
+def decode(data):
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    chunks = {}
+    offset = 8
+    while offset < len(data):
+        length, kind = struct.unpack(">I4s", data[offset : offset + 8])
+        body = data[offset + 8 : offset + 8 + length]
+        crc = struct.unpack(">I", data[offset + 8 + length : offset + 12 + length])[0]
+        assert crc == zlib.crc32(kind + body) & 0xFFFFFFFF
+        chunks[kind] = body
+        offset += 12 + length
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    raw = zlib.decompress(chunks[b"IDAT"])
+    stride = len(raw) // height
+    rows = [raw[row * stride : (row + 1) * stride] for row in range(height)]
+    assert all(row[0] == 0 for row in rows)
+    return width, height, depth, color_type, [row[1:] for row in rows]
+
+
+# Blender's bottom row becomes the last PNG row.
+pixels = np.zeros((2, 3, 4), dtype=np.float32)
+pixels[0, 0] = (1.0, 0.0, 0.0, 1.0)
+pixels[1, 2] = (0.0, 0.0, 1.0, 0.5)
+progress = []
+width, height, depth, color_type, rows = decode(image_io.encode_png(pixels, 8, progress=progress.append))
+assert (width, height, depth, color_type) == (3, 2, 8, 6)
+assert rows[1][:4] == bytes((255, 0, 0, 255))
+assert rows[0][8:12] == bytes((0, 0, 255, 128))
+assert progress[-1] == 1.0
+
+gray = np.full((1, 2, 1), 0.5, dtype=np.float32)
+width, height, depth, color_type, rows = decode(image_io.encode_png(gray, 16))
+assert (width, height, depth, color_type) == (2, 1, 16, 0)
+assert struct.unpack(">2H", rows[0]) == (32768, 32768)
+
+with tempfile.TemporaryDirectory() as directory:
+    path = str(Path(directory) / "saved.png")
+    queue = image_io.SaveQueue()
+    queue.submit(image_io.SaveJob(key=1, name="saved", filepath=path, pixels=pixels))
+    queue.submit(image_io.SaveJob(key=2, name="missing", filepath=str(Path(directory) / "no" / "x.png"), pixels=pixels))
+    deadline = time.monotonic() + 10.0
+    while queue.active() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    finished = {job.name: job for job in queue.collect_finished()}
+    assert not queue.pending()
+    assert finished["saved"].error is None and finished["saved"].progress == 1.0
+    assert finished["missing"].error
+    assert decode(Path(path).read_bytes())[:4] == (3, 2, 8, 6)
+    assert [entry.name for entry in Path(directory).iterdir()] == ["saved.png"]
+    queue.shutdown()
+
+    # A rewrite keeps the file's channel count, bit depth and ancillary chunks.
+    rgb = str(Path(directory) / "rgb.png")
+    text = (b"tEXt", b"Author\x00UVPS")
+    image_io.write_png(rgb, pixels[:, :, :3], 16, chunks=(text, (b"pHYs", bytes(9))))
+    layout = image_io.read_png_layout(rgb)
+    assert (layout.channels, layout.bit_depth) == (3, 16)
+    assert layout.chunks == (text, (b"pHYs", bytes(9)))
+    assert decode(Path(rgb).read_bytes())[2:4] == (16, 2)
+    assert image_io.read_png_layout(str(Path(directory) / "absent.png")) is None
+    # Palette images cannot be reproduced from pixels and are left to another writer.
+    palette = bytearray(Path(rgb).read_bytes())
+    palette[25] = 3
+    Path(rgb).write_bytes(bytes(palette))
+    assert image_io.read_png_layout(rgb) is None
+
+print("UV_PIXEL_SYNC_IMAGE_IO_TEST_OK")
@@ -43,6 +43,23 @@ padded = pixel_ops.rasterize_uv_selection(
 assert (padded.left, padded.bottom, padded.width, padded.height) == (1, 1, 4, 4)
 assert np.count_nonzero(padded.mask) == 16
 
+# A 1K layer next to a 2K active image halves the usable move resolution.
+assert pixel_ops.shared_pixel_step([(8, 8), (4, 4)], 8, 8) == (2, 2)
+assert pixel_ops.shared_pixel_step([(8, 8)], 8, 8) == (1, 1)
+assert pixel_ops.sizes_nest((2048, 1024), (512, 2048))
+assert not pixel_ops.sizes_nest((2048, 2048), (1000, 1000))
+assert not pixel_ops.sizes_nest((2048, 2048), (2048, 2047))
+half = pixel_ops.rasterize_uv_selection(
+    [[(0.25, 0.25), (0.50, 0.25), (0.50, 0.50), (0.25, 0.50)]],
+    4,
+    4,
+)
+layers = [(selection, 8, 8), (half, 4, 4)]
+assert pixel_ops.clamp_shared_translation(layers, 3, 1, 8, 8) == (4, 0, False)
+assert pixel_ops.clamp_shared_translation(layers, 100, -100, 8, 8) == (4, -2, True)
+assert pixel_ops.clamp_shared_translation([(selection, 8, 8)], 100, -100, 8, 8) == (4, -2, True)
+assert pixel_ops.scale_translation(4, -2, (8, 8), (4, 4)) == (2, -1)
+
 rgb = np.ones((2, 3, 3), dtype=np.float32)
 rgba = pixel_ops.as_rgba(rgb)
 assert rgba.shape == (2, 3, 4)
@@ -55,4 +72,16 @@ except ValueError as error:
 else:
     raise AssertionError("UVs outside the 0-1 tile must fail")
 
+assert pixel_ops.proxy_factor(16384, 8192, 2048) == 8
+assert pixel_ops.proxy_factor(2000, 1000, 2048) == 1
+assert pixel_ops.proxy_factor(3000, 10, 2048) == 2
+
+blocks = np.arange(5 * 3 * 2, dtype=np.float32).reshape((5, 3, 2))
+proxy = pixel_ops.downsample_pixels(blocks, 2)
+assert proxy.shape == (3, 2, 2)
+assert np.allclose(proxy[0, 0], blocks[0:2, 0:2].reshape(-1, 2).mean(axis=0))
+# Partial edge blocks average only the pixels they cover.
+assert np.allclose(proxy[2, 1], blocks[4, 2])
+assert np.array_equal(pixel_ops.downsample_pixels(blocks, 1), blocks)
+
 print("UV_PIXEL_SYNC_PIXEL_OPS_TEST_OK")
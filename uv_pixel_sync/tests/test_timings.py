@@ -0,0 +1,52 @@
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "timings.py"
+spec = importlib.util.spec_from_file_location("uv_pixel_sync_timings_test", MODULE_PATH)
+timings = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = timings
+spec.loader.exec_module(timings)
+
+
+timer = timings.PhaseTimer("Albedo")
+with timer.phase("read_image"):
+    time.sleep(0.002)
+with timer.phase("read_image"):
+    pass
+try:
+    with timer.phase("rasterize"):
+        raise ValueError("boom")
+except ValueError:
+    pass
+timer.add_step(0.001)
+timer.add_step(0.003)
+
+summary = timer.summary()
+assert summary["label"] == "Albedo"
+assert set(summary["phases_ms"]) == {"read_image", "rasterize"}
+assert summary["phases_ms"]["read_image"] >= 2.0
+assert summary["steps"] == {"count": 2, "total_ms": 4.0, "mean_ms": 2.0, "max_ms": 3.0, "last_ms": 3.0}
+lines = timings.format_summary(summary)
+assert lines[0].startswith("read_image:")
+assert lines[-1].startswith("drag steps: 2")
+
+# A worker's timer is merged into the session timer once the worker is done.
+worker = timings.PhaseTimer()
+with worker.phase("rasterize"):
+    pass
+worker.add_step(0.002)
+timer.merge(worker)
+assert timer.phases["rasterize"] >= summary["phases_ms"]["rasterize"] / 1000.0
+assert timer.steps == [0.001, 0.003, 0.002]
+
+history = timings.TimingHistory(maxlen=2)
+for label in ("a", "b", "c"):
+    history.add(timings.PhaseTimer(label))
+assert len(history) == 2 and history.latest().label == "c"
+assert [entry["label"] for entry in json.loads(history.to_json())["sessions"]] == ["b", "c"]
+
+print("UV_PIXEL_SYNC_TIMINGS_TEST_OK")
@@ -0,0 +1,69 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+PACKAGE = Path(__file__).resolve().parents[1]
+
+
+def load(name):
+    spec = importlib.util.spec_from_file_location(f"uv_pixel_sync_{name}_test", PACKAGE / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+uv_islands = load("uv_islands")
+pixel_ops = load("pixel_ops")
+
+
+def grid(columns, rows, skip=(), offset=(0.0, 0.0), size=0.125):
+    """Quads of a columns x rows grid; returns face sizes, loop vertices and loop UVs."""
+    sizes, vertices, uvs = [], [], []
+    for row in range(rows):
+        for column in range(columns):
+            if (column, row) in skip:
+                continue
+            corners = ((column, row), (column + 1, row), (column + 1, row + 1), (column, row + 1))
+            sizes.append(4)
+            for x, y in corners:
+                vertices.append(y * (columns + 1) + x)
+                uvs.append((offset[0] + x * size, offset[1] + y * size))
+    return sizes, vertices, uvs
+
+
+# A 3x3 grid with its middle face missing is one island: an outline and a hole.
+sizes, vertices, uvs = grid(3, 3, skip={(1, 1)}, offset=(0.25, 0.25))
+regions = uv_islands.island_regions(sizes, vertices, uvs)
+assert len(regions) == 1
+assert sorted(len(ring) for ring in regions[0]) == [4, 12]
+
+outline = pixel_ops.rasterize_uv_regions(regions, 32, 32)
+per_face = pixel_ops.rasterize_uv_selection(
+    [uvs[start : start + 4] for start in range(0, len(uvs), 4)],
+    32,
+    32,
+)
+assert (outline.left, outline.bottom) == (per_face.left, per_face.bottom)
+assert np.array_equal(outline.mask, per_face.mask)
+assert not outline.mask[4:8, 4:8].any()
+
+# A UV seam splits faces that share mesh vertices into separate islands.
+sizes = [4, 4]
+vertices = [0, 1, 4, 3, 1, 2, 5, 4]
+uvs = [(0.1, 0.1), (0.2, 0.1), (0.2, 0.2), (0.1, 0.2), (0.5, 0.1), (0.6, 0.1), (0.6, 0.2), (0.5, 0.2)]
+assert len(uv_islands.island_regions(sizes, vertices, uvs)) == 2
+uvs[4], uvs[7] = uvs[1], uvs[2]
+regions = uv_islands.island_regions(sizes, vertices, uvs)
+assert len(regions) == 1 and [len(ring) for ring in regions[0]] == [6]
+
+# A flipped face makes even-odd filling ambiguous, so each face is kept.
+sizes = [4, 4]
+vertices = [0, 1, 4, 3, 1, 4, 5, 2]
+uvs = [(0.1, 0.1), (0.2, 0.1), (0.2, 0.2), (0.1, 0.2), (0.2, 0.1), (0.2, 0.2), (0.15, 0.2), (0.15, 0.1)]
+assert len(uv_islands.island_regions(sizes, vertices, uvs)) == 2
+
+print("UV_PIXEL_SYNC_UV_ISLANDS_TEST_OK")
@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: MIT
+"""Lightweight phase timers used by UV Pixel Sync.
+
+This module has no Blender dependency. The add-on only creates a
+``PhaseTimer`` when timing is enabled, so disabled sessions pay nothing.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+
+class PhaseTimer:
+    """Accumulate wall-clock time per named phase and per modal step of one session."""
+
+    def __init__(self, label: str = "") -> None:
+        self.label = label
+        self.started = time.time()
+        self.phases: dict[str, float] = {}
+        self.steps: list[float] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def add_step(self, seconds: float) -> None:
+        self.steps.append(float(seconds))
+
+    def merge(self, other: PhaseTimer) -> None:
+        """Add the phases and steps another timer recorded, e.g. on a worker thread."""
+        for name, value in other.phases.items():
+            self.phases[name] = self.phases.get(name, 0.0) + value
+        self.steps.extend(other.steps)
+
+    def summary(self) -> dict[str, Any]:
+        steps = self.steps
+        return {
+            "label": self.label,
+            "started": self.started,
+            "phases_ms": {name: round(value * 1000.0, 3) for name, value in self.phases.items()},
+            "steps": {
+                "count": len(steps),
+                "total_ms": round(sum(steps) * 1000.0, 3),
+                "mean_ms": round(sum(steps) * 1000.0 / len(steps), 3) if steps else 0.0,
+                "max_ms": round(max(steps) * 1000.0, 3) if steps else 0.0,
+                "last_ms": round(steps[-1] * 1000.0, 3) if steps else 0.0,
+            },
+        }
+
+
+class TimingHistory:
+    """Keep the most recent session timers in memory for the UI and bug reports."""
+
+    def __init__(self, maxlen: int = 20) -> None:
+        self._timers: deque[PhaseTimer] = deque(maxlen=maxlen)
+
+    def add(self, timer: PhaseTimer) -> None:
+        self._timers.append(timer)
+
+    def latest(self) -> PhaseTimer | None:
+        return self._timers[-1] if self._timers else None
+
+    def clear(self) -> None:
+        self._timers.clear()
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def to_json(self) -> str:
+        return json.dumps({"sessions": [timer.summary() for timer in self._timers]}, indent=2)
+
+
+def format_summary(summary: dict[str, Any]) -> list[str]:
+    """Return short display lines, slowest phase first."""
+    phases = sorted(summary["phases_ms"].items(), key=lambda item: item[1], reverse=True)
+    lines = [f"{name}: {value:.1f} ms" for name, value in phases]
+    steps = summary["steps"]
+    if steps["count"]:
+        lines.append(
+            f"drag steps: {steps['count']} · avg {steps['mean_ms']:.2f} ms · max {steps['max_ms']:.2f} ms"
+        )
+    return lines
@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: MIT
+"""UV island grouping and outline extraction used by UV Pixel Sync.
+
+This module has no Blender dependency. Selected faces are grouped into UV
+islands, and each island is reduced to its boundary rings (outer outline and
+holes) so rasterization cost follows the island perimeter, not its face count.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+
+# UV corners closer than this are treated as the same connected corner.
+_UV_QUANTUM = 1.0 / (1 << 20)
+_AREA_EPSILON = 1e-12
+
+
+def _row_ids(rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return a dense id per distinct row and the count of each id (faster than np.unique(axis=0))."""
+    order = np.lexsort(rows.T[::-1])
+    ordered = rows[order]
+    starts = np.ones(len(rows), dtype=bool)
+    starts[1:] = np.any(ordered[1:] != ordered[:-1], axis=1)
+    ids = np.empty(len(rows), dtype=np.int64)
+    ids[order] = np.cumsum(starts) - 1
+    counts = np.diff(np.append(np.flatnonzero(starts), len(rows)))
+    return ids, counts
+
+
+def _connected_labels(count: int, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Label connected components with min-label propagation and pointer jumping."""
+    labels = np.arange(count)
+    while True:
+        low = np.minimum(labels[first], labels[second])
+        updated = labels.copy()
+        np.minimum.at(updated, first, low)
+        np.minimum.at(updated, second, low)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def _group_by(values: np.ndarray, keys: np.ndarray, count: int) -> list[np.ndarray]:
+    order = np.argsort(keys, kind="stable")
+    bounds = np.searchsorted(keys[order], np.arange(count + 1))
+    return [values[order[bounds[key] : bounds[key + 1]]] for key in range(count)]
+
+
+def _chain_rings(starts: np.ndarray, ends: np.ndarray) -> list[np.ndarray] | None:
+    """Chain directed boundary edges into closed rings of edge indices, or None if they do not close."""
+    outgoing: dict[int, list[int]] = {}
+    for index, corner in enumerate(starts.tolist()):
+        outgoing.setdefault(corner, []).append(index)
+
+    rings: list[np.ndarray] = []
+    used = np.zeros(len(starts), dtype=bool)
+    for first in range(len(starts)):
+        if used[first]:
+            continue
+        ring = [first]
+        used[first] = True
+        corner = int(ends[first])
+        while corner != int(starts[first]):
+            candidates = outgoing.get(corner)
+            while candidates and used[candidates[-1]]:
+                candidates.pop()
+            if not candidates:
+                return None
+            edge = candidates.pop()
+            used[edge] = True
+            ring.append(edge)
+            corner = int(ends[edge])
+        rings.append(np.asarray(ring))
+    return rings
+
+
+def island_regions(
+    face_sizes: Sequence[int],
+    loop_vertices: Sequence[int],
+    loop_uvs: Sequence[Sequence[float]],
+) -> list[list[np.ndarray]]:
+    """Return one region of UV boundary rings per island of the given faces.
+
+    Faces are given as consecutive loops: ``face_sizes`` holds the loop count
+    of each face, and ``loop_vertices``/``loop_uvs`` hold each loop's mesh
+    vertex and UV. Two faces belong to the same island when they share an
+    edge whose UVs match on both sides. An island whose boundary cannot be
+    filled unambiguously with the even-odd rule (mixed winding, non-manifold
+    edges) falls back to one region per face.
+    """
+    sizes = np.asarray(face_sizes, dtype=np.int64)
+    vertices = np.asarray(loop_vertices, dtype=np.int64)
+    uvs = np.asarray(loop_uvs, dtype=np.float64).reshape(-1, 2)
+    face_count = len(sizes)
+    if face_count == 0:
+        return []
+    if int(sizes.sum()) != len(vertices) or len(vertices) != len(uvs) or np.any(sizes < 3):
+        raise ValueError("Face sizes do not match the loop data")
+
+    face_start = np.cumsum(sizes) - sizes
+    loop_face = np.repeat(np.arange(face_count), sizes)
+    next_loop = np.arange(len(vertices)) + 1
+    face_end = face_start + sizes
+    wrap = next_loop == face_end[loop_face]
+    next_loop[wrap] = face_start[loop_face[wrap]]
+
+    quantized = np.rint(uvs / _UV_QUANTUM).astype(np.int64)
+    corner_keys = np.column_stack((vertices, quantized))
+    corners, _ = _row_ids(corner_keys)
+
+    edge_start = corners
+    edge_end = corners[next_loop]
+    undirected = np.column_stack((np.minimum(edge_start, edge_end), np.maximum(edge_start, edge_end)))
+    edge_ids, edge_counts = _row_ids(undirected)
+    loop_edge_count = edge_counts[edge_ids]
+
+    # Faces sharing an edge with matching UVs are connected.
+    shared = np.flatnonzero(loop_edge_count == 2)
+    order = shared[np.argsort(edge_ids[shared], kind="stable")]
+    labels = _connected_labels(face_count, loop_face[order[0::2]], loop_face[order[1::2]])
+    islands, island_of_face = np.unique(labels, return_inverse=True)
+
+    # Islands with flipped faces or non-manifold edges are not safe to fill as an outline.
+    cross = uvs[:, 0] * uvs[next_loop, 1] - uvs[next_loop, 0] * uvs[:, 1]
+    area = np.add.reduceat(cross, face_start) * 0.5
+    unsafe = np.zeros(len(islands), dtype=bool)
+    positive = np.zeros(len(islands), dtype=bool)
+    negative = np.zeros(len(islands), dtype=bool)
+    positive[island_of_face[area > _AREA_EPSILON]] = True
+    negative[island_of_face[area < -_AREA_EPSILON]] = True
+    unsafe |= positive & negative
+    unsafe[island_of_face[loop_face[loop_edge_count > 2]]] = True
+
+    boundary = np.flatnonzero(loop_edge_count == 1)
+    boundary_groups = _group_by(boundary, island_of_face[loop_face[boundary]], len(islands))
+    face_groups = _group_by(np.arange(face_count), island_of_face, len(islands))
+
+    regions: list[list[np.ndarray]] = []
+    for island in range(len(islands)):
+        loops = boundary_groups[island]
+        rings = None
+        if not unsafe[island] and len(loops):
+            rings = _chain_rings(edge_start[loops], edge_end[loops])
+        if rings is None:
+            for face in face_groups[island]:
+                regions.append([uvs[face_start[face] : face_end[face]]])
+            continue
+        regions.append([uvs[loops[ring]] for ring in rings])
+    return regions